@@ -0,0 +1,130 @@
+"""
+Parity check and throughput benchmark for the vectorized BM25 encoder.
+
+First verifies that ``BatchBM25Encoder`` reproduces the loaded encoder's
+``encode_documents`` / ``encode_queries`` output (same indices in the same
+order, values within 1e-9) on a synthetic support-email corpus and exits
+non-zero on any mismatch. It then reports documents per second for both
+encoders and the average sparse payload size with top-N pruning.
+
+Run from the project root (the BM25 encoder files must be present):
+
+    python -m system.benchmarks.bm25_batch_encoder_benchmark --documents 2000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import numpy as np
+
+from system.src.app.services.bm25_batch_encoder import BatchBM25Encoder
+from system.src.app.services.bm25_encoder import bm25_encoder_holder
+
+WORDS = (
+    "refund invoice charged twice annual plan subscription cancel account "
+    "login password reset billing card payment dashboard export data team "
+    "workspace invite member error deploy build failed domain custom ssl "
+    "certificate integration webhook api key limit upgrade downgrade trial "
+    "credits usage project delete restore backup support urgent please help"
+).split()
+
+
+def make_corpus(size: int, seed: int = 7) -> list:
+    rng = random.Random(seed)
+    return [
+        f"Subject: {' '.join(rng.choices(WORDS, k=rng.randint(3, 8)))}\n"
+        + " ".join(rng.choices(WORDS, k=rng.randint(20, 160)))
+        for _ in range(size)
+    ]
+
+
+def check_parity(expected: list, actual: list, label: str) -> int:
+    mismatches = 0
+    for position, (left, right) in enumerate(zip(expected, actual)):
+        if list(left["indices"]) != list(right["indices"]) or not np.allclose(
+            left["values"], right["values"], rtol=0, atol=1e-9
+        ):
+            mismatches += 1
+            if mismatches <= 3:
+                print(f"{label} mismatch at {position}")
+    print(f"{label} parity: {len(expected) - mismatches}/{len(expected)} match")
+    return mismatches
+
+
+def throughput(encode, texts: list, batch_size: int) -> float:
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        encode(texts[i : i + batch_size])
+    return len(texts) / (time.perf_counter() - start)
+
+
+def payload_bytes(vectors: list) -> float:
+    return sum(len(json.dumps(v)) for v in vectors) / len(vectors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=80)
+    parser.add_argument("--top-n", type=int, nargs="*", default=[32, 64])
+    args = parser.parse_args()
+
+    reference = bm25_encoder_holder.get()
+    batch_encoder = BatchBM25Encoder.from_encoder(reference)
+    texts = make_corpus(args.documents)
+
+    mismatches = check_parity(
+        reference.encode_documents(texts),
+        batch_encoder.encode_documents(texts),
+        "documents",
+    )
+    if hasattr(reference, "encode_queries"):
+        queries = [text.split("\n")[0] for text in texts[:500]]
+        mismatches += check_parity(
+            reference.encode_queries(queries),
+            batch_encoder.encode_queries(queries),
+            "queries",
+        )
+    if mismatches:
+        sys.exit(1)
+
+    reference_rate = throughput(
+        reference.encode_documents, texts, args.batch_size
+    )
+    batch_rate = throughput(
+        batch_encoder.encode_documents, texts, args.batch_size
+    )
+    print(
+        f"throughput (batch={args.batch_size}): reference "
+        f"{reference_rate:,.0f} docs/s, vectorized {batch_rate:,.0f} docs/s "
+        f"({batch_rate / reference_rate:.2f}x)"
+    )
+
+    full = batch_encoder.encode_documents(texts)
+    print(
+        f"payload: all terms avg {np.mean([len(v['indices']) for v in full]):.1f} "
+        f"terms, {payload_bytes(full):,.0f} bytes/vector"
+    )
+    for top_n in args.top_n:
+        pruned = batch_encoder.encode_documents(texts, top_n=top_n)
+        print(
+            f"payload: top {top_n:<4} avg "
+            f"{np.mean([len(v['indices']) for v in pruned]):.1f} terms, "
+            f"{payload_bytes(pruned):,.0f} bytes/vector"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+BM25 encoder loading benchmark.
+
+Measures, in a fresh interpreter per run, how long importing the embedding
+service takes now that the encoder is loaded lazily, how long the first
+load takes from the legacy pickle versus the compact memory-mapped format,
+and how much resident (and private, i.e. not shareable between workers)
+memory each format adds to the process.
+
+Run from the project root (``bm25_encoder.pkl`` must be present; the
+compact copy is written next to it if missing):
+
+    python -m system.benchmarks.bm25_loading_benchmark --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+from system.src.app.config.settings import settings
+from system.src.app.services.bm25_encoder import (
+    PARAMS_FILE,
+    convert_pickle_to_compact,
+)
+
+PROBE = r"""
+import json, time
+
+def memory_kb():
+    values = {}
+    for path in ("/proc/self/status", "/proc/self/smaps_rollup"):
+        try:
+            with open(path) as f:
+                for line in f:
+                    key, _, rest = line.partition(":")
+                    if key in ("VmRSS", "Private_Clean", "Private_Dirty"):
+                        values[key] = int(rest.split()[0])
+        except OSError:
+            pass
+    return {
+        "rss": values.get("VmRSS", 0),
+        "private": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    }
+
+start = time.perf_counter()
+from system.src.app.services.bm25_encoder import bm25_encoder_holder
+import system.src.app.services.embedding_service
+import_seconds = time.perf_counter() - start
+
+before = memory_kb()
+start = time.perf_counter()
+encoder = bm25_encoder_holder.get()
+encoder.encode_documents(["Subject: refund\nHow do I get a refund for my plan?"])
+load_seconds = time.perf_counter() - start
+after = memory_kb()
+
+print(json.dumps({
+    "source": bm25_encoder_holder.source,
+    "import_seconds": import_seconds,
+    "load_seconds": load_seconds,
+    "rss_delta_kb": after["rss"] - before["rss"],
+    "private_delta_kb": after["private"] - before["private"],
+}))
+"""
+
+
+def run_probe(compact_dir: str) -> dict:
+    env = dict(os.environ, BM25_COMPACT_ENCODER_DIR=compact_dir)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def summarize(label: str, runs: list):
+    def median(key):
+        return statistics.median(run[key] for run in runs)
+
+    print(
+        f"{label:<8} source={runs[0]['source']:<8} "
+        f"import={median('import_seconds') * 1000:8.1f} ms  "
+        f"first load={median('load_seconds') * 1000:8.1f} ms  "
+        f"rss +{median('rss_delta_kb') / 1024:7.1f} MiB  "
+        f"private +{median('private_delta_kb') / 1024:7.1f} MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    compact_dir = settings.BM25_COMPACT_ENCODER_DIR
+    if not os.path.exists(os.path.join(compact_dir, PARAMS_FILE)):
+        print(convert_pickle_to_compact(settings.BM25_ENCODER_PATH, compact_dir))
+
+    missing_dir = os.path.join(compact_dir, "__missing__")
+    summarize("pickle", [run_probe(missing_dir) for _ in range(args.runs)])
+    summarize("compact", [run_probe(compact_dir) for _ in range(args.runs)])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""
+Category namespace benchmark.
+
+Compares a category-filtered hybrid search over the ``default`` namespace
+(``categories $in`` metadata filter) against the category namespace
+layout, which queries only the namespaces of the requested categories
+without a filter and merges the matches by score. Both run against an
+in-process LocalVectorStore filled with synthetic templates, so the
+numbers show the scan work saved, not Pinecone network latency; on
+Pinecone the per-namespace queries also run concurrently. Both paths
+must return the same matches. No network access is needed.
+
+    python -m system.benchmarks.category_namespace_benchmark --templates 10000 100000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import numpy as np
+
+from system.src.app.services.category_namespaces import (
+    CategoryNamespaceLayout,
+)
+from system.src.app.services.local_vector_store import LocalVectorStore
+
+CATEGORIES = [f"topic {i}" for i in range(20)]
+BATCH = 5000
+
+
+async def fill(
+    store: LocalVectorStore,
+    layout: CategoryNamespaceLayout,
+    count: int,
+    dimension: int,
+    rng: np.random.Generator,
+):
+    for start in range(0, count, BATCH):
+        size = min(BATCH, count - start)
+        dense = rng.standard_normal((size, dimension)).astype(np.float32)
+        vectors = [
+            {
+                "id": f"template-{start + i}",
+                "values": dense[i],
+                "sparse_values": {
+                    "indices": rng.choice(50_000, size=30, replace=False),
+                    "values": rng.random(30, dtype=np.float32),
+                },
+                "metadata": {
+                    "categories": rng.choice(
+                        CATEGORIES, size=2, replace=False
+                    ).tolist(),
+                },
+            }
+            for i in range(size)
+        ]
+        await store.upsert(vectors)
+        for namespace, namespace_vectors in layout.split(vectors).items():
+            await store.upsert(namespace_vectors, namespace)
+
+
+async def filtered_scan(store, dense, sparse, categories, top_k):
+    return await store.query(
+        dense,
+        sparse,
+        top_k=top_k,
+        filter_dict={"categories": {"$in": categories}},
+    )
+
+
+async def fan_out(store, layout, dense, sparse, categories, top_k):
+    responses = await asyncio.gather(
+        *[
+            store.query(dense, sparse, top_k=top_k, namespace=namespace)
+            for namespace in layout.namespaces_for(categories)
+        ]
+    )
+    return layout.merge(list(responses), top_k)
+
+
+async def measure(count: int, dimension: int, queries: int, top_k: int):
+    rng = np.random.default_rng(7)
+    layout = CategoryNamespaceLayout(
+        enabled=True, index_name="benchmark", prefix="category-"
+    )
+    store = LocalVectorStore("benchmark", persist_on_write=False)
+    await fill(store, layout, count, dimension, rng)
+
+    # Build the lazy filter and sparse indexes of every namespace
+    warm_up = {"indices": [0], "values": [1.0]}
+    for namespace in store.namespaces:
+        await store.query(np.zeros(dimension), warm_up, namespace=namespace)
+    await filtered_scan(store, np.zeros(dimension), warm_up, CATEGORIES, top_k)
+
+    filtered_ms, fan_out_ms = [], []
+    for i in range(queries):
+        dense = rng.standard_normal(dimension).astype(np.float32)
+        sparse = {
+            "indices": rng.choice(50_000, size=12, replace=False),
+            "values": rng.random(12, dtype=np.float32),
+        }
+        categories = rng.choice(
+            CATEGORIES, size=1 + i % 2, replace=False
+        ).tolist()
+
+        start = time.perf_counter()
+        expected = await filtered_scan(store, dense, sparse, categories, top_k)
+        middle = time.perf_counter()
+        merged = await fan_out(store, layout, dense, sparse, categories, top_k)
+        end = time.perf_counter()
+
+        assert [m["id"] for m in merged["matches"]] == [
+            m["id"] for m in expected["matches"]
+        ], (categories, merged, expected)
+        filtered_ms.append((middle - start) * 1000)
+        fan_out_ms.append((end - middle) * 1000)
+
+    return {
+        "filtered_p50": statistics.median(filtered_ms),
+        "fan_out_p50": statistics.median(fan_out_ms),
+        "namespaces": len(store.namespaces) - 1,
+    }
+
+
+async def main(templates: list, dimension: int, queries: int, top_k: int):
+    print(
+        f"{len(CATEGORIES)} categories, 2 per template, 1-2 per query, "
+        f"dimension {dimension}, top_k {top_k}"
+    )
+    for count in templates:
+        report = await measure(count, dimension, queries, top_k)
+        print(
+            f"{count:>7} templates: filtered scan p50 "
+            f"{report['filtered_p50']:7.2f} ms  fan-out over "
+            f"{report['namespaces']} namespaces p50 "
+            f"{report['fan_out_p50']:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--templates", type=int, nargs="+", default=[10_000, 100_000]
+    )
+    parser.add_argument("--dimension", type=int, default=256)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.templates, args.dimension, args.queries, args.top_k))
@@ -0,0 +1,108 @@
+"""
+Dependency-resolution benchmark for /generate-drafts.
+
+Compares the cost FastAPI pays per request to resolve the draft generation
+object graph when it is built per request through ``Depends`` chains versus
+when it is served from the app-scoped providers built once at startup.
+Nothing is called on the resolved usecase and no upstream is contacted.
+
+Run from the project root (``bm25_encoder.pkl`` must be present):
+
+    python -m system.benchmarks.dependency_resolution_benchmark --requests 500
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from system.src.app.config.database import mongodb_database
+from system.src.app.config.http_client import http_client_registry
+from system.src.app.config.providers import app_providers
+from system.src.app.usecases.generate_drafts_usecases.draft_generation_orchestration_usecase import (
+    DraftGenerationOrchestrationUsecase,
+)
+
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/baseline")
+    async def baseline():
+        return {"ok": True}
+
+    @app.get("/per-request")
+    async def per_request(
+        usecase: DraftGenerationOrchestrationUsecase = Depends(
+            DraftGenerationOrchestrationUsecase
+        ),
+    ):
+        return {"ok": True}
+
+    @app.get("/app-scoped")
+    async def app_scoped(
+        usecase: DraftGenerationOrchestrationUsecase = Depends(
+            app_providers.get_draft_generation_orchestration_usecase
+        ),
+    ):
+        return {"ok": True}
+
+    return app
+
+
+async def time_route(client: httpx.AsyncClient, path: str, requests: int):
+    durations = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+async def run(requests: int, warmup: int):
+    mongodb_database.connect()
+    http_client_registry.connect()
+    app_providers.build()
+
+    transport = httpx.ASGITransport(app=build_app())
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        results = {}
+        for path in ("/baseline", "/per-request", "/app-scoped"):
+            await time_route(client, path, warmup)
+            results[path] = await time_route(client, path, requests)
+
+    await http_client_registry.disconnect()
+    mongodb_database.disconnect()
+
+    baseline = statistics.mean(results["/baseline"])
+    print(f"requests per route: {requests}")
+    print(f"{'route':<14}{'mean ms':>10}{'p95 ms':>10}{'resolve ms':>12}")
+    for path, durations in results.items():
+        mean = statistics.mean(durations)
+        p95 = sorted(durations)[int(len(durations) * 0.95) - 1]
+        print(
+            f"{path:<14}{mean:>10.3f}{p95:>10.3f}{mean - baseline:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--warmup", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.warmup))
@@ -0,0 +1,216 @@
+"""
+Integrated-inference retrieval benchmark.
+
+Compares the current three-hop retrieval path (hosted ``/embed``, hybrid
+``/query``, Voyage ``/rerank``) against a single integrated ``search``
+request that embeds the query text and reranks server-side. Both paths run
+through the real ``QueryDocsUsecase`` against a local mock server that adds
+a fixed latency per hop and counts the round trips each search makes.
+Caches, embedding coalescing and adaptive rerank skipping are disabled; the
+local BM25 sparse encoding still runs on the three-hop path.
+
+Run from the project root (``bm25_encoder.pkl`` must be present):
+
+    python -m system.benchmarks.integrated_inference_benchmark --requests 50
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import time
+from collections import Counter
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+PORT = _free_port()
+MOCK = f"127.0.0.1:{PORT}"
+DATASET_INDEX = "benchmark-dataset"
+INTEGRATED_INDEX = "benchmark-integrated"
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+os.environ.update(
+    {
+        "PINECONE_EMBED_URL": f"http://{MOCK}/embed",
+        "PINECONE_QUERY_URL": "http://{}/query",
+        "PINECONE_SEARCH_RECORDS_URL": "http://{}/records/namespaces/{}/search",
+        "PINECONE_DESCRIBE_INDEX_URL": f"http://{MOCK}/indexes/{{}}",
+        "VOYAGEAI_BASE_URL": f"http://{MOCK}/v1",
+        "PINECONE_INTEGRATED_INFERENCE_INDEXES": f'["{INTEGRATED_INDEX}"]',
+        "RETRIEVAL_CACHE_ENABLED": "false",
+        "RERANK_CACHE_ENABLED": "false",
+        "EMBEDDING_COALESCE_ENABLED": "false",
+        "ADAPTIVE_RERANK_ENABLED": "false",
+    }
+)
+
+import uvicorn
+from fastapi import FastAPI, Request
+
+from system.src.app.config.database import mongodb_database
+from system.src.app.config.http_client import http_client_registry
+from system.src.app.config.providers import app_providers
+
+round_trips: Counter = Counter()
+
+
+def build_mock(hop_latency: float, candidates: int) -> FastAPI:
+    app = FastAPI()
+    fields = {
+        "content": "How do I reset my password?",
+        "response": "Use the reset link.",
+        "categories": ["account"],
+        "from": "user@example.com",
+        "subject": "Password",
+    }
+
+    async def hop(name: str):
+        round_trips[name] += 1
+        await asyncio.sleep(hop_latency)
+
+    @app.get("/indexes/{index_name}")
+    async def describe_index(index_name: str):
+        await hop("describe_index")
+        return {"name": index_name, "host": MOCK}
+
+    @app.post("/embed")
+    async def embed(request: Request):
+        await hop("embed")
+        body = await request.json()
+        return {
+            "data": [{"values": [0.01] * 1024} for _ in body["inputs"]],
+            "usage": {"total_tokens": 8},
+        }
+
+    @app.post("/query")
+    async def query(request: Request):
+        await hop("query")
+        body = await request.json()
+        return {
+            "matches": [
+                {"id": str(i), "score": 0.9 - i * 0.01, "metadata": fields}
+                for i in range(min(body["topK"], candidates))
+            ],
+            "usage": {"readUnits": 1},
+        }
+
+    @app.post("/v1/rerank")
+    async def rerank(request: Request):
+        await hop("rerank")
+        body = await request.json()
+        return {
+            "data": [
+                {"index": i, "relevance_score": 0.8 - i * 0.01}
+                for i in range(min(body["top_k"], len(body["documents"])))
+            ],
+            "usage": {"total_tokens": 64},
+        }
+
+    @app.post("/records/namespaces/{namespace}/search")
+    async def search_records(namespace: str, request: Request):
+        await hop("search")
+        body = await request.json()
+        top_n = body.get("rerank", {}).get("top_n", body["query"]["top_k"])
+        return {
+            "result": {
+                "hits": [
+                    {"_id": str(i), "_score": 0.8 - i * 0.01, "fields": fields}
+                    for i in range(min(top_n, candidates))
+                ]
+            },
+            "usage": {"read_units": 1, "embed_total_tokens": 8},
+        }
+
+    return app
+
+
+async def measure(label: str, index_name: str, requests: int) -> dict:
+    usecase = app_providers.query_docs_usecase
+    # First search resolves and caches the index host
+    await usecase.query_docs("warm up", index_name)
+    round_trips.clear()
+
+    latencies = []
+    for i in range(requests):
+        start = time.perf_counter()
+        results = await usecase.query_docs(
+            f"How do I reset my password? #{i}", index_name, top_k=20, top_n=5
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+        assert len(results) == 5, results
+
+    return {
+        "path": label,
+        "round_trips_per_search": sum(round_trips.values()) / requests,
+        "hops": dict(round_trips),
+        "mean_ms": statistics.mean(latencies),
+        "p95_ms": sorted(latencies)[int(len(latencies) * 0.95) - 1],
+    }
+
+
+async def main(requests: int, hop_latency: float, candidates: int):
+    server = uvicorn.Server(
+        uvicorn.Config(
+            build_mock(hop_latency, candidates),
+            host="127.0.0.1",
+            port=PORT,
+            log_level="warning",
+        )
+    )
+    serve = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    # Motor connects lazily; only error logging would touch MongoDB
+    mongodb_database.connect()
+    app_providers.build()
+    try:
+        reports = [
+            await measure("three-hop", DATASET_INDEX, requests),
+            await measure("integrated", INTEGRATED_INDEX, requests),
+        ]
+    finally:
+        await http_client_registry.disconnect()
+        mongodb_database.disconnect()
+        server.should_exit = True
+        await serve
+
+    print(
+        f"{requests} searches, {hop_latency * 1000:.0f} ms per hop, "
+        f"{candidates} candidates"
+    )
+    for report in reports:
+        print(
+            f"{report['path']:>10}: "
+            f"{report['round_trips_per_search']:.1f} round trips/search "
+            f"{report['hops']}  "
+            f"mean {report['mean_ms']:.1f} ms  p95 {report['p95_ms']:.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument(
+        "--hop-latency-ms",
+        type=float,
+        default=20.0,
+        help="Simulated latency added to every mock upstream request",
+    )
+    parser.add_argument("--candidates", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(
+        main(args.requests, args.hop_latency_ms / 1000, args.candidates)
+    )
@@ -0,0 +1,184 @@
+"""
+Local vector store benchmark.
+
+Fills a LocalVectorStore with synthetic dataset-sized data (dense vectors,
+BM25-like sparse vectors and category metadata), persists it, reloads it
+memory-mapped and measures hybrid query latency with and without a
+``categories $in`` filter. Results are checked against a plain numpy
+computation of the same hybrid scores. No network access is needed.
+
+    python -m system.benchmarks.local_vector_store_benchmark --vectors 5000
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import numpy as np
+
+from system.src.app.services.local_vector_store import LocalVectorStore
+
+CATEGORIES = [f"category-{i}" for i in range(20)]
+
+
+def build_vectors(count: int, dimension: int, rng: np.random.Generator):
+    dense = rng.standard_normal((count, dimension)).astype(np.float32)
+    vectors = []
+    for i in range(count):
+        terms = rng.choice(50_000, size=30, replace=False)
+        vectors.append(
+            {
+                "id": f"vec-{i}",
+                "values": dense[i].tolist(),
+                "sparse_values": {
+                    "indices": terms.tolist(),
+                    "values": rng.random(30).tolist(),
+                },
+                "metadata": {
+                    "content": f"example {i}",
+                    "categories": rng.choice(
+                        CATEGORIES, size=2, replace=False
+                    ).tolist(),
+                },
+            }
+        )
+    return vectors
+
+
+def reference_ids(vectors, dense, sparse, alpha, categories, top_k):
+    wanted = set(categories or [])
+    scored = []
+    for vector in vectors:
+        if wanted and not wanted.intersection(vector["metadata"]["categories"]):
+            continue
+        weights = dict(
+            zip(
+                vector["sparse_values"]["indices"],
+                vector["sparse_values"]["values"],
+            )
+        )
+        sparse_score = sum(
+            weights.get(term, 0.0) * value
+            for term, value in zip(sparse["indices"], sparse["values"])
+        )
+        dense_score = float(np.dot(vector["values"], dense))
+        scored.append(
+            (alpha * dense_score + (1 - alpha) * sparse_score, vector["id"])
+        )
+    return [vector_id for _, vector_id in sorted(scored, reverse=True)[:top_k]]
+
+
+def measure(store, queries, categories, top_k, alpha):
+    latencies = []
+    for dense, sparse in queries:
+        start = time.perf_counter()
+        store.query_sync(
+            dense,
+            sparse,
+            top_k=top_k,
+            alpha=alpha,
+            filter_dict=(
+                {"categories": {"$in": categories}} if categories else None
+            ),
+        )
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+    return statistics.median(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+async def main(count: int, dimension: int, queries: int, top_k: int):
+    rng = np.random.default_rng(7)
+    vectors = build_vectors(count, dimension, rng)
+    query_set = [
+        (
+            rng.standard_normal(dimension).astype(np.float32).tolist(),
+            {
+                "indices": rng.choice(50_000, size=8, replace=False).tolist(),
+                "values": rng.random(8).tolist(),
+            },
+        )
+        for _ in range(queries)
+    ]
+    alpha = 0.8
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        directory = os.path.join(tmp_dir, "dataset")
+        store = LocalVectorStore(
+            "dataset", directory=directory, persist_on_write=False
+        )
+        start = time.perf_counter()
+        await store.upsert(vectors)
+        upsert_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store.persist()
+        persist_seconds = time.perf_counter() - start
+
+        loaded = LocalVectorStore("dataset", directory=directory)
+        start = time.perf_counter()
+        loaded.load(mmap=True)
+        load_seconds = time.perf_counter() - start
+
+        # First query builds the inverted and metadata indexes
+        start = time.perf_counter()
+        loaded.query_sync(*query_set[0], top_k=top_k, alpha=alpha)
+        first_query_ms = (time.perf_counter() - start) * 1000
+
+        mismatches = 0
+        for dense, sparse in query_set[:5]:
+            for categories in (None, CATEGORIES[:3]):
+                got = [
+                    match["id"]
+                    for match in loaded.query_sync(
+                        dense,
+                        sparse,
+                        top_k=top_k,
+                        alpha=alpha,
+                        filter_dict=(
+                            {"categories": {"$in": categories}}
+                            if categories
+                            else None
+                        ),
+                    )["matches"]
+                ]
+                expected = reference_ids(
+                    vectors, dense, sparse, alpha, categories, top_k
+                )
+                mismatches += got != expected
+
+        unfiltered = measure(loaded, query_set, None, top_k, alpha)
+        filtered = measure(loaded, query_set, CATEGORIES[:3], top_k, alpha)
+
+    print(f"{count} vectors x {dimension} dims, {queries} queries, top_k={top_k}")
+    print(f"upsert {upsert_seconds:.2f}s  persist {persist_seconds:.2f}s  "
+          f"mmap load {load_seconds * 1000:.1f} ms  "
+          f"first query {first_query_ms:.1f} ms")
+    print(f"hybrid query            p50 {unfiltered[0]:.3f} ms  "
+          f"p95 {unfiltered[1]:.3f} ms")
+    print(f"hybrid query + $in      p50 {filtered[0]:.3f} ms  "
+          f"p95 {filtered[1]:.3f} ms")
+    print(f"reference mismatches: {mismatches}")
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vectors", type=int, default=5000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--top-k", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.vectors, args.dimension, args.queries, args.top_k))
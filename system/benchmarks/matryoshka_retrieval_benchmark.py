@@ -0,0 +1,185 @@
+"""
+Matryoshka two-stage retrieval benchmark.
+
+Measures recall and latency of the two-stage dataset search: a scan of
+truncated, re-normalized low-dimension vectors for ``top_k * multiplier``
+candidates, then exact rescoring of those candidates against the full
+vectors. Recall is measured against an exact full-dimension scan, per
+candidate multiplier. Both stages run on in-process LocalVectorStores, so
+latency shows scan work only; the payload column is the JSON size of the
+dense query vector sent to the index.
+
+Synthetic vectors get Matryoshka-like energy decay across dimensions.
+Real embeddings give more meaningful recall; pass a ``.npy`` file of
+full-dimension document embeddings with ``--embeddings``. Queries are
+noisy copies of random documents. No network access is needed.
+
+    python -m system.benchmarks.matryoshka_retrieval_benchmark --vectors 20000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import numpy as np
+
+from system.src.app.services.local_vector_store import LocalVectorStore
+from system.src.app.services.matryoshka_retrieval import MatryoshkaRetrieval
+
+BATCH = 5000
+
+
+def synthetic_embeddings(count: int, dimension: int, rng) -> np.ndarray:
+    # Leading dimensions carry most of the variance, as in Matryoshka models
+    scale = 1.0 / np.sqrt(1.0 + np.arange(dimension) / 32.0)
+    vectors = rng.standard_normal((count, dimension)).astype(np.float32)
+    vectors *= scale.astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def normalize(vector: np.ndarray) -> np.ndarray:
+    return vector / np.linalg.norm(vector)
+
+
+async def fill(stage: MatryoshkaRetrieval, low_dim_store, embeddings):
+    for start in range(0, len(embeddings), BATCH):
+        await stage.upsert(
+            [
+                {"id": f"template-{start + i}", "values": vector}
+                for i, vector in enumerate(embeddings[start : start + BATCH])
+            ],
+            low_dim_store,
+        )
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, (time.perf_counter() - start) * 1000
+
+
+async def main(
+    vectors: int,
+    dimension: int,
+    low_dimension: int,
+    multipliers: list,
+    queries: int,
+    top_k: int,
+    noise: float,
+    embeddings_path: str,
+):
+    rng = np.random.default_rng(11)
+    if embeddings_path:
+        embeddings = np.load(embeddings_path).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        vectors, dimension = embeddings.shape
+    else:
+        embeddings = synthetic_embeddings(vectors, dimension, rng)
+
+    low_dim_store = LocalVectorStore("benchmark-low", persist_on_write=False)
+    stage = MatryoshkaRetrieval(
+        enabled=True,
+        index_name="benchmark",
+        low_dim_index_name="benchmark-low",
+        dimension=low_dimension,
+        candidate_multiplier=1,
+        full_store=LocalVectorStore("benchmark", persist_on_write=False),
+    )
+    stage.loaded = True
+    await fill(stage, low_dim_store, embeddings)
+
+    full_ms, scan_ms = [], []
+    rescore_ms = {multiplier: [] for multiplier in multipliers}
+    recall = {multiplier: [] for multiplier in multipliers}
+    for _ in range(queries):
+        target = embeddings[rng.integers(vectors)]
+        query = normalize(
+            target + noise * rng.standard_normal(dimension).astype(np.float32)
+        )
+
+        exact, elapsed = timed(
+            stage.full_store.query_sync, query, top_k=top_k, include_metadata=False
+        )
+        full_ms.append(elapsed)
+        expected = {match["id"] for match in exact["matches"]}
+
+        candidates, elapsed = timed(
+            low_dim_store.query_sync,
+            stage.truncate(query),
+            top_k=top_k * max(multipliers),
+            include_metadata=False,
+        )
+        scan_ms.append(elapsed)
+        for multiplier in multipliers:
+            subset = {
+                "matches": candidates["matches"][: top_k * multiplier]
+            }
+            rescored, elapsed = timed(stage.rescore, subset, query, None, 1.0)
+            rescore_ms[multiplier].append(elapsed)
+            found = {match["id"] for match in rescored["matches"][:top_k]}
+            recall[multiplier].append(len(found & expected) / len(expected))
+
+    full_payload = len(json.dumps(query.tolist()))
+    low_payload = len(json.dumps(stage.truncate(query)))
+    print(
+        f"{vectors} vectors, {dimension} -> {low_dimension} dimensions, "
+        f"top_k {top_k}, {queries} queries"
+    )
+    print(
+        f"full scan     recall 1.000  p50 {statistics.median(full_ms):6.2f} ms  "
+        f"query payload {full_payload} bytes, {dimension * 4} bytes/vector"
+    )
+    for multiplier in multipliers:
+        print(
+            f"two-stage x{multiplier:<3} recall {statistics.mean(recall[multiplier]):.3f}  "
+            f"p50 {statistics.median(scan_ms):6.2f} ms scan + "
+            f"{statistics.median(rescore_ms[multiplier]):5.2f} ms rescore  "
+            f"query payload {low_payload} bytes, {low_dimension * 4} bytes/vector"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--vectors", type=int, default=20_000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    parser.add_argument("--low-dimension", type=int, default=384)
+    parser.add_argument(
+        "--multipliers", type=int, nargs="+", default=[1, 2, 4, 8]
+    )
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument(
+        "--noise",
+        type=float,
+        default=0.05,
+        help="Per-dimension noise added to a document to form a query",
+    )
+    parser.add_argument(
+        "--embeddings",
+        default="",
+        help="Optional .npy file of full-dimension document embeddings",
+    )
+    args = parser.parse_args()
+    asyncio.run(
+        main(
+            args.vectors,
+            args.dimension,
+            args.low_dimension,
+            args.multipliers,
+            args.queries,
+            args.top_k,
+            args.noise,
+            args.embeddings,
+        )
+    )
@@ -0,0 +1,96 @@
+"""
+Event-loop stall benchmark for BM25 sparse encoding.
+
+A heartbeat coroutine sleeps for 1 ms in a loop and records how late each
+wake-up is while the loop concurrently encodes query-sized and
+ingestion-sized batches, first inline on the event loop (the previous
+behaviour) and then through the sparse encoding executor.
+
+Run from the project root (the BM25 encoder files must be present):
+
+    python -m system.benchmarks.sparse_encoding_stall_benchmark --batches 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+from system.src.app.services.bm25_encoder import bm25_encoder_holder
+from system.src.app.services.sparse_encoding_executor import (
+    sparse_encoding_executor,
+)
+
+SAMPLE_TEXT = (
+    "Subject: Billing question about my annual plan\n"
+    "Hi team, I was charged twice for the annual subscription this month "
+    "and the second invoice does not show in my dashboard. Could you check "
+    "what happened and refund the duplicate payment to the original card?"
+)
+
+
+async def heartbeat(stop: asyncio.Event, lags: list, interval: float = 0.001):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append(time.perf_counter() - start - interval)
+
+
+async def run(label: str, encode, batch_sizes: list):
+    stop = asyncio.Event()
+    lags = []
+    beat = asyncio.create_task(heartbeat(stop, lags))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    for size in batch_sizes:
+        await encode([SAMPLE_TEXT] * size)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await beat
+    lags.sort()
+    p99 = lags[int(len(lags) * 0.99) - 1] if lags else 0.0
+    print(
+        f"{label:<10} total={elapsed * 1000:8.1f} ms  "
+        f"heartbeat lag p50={statistics.median(lags) * 1000:6.2f} ms  "
+        f"p99={p99 * 1000:6.2f} ms  max={lags[-1] * 1000:6.2f} ms"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--batches", type=int, default=20)
+    parser.add_argument("--ingest-batch-size", type=int, default=80)
+    args = parser.parse_args()
+
+    bm25_encoder_holder.warm_up()
+    # Alternate query-sized and ingestion-sized batches
+    batch_sizes = [1, args.ingest_batch_size] * (args.batches // 2)
+
+    async def inline(texts):
+        return bm25_encoder_holder.get().encode_documents(texts)
+
+    # Start the pools outside the measured run
+    await sparse_encoding_executor.encode_documents([SAMPLE_TEXT])
+    await sparse_encoding_executor.encode_documents(
+        [SAMPLE_TEXT] * args.ingest_batch_size
+    )
+
+    await run("inline", inline, batch_sizes)
+    await run("executor", sparse_encoding_executor.encode_documents, batch_sizes)
+    print(sparse_encoding_executor.stats())
+    sparse_encoding_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
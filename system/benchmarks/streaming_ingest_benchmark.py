@@ -0,0 +1,180 @@
+"""
+Streaming dataset ingestion benchmark.
+
+Compares peak Python memory (tracemalloc) and wall time of ingesting a
+large ``/insert-data`` upload two ways: reading and ``json.loads``-ing the
+whole file before batching, as uploads used to be handled, and streaming
+the ``examples`` array through the bounded batch queue. Embedding and
+upsert are replaced by an in-process step that builds dense vectors of
+the configured dimension and drops them, so the numbers show parsing and
+batching only. No network access is needed. Before measuring, a small
+document with numbers, literals and nested values is streamed at every
+chunk size to check that values split across reads parse correctly.
+
+    python -m system.benchmarks.streaming_ingest_benchmark --examples 50000
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+from system.src.app.config.settings import settings
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper import (
+    DataInsertUsecaseHelper,
+)
+from system.src.app.utils.streaming_json import iter_json_array_items
+
+
+class _OfflineHelper(DataInsertUsecaseHelper):
+    """Ingestion helper whose embed and upsert steps stay in-process"""
+
+    def __init__(self, dimension: int):
+        self.dimension = dimension
+        self.pinecone_service = self
+        self.semaphore = asyncio.Semaphore(
+            settings.PINECONE_MAX_CONCURRENT_REQUESTS
+        )
+
+    def uses_integrated_inference(self, index_name: str) -> bool:
+        return False
+
+    async def ensure_pinecone_index_exists(self):
+        pass
+
+    async def _embed_batch(self, batch):
+        await asyncio.sleep(0)
+        return [
+            {"id": str(i), "values": [0.1] * self.dimension}
+            for i in range(len(batch))
+        ]
+
+    async def _upsert_embeddings(self, chunks):
+        await asyncio.sleep(0)
+        return {"upserted_count": len(chunks)}
+
+
+def write_dataset(path: str, examples: int, response_chars: int):
+    with open(path, "w") as f:
+        f.write('{"categories": ["general", "billing"], "examples": [')
+        for i in range(examples):
+            example = {
+                "subject": f"Subject {i}",
+                "query": f"How do I resolve issue number {i}?",
+                "response": "x" * response_chars,
+                "categories": ["general"],
+                "from": "support",
+            }
+            f.write(("," if i else "") + json.dumps(example))
+        f.write("]}")
+
+
+async def whole_file(helper, path: str):
+    with open(path, "rb") as f:
+        data = json.loads(f.read().decode("utf-8"))
+    return await helper.ingest_examples(data.get("examples", []))
+
+
+async def streamed(helper, path: str):
+    with open(path, "rb") as f:
+
+        async def read(size: int) -> bytes:
+            return f.read(size)
+
+        fields = {}
+        return await helper.ingest_example_stream(
+            iter_json_array_items(
+                read,
+                "examples",
+                fields.__setitem__,
+                chunk_size=settings.INGEST_STREAM_READ_CHUNK_BYTES,
+            )
+        )
+
+
+CHUNK_CHECK_DOCUMENT = (
+    '{"version": -1.25e-3, "examples": [12.5, 3, 1e5, -0.5E+2, true, null, '
+    'false, "caf\\u00e9", {"scores": [1.0, 2e1]}, 123456789], "count": 7}'
+)
+
+
+async def stream_document(document: bytes, chunk_size: int):
+    position = 0
+
+    async def read(size: int) -> bytes:
+        nonlocal position
+        chunk = document[position : position + size]
+        position += len(chunk)
+        return chunk
+
+    fields = {}
+    items = [
+        item
+        async for item in iter_json_array_items(
+            read, "examples", fields.__setitem__, chunk_size=chunk_size
+        )
+    ]
+    return items, fields
+
+
+def check_chunk_boundaries():
+    document = CHUNK_CHECK_DOCUMENT.encode("utf-8")
+    expected = json.loads(document)
+    expected_items = expected.pop("examples")
+    for chunk_size in range(1, len(document) + 2):
+        items, fields = asyncio.run(stream_document(document, chunk_size))
+        if items != expected_items or fields != expected:
+            raise AssertionError(
+                f"streamed parse differs from json.loads at chunk size {chunk_size}"
+            )
+    print(f"chunk boundaries ok for chunk sizes 1-{len(document) + 1}")
+
+
+def measure(label: str, run, helper, path: str):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = asyncio.run(run(helper, path))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:<10} peak {peak / 2**20:8.1f} MiB  {elapsed:6.2f} s  "
+        f"upserted {result['upserted_count']}"
+    )
+
+
+def main(examples: int, response_chars: int, dimension: int):
+    check_chunk_boundaries()
+    helper = _OfflineHelper(dimension)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "dataset.json")
+        write_dataset(path, examples, response_chars)
+        size = os.path.getsize(path)
+        print(
+            f"{examples} examples, {size / 2**20:.1f} MiB file, batch "
+            f"{settings.EMBEDDINGS_BATCH_SIZE}, queue "
+            f"{settings.INGEST_STREAM_QUEUE_BATCHES} batches, "
+            f"{settings.INGEST_STREAM_WORKERS} workers"
+        )
+        measure("whole-file", whole_file, helper, path)
+        measure("streamed", streamed, helper, path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--examples", type=int, default=50_000)
+    parser.add_argument("--response-chars", type=int, default=1000)
+    parser.add_argument("--dimension", type=int, default=1024)
+    args = parser.parse_args()
+    main(args.examples, args.response_chars, args.dimension)
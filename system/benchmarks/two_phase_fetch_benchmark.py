@@ -0,0 +1,139 @@
+"""
+Two-phase fetch benchmark.
+
+Compares the query response a dataset search decodes today (``top_k``
+matches with full metadata) against the two-phase path: an ID-only
+response, trimmed to the matches that can survive reranking, with
+metadata attached from the vector metadata cache. Reports response size
+and the time to decode and format each, using synthetic metadata sized
+like the dataset templates. No network access is needed.
+
+    python -m system.benchmarks.two_phase_fetch_benchmark --top-k 20
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+
+for env_var in (
+    "PINECONE_API_KEY",
+    "OPENAI_API_KEY",
+    "GEMINI_API_KEY",
+    "VOYAGEAI_API_KEY",
+):
+    os.environ.setdefault(env_var, "benchmark")
+
+import httpx
+
+from system.src.app.config.settings import settings
+from system.src.app.services.vector_metadata_cache import VectorMetadataCache
+
+HOST = "dataset-index.svc.pinecone.io"
+
+
+def build_matches(top_k: int, content_chars: int, response_chars: int):
+    return [
+        {
+            "id": f"{i:064x}",
+            "score": 0.9 - i * 0.04,
+            "values": [],
+            "metadata": {
+                "content": "q" * content_chars,
+                "response": "r" * response_chars,
+                "categories": ["account", "billing"],
+                "from": "customer@example.com",
+                "subject": f"Subject line {i}",
+            },
+        }
+        for i in range(top_k)
+    ]
+
+
+def format_matches(matches: list) -> list:
+    return [
+        {
+            "id": match["id"],
+            "score": match["score"],
+            "content": match["metadata"].get("content"),
+            "metadata": {
+                key: value
+                for key, value in match["metadata"].items()
+                if key != "content"
+            },
+        }
+        for match in matches
+    ]
+
+
+def single_phase(body: bytes) -> list:
+    return format_matches(httpx.Response(200, content=body).json()["matches"])
+
+
+def two_phase(body: bytes, cache: VectorMetadataCache) -> list:
+    matches = [
+        match
+        for match in httpx.Response(200, content=body).json()["matches"]
+        if match["score"] > settings.RERANK_MIN_SCORE
+    ]
+    metadata, _ = cache.get_many(
+        HOST, "default", [match["id"] for match in matches]
+    )
+    return format_matches(
+        [{**match, "metadata": metadata[match["id"]]} for match in matches]
+    )
+
+
+def timed(fn, *args, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def main(top_k: int, content_chars: int, response_chars: int, repeats: int):
+    matches = build_matches(top_k, content_chars, response_chars)
+    full_body = json.dumps({"matches": matches, "namespace": "default"}).encode()
+    id_body = json.dumps(
+        {
+            "matches": [
+                {"id": m["id"], "score": m["score"], "values": []}
+                for m in matches
+            ],
+            "namespace": "default",
+        }
+    ).encode()
+
+    cache = VectorMetadataCache(max_entries=10_000)
+    cache.put_many(HOST, "default", matches)
+
+    survivors = len(two_phase(id_body, cache))
+    assert single_phase(full_body)[:survivors] == two_phase(id_body, cache)
+
+    full_us = timed(single_phase, full_body, repeats=repeats)
+    two_phase_us = timed(two_phase, id_body, cache, repeats=repeats)
+    print(
+        f"top_k={top_k}, {survivors} matches above {settings.RERANK_MIN_SCORE}, "
+        f"content {content_chars} chars, response {response_chars} chars"
+    )
+    print(
+        f"single phase: {len(full_body):>8} bytes  "
+        f"decode+format {full_us:8.1f} us"
+    )
+    print(
+        f"two phase:    {len(id_body):>8} bytes  "
+        f"decode+attach+format {two_phase_us:8.1f} us (metadata cached)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--top-k", type=int, default=20)
+    parser.add_argument("--content-chars", type=int, default=800)
+    parser.add_argument("--response-chars", type=int, default=2500)
+    parser.add_argument("--repeats", type=int, default=2000)
+    args = parser.parse_args()
+    main(args.top_k, args.content_chars, args.response_chars, args.repeats)
@@ -21,6 +21,12 @@ class Settings(BaseModel):
     HISTORY_FILE: str = str(PROJECT_ROOT / "session-data" / "history.json")
     POLL_INTERVAL_SECONDS: int = 25
     EXTERNAL_SERVICE_URL: str = "http://localhost:8000/api/v1/generate-drafts"
+    EXTERNAL_SERVICE_CONNECT_TIMEOUT: float = 30.0
+    EXTERNAL_SERVICE_READ_TIMEOUT: float = 1600.0
+    EXTERNAL_SERVICE_WRITE_TIMEOUT: float = 600.0
+    HTTP_MAX_CONNECTIONS: int = 20
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    HTTP_KEEPALIVE_EXPIRY: float = 60.0
 
 
 settings = Settings()
@@ -18,6 +18,7 @@ from system.gmail.services import (
     EmailFetcher,
     EmailProcessor,
     HistoryManager,
+    HttpClientManager,
 )
 
 # Configure logging
@@ -52,7 +53,10 @@ class GmailPollingService:
         self.history_manager = HistoryManager()
         self.email_fetcher = EmailFetcher(self.auth, self.history_manager)
         self.draft_creator = DraftCreator(self.auth)
-        self.email_processor = EmailProcessor(self.draft_creator)
+        self.http_client_manager = HttpClientManager()
+        self.email_processor = EmailProcessor(
+            self.draft_creator, self.http_client_manager
+        )
 
         logger.info("Dependencies configured successfully")
 
@@ -130,6 +134,7 @@ class GmailPollingService:
             )
             await asyncio.gather(*background_tasks, return_exceptions=True)
 
+        await self.http_client_manager.close()
         logger.info("Gmail polling service stopped")
 
 
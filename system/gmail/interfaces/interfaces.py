@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional
 
+import httpx
+
 
 class AuthInterface(ABC):
     """Interface for Gmail authentication"""
@@ -58,3 +60,15 @@ class HistoryManagerInterface(ABC):
     @abstractmethod
     def save_history_id(self, history_id: str):
         """Save history ID"""
+
+
+class HttpClientInterface(ABC):
+    """Interface for providing a shared pooled HTTP client"""
+
+    @abstractmethod
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client"""
+
+    @abstractmethod
+    async def close(self):
+        """Close the shared HTTP client"""
@@ -2,5 +2,12 @@ from .draft_creator import DraftCreator
 from .email_fetcher import EmailFetcher
 from .email_processor import EmailProcessor
 from .history_manager import HistoryManager
+from .http_client_manager import HttpClientManager
 
-__all__ = ["HistoryManager", "EmailFetcher", "DraftCreator", "EmailProcessor"]
+__all__ = [
+    "HistoryManager",
+    "EmailFetcher",
+    "DraftCreator",
+    "EmailProcessor",
+    "HttpClientManager",
+]
@@ -2,12 +2,11 @@ import logging
 import re
 from typing import Dict, Optional
 
-import httpx
-
 from system.gmail.config.settings import settings
 from system.gmail.interfaces.interfaces import (
     DraftCreatorInterface,
     EmailProcessorInterface,
+    HttpClientInterface,
 )
 
 logger = logging.getLogger(__name__)
@@ -16,8 +15,13 @@ logger = logging.getLogger(__name__)
 class EmailProcessor(EmailProcessorInterface):
     """Processes emails and handles business logic"""
 
-    def __init__(self, draft_creator: DraftCreatorInterface):
+    def __init__(
+        self,
+        draft_creator: DraftCreatorInterface,
+        http_client: HttpClientInterface,
+    ):
         self.draft_creator = draft_creator
+        self.http_client = http_client
         self.settings = settings
 
     async def process_email(self, email: Dict) -> Optional[Dict]:
@@ -155,18 +159,14 @@ class EmailProcessor(EmailProcessorInterface):
 
             headers = {"Content-Type": "application/json"}
 
-            async with httpx.AsyncClient(
-                timeout=httpx.Timeout(
-                    connect=30.0, read=1600.0, write=600.0, pool=30.0
-                )
-            ) as client:
-                api_response = await client.post(
-                    self.settings.EXTERNAL_SERVICE_URL,
-                    json=payload,
-                    headers=headers,
-                )
-                api_response.raise_for_status()
-                response_data = api_response.json()
+            client = self.http_client.get_client()
+            api_response = await client.post(
+                self.settings.EXTERNAL_SERVICE_URL,
+                json=payload,
+                headers=headers,
+            )
+            api_response.raise_for_status()
+            response_data = api_response.json()
 
             logger.info(
                 f"Successfully generated draft reply for: {email_data.get('id', 'no id')}"
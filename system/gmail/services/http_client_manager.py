@@ -0,0 +1,42 @@
+import logging
+from typing import Optional
+
+import httpx
+
+from system.gmail.config.settings import settings
+from system.gmail.interfaces.interfaces import HttpClientInterface
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientManager(HttpClientInterface):
+    """Owns one keep-alive HTTP client shared by all background email tasks"""
+
+    def __init__(self):
+        self.client: Optional[httpx.AsyncClient] = None
+
+    def get_client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it on first use"""
+        if self.client is None or self.client.is_closed:
+            self.client = httpx.AsyncClient(
+                timeout=httpx.Timeout(
+                    connect=settings.EXTERNAL_SERVICE_CONNECT_TIMEOUT,
+                    read=settings.EXTERNAL_SERVICE_READ_TIMEOUT,
+                    write=settings.EXTERNAL_SERVICE_WRITE_TIMEOUT,
+                    pool=settings.EXTERNAL_SERVICE_CONNECT_TIMEOUT,
+                ),
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+            logger.info("Shared HTTP client created")
+        return self.client
+
+    async def close(self):
+        """Close the shared client on shutdown"""
+        if self.client is not None and not self.client.is_closed:
+            await self.client.aclose()
+            logger.info("Shared HTTP client closed")
+        self.client = None
@@ -76,6 +76,54 @@ class MongoDB:
                 detail=f"Unable to access request logs collection: {str(e)} \n error while connecting to MongoDB client (from database.py in get_request_logs_collection())",
             )
 
+    def get_embedding_cache_collection(self):
+        try:
+            if not self.mongodb_client:
+                raise HTTPException(
+                    status_code=503,
+                    detail="MongoDB client is not connected. \n error while connecting to MongoDB client (from database.py in get_embedding_cache_collection())",
+                )
+            return self.mongodb_client[settings.MONGODB_DB_NAME][
+                settings.EMBEDDING_CACHE_COLLECTION_NAME
+            ]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unable to access embedding cache collection: {str(e)} \n error while connecting to MongoDB client (from database.py in get_embedding_cache_collection())",
+            )
+
+    def get_reembed_migrations_collection(self):
+        try:
+            if not self.mongodb_client:
+                raise HTTPException(
+                    status_code=503,
+                    detail="MongoDB client is not connected. \n error while connecting to MongoDB client (from database.py in get_reembed_migrations_collection())",
+                )
+            return self.mongodb_client[settings.MONGODB_DB_NAME][
+                settings.REEMBED_MIGRATIONS_COLLECTION_NAME
+            ]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unable to access reembed migrations collection: {str(e)} \n error while connecting to MongoDB client (from database.py in get_reembed_migrations_collection())",
+            )
+
+    def get_ingestion_jobs_collection(self):
+        try:
+            if not self.mongodb_client:
+                raise HTTPException(
+                    status_code=503,
+                    detail="MongoDB client is not connected. \n error while connecting to MongoDB client (from database.py in get_ingestion_jobs_collection())",
+                )
+            return self.mongodb_client[settings.MONGODB_DB_NAME][
+                settings.INGESTION_JOBS_COLLECTION_NAME
+            ]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Unable to access ingestion jobs collection: {str(e)} \n error while connecting to MongoDB client (from database.py in get_ingestion_jobs_collection())",
+            )
+
     def disconnect(self):
         try:
             if self.mongodb_client:
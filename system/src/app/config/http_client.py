@@ -0,0 +1,112 @@
+from typing import Dict
+from urllib.parse import urlparse
+
+import httpx
+
+from system.src.app.config.settings import settings
+from system.src.app.utils.logging_utils import loggers
+
+PINECONE = "pinecone"
+PINECONE_INDEX = "pinecone_index"
+VOYAGEAI = "voyageai"
+GEMINI = "gemini"
+DEFAULT = "default"
+
+
+class HttpClientRegistry:
+    """
+    Holds one pooled keep-alive ``httpx.AsyncClient`` per upstream so that
+    requests to Pinecone, Voyage and Gemini reuse TCP/TLS connections instead
+    of paying a fresh handshake on every call.
+    """
+
+    def __init__(self) -> None:
+        self.clients: Dict[str, httpx.AsyncClient] = {}
+        self.upstream_hosts = {
+            urlparse(settings.PINECONE_CREATE_INDEX_URL).hostname: PINECONE,
+            urlparse(settings.PINECONE_EMBED_URL).hostname: PINECONE,
+            urlparse(settings.VOYAGEAI_BASE_URL).hostname: VOYAGEAI,
+            urlparse(settings.GEMINI_BASE_URL).hostname: GEMINI,
+        }
+
+    def _upstream_timeouts(self) -> Dict[str, httpx.Timeout]:
+        def timeout(connect: float, read: float) -> httpx.Timeout:
+            return httpx.Timeout(
+                connect=connect, read=read, write=read, pool=connect
+            )
+
+        return {
+            PINECONE: timeout(
+                settings.PINECONE_CONNECT_TIMEOUT,
+                settings.PINECONE_READ_TIMEOUT,
+            ),
+            PINECONE_INDEX: timeout(
+                settings.PINECONE_INDEX_CONNECT_TIMEOUT,
+                settings.PINECONE_INDEX_READ_TIMEOUT,
+            ),
+            VOYAGEAI: timeout(
+                settings.VOYAGEAI_CONNECT_TIMEOUT,
+                settings.VOYAGEAI_READ_TIMEOUT,
+            ),
+            GEMINI: timeout(
+                settings.GEMINI_CONNECT_TIMEOUT, settings.GEMINI_READ_TIMEOUT
+            ),
+            DEFAULT: timeout(
+                settings.GEMINI_CONNECT_TIMEOUT, settings.GEMINI_READ_TIMEOUT
+            ),
+        }
+
+    def _create_client(self, upstream: str) -> httpx.AsyncClient:
+        timeouts = self._upstream_timeouts()
+        return httpx.AsyncClient(
+            timeout=timeouts.get(upstream, timeouts[DEFAULT]),
+            limits=httpx.Limits(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+            ),
+            verify=settings.HTTP_VERIFY_SSL,
+        )
+
+    def connect(self):
+        for upstream in self._upstream_timeouts():
+            if upstream not in self.clients:
+                self.clients[upstream] = self._create_client(upstream)
+        loggers["main"].info(
+            f"HTTP client pools created for upstreams: {list(self.clients)}"
+        )
+
+    def get_client(self, upstream: str) -> httpx.AsyncClient:
+        """
+        Return the pooled client for an upstream, creating it on first use
+        when the registry was not connected by the application lifespan.
+
+        :param upstream: One of the upstream names defined in this module.
+        :return: Shared ``httpx.AsyncClient`` for that upstream.
+        """
+        client = self.clients.get(upstream)
+        if client is None or client.is_closed:
+            client = self._create_client(upstream)
+            self.clients[upstream] = client
+        return client
+
+    def get_client_for_url(self, url: str) -> httpx.AsyncClient:
+        host = urlparse(url).hostname or ""
+        upstream = self.upstream_hosts.get(host)
+        if upstream is None:
+            upstream = PINECONE_INDEX if host.endswith(".pinecone.io") else DEFAULT
+        return self.get_client(upstream)
+
+    async def disconnect(self):
+        for upstream, client in list(self.clients.items()):
+            try:
+                await client.aclose()
+            except Exception as e:
+                loggers["main"].error(
+                    f"Error closing HTTP client for {upstream}: {str(e)}"
+                )
+        self.clients.clear()
+
+
+# Instantiate the shared HTTP client registry
+http_client_registry = HttpClientRegistry()
@@ -0,0 +1,310 @@
+import asyncio
+
+from fastapi import HTTPException
+
+from system.src.app.config.database import mongodb_database
+from system.src.app.config.http_client import http_client_registry
+from system.src.app.config.settings import settings
+from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.repositories.ingestion_job_repository import (
+    IngestionJobRepository,
+)
+from system.src.app.repositories.llm_usage_repository import LLMUsageRepository
+from system.src.app.repositories.reembed_migration_repository import (
+    ReembedMigrationRepository,
+)
+from system.src.app.repositories.request_log_repository import (
+    RequestLogRepository,
+)
+from system.src.app.services.adaptive_rerank_policy import (
+    adaptive_rerank_policy,
+)
+from system.src.app.services.api_service import ApiService
+from system.src.app.services.bm25_encoder import bm25_encoder_holder
+from system.src.app.services.category_namespaces import (
+    category_namespace_layout,
+)
+from system.src.app.services.dataset_index_replica import (
+    dataset_index_replica,
+)
+from system.src.app.services.embedding_cache import embedding_cache
+from system.src.app.services.embedding_service import EmbeddingService
+from system.src.app.services.gemini_service import GeminiService
+from system.src.app.services.index_metadata_cache import index_metadata_cache
+from system.src.app.services.index_migration_monitor import (
+    index_migration_monitor,
+)
+from system.src.app.services.local_reranker import local_reranker
+from system.src.app.services.matryoshka_retrieval import matryoshka_retrieval
+from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.re_ranking_service import RerankerService
+from system.src.app.services.rerank_score_cache import rerank_score_cache
+from system.src.app.services.semantic_workflow_cache import (
+    semantic_workflow_cache,
+)
+from system.src.app.services.retrieval_result_cache import (
+    retrieval_result_cache,
+)
+from system.src.app.services.sparse_encoding_executor import (
+    sparse_encoding_executor,
+)
+from system.src.app.services.vector_metadata_cache import (
+    vector_metadata_cache,
+)
+from system.src.app.services.vector_store_registry import (
+    vector_store_registry,
+)
+from system.src.app.services.websocket_service import websocket_manager
+from system.src.app.usecases.categorisation_usecase.categorisation_usecase import (
+    CategorizationUsecase,
+)
+from system.src.app.usecases.categorisation_usecase.helper import (
+    CategorizationHelper,
+)
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase import (
+    DataInsertUsecase,
+)
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper import (
+    DataInsertUsecaseHelper,
+)
+from system.src.app.usecases.data_insert_usecases.ingestion_job_usecase import (
+    IngestionJobUsecase,
+)
+from system.src.app.usecases.data_insert_usecases.reembed_migration_usecase import (
+    ReembedMigrationUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.draft_generation_orchestration_usecase import (
+    DraftGenerationOrchestrationUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.generate_drafts_usecase import (
+    GenerateDraftsUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.generate_drafts_usecases_helper import (
+    GenerateDraftsHelper,
+)
+from system.src.app.usecases.generate_drafts_usecases.semantic_cache_usecase import (
+    SemanticCacheUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.request_logging_usecase import (
+    RequestLoggingUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.template_storage_usecase import (
+    TemplateStorageUsecase,
+)
+from system.src.app.usecases.query_docs_usecases.pinecone_query_usecase import (
+    PineconeQueryUseCase,
+)
+from system.src.app.usecases.query_docs_usecases.query_docs_usecase import (
+    QueryDocsUsecase,
+)
+from system.src.app.usecases.query_docs_usecases.retrieval_stage_usecase import (
+    RetrievalStageUsecase,
+)
+
+
+class AppProviders:
+    """
+    Builds the stateless service and usecase graph once at application
+    startup so request handlers resolve ready-made singletons instead of
+    constructing a fresh object graph (and Pinecone SDK clients) per request.
+    """
+
+    def __init__(self) -> None:
+        self.is_built = False
+
+    def build(self):
+        # Repositories
+        self.error_repo = ErrorRepo(
+            collection=mongodb_database.get_error_collection()
+        )
+        self.llm_usage_repository = LLMUsageRepository(
+            collection=mongodb_database.get_llm_usage_collection()
+        )
+        self.request_log_repository = RequestLogRepository()
+        self.reembed_migration_repository = ReembedMigrationRepository(
+            collection=mongodb_database.get_reembed_migrations_collection()
+        )
+        self.ingestion_job_repository = IngestionJobRepository(
+            collection=mongodb_database.get_ingestion_jobs_collection()
+        )
+
+        # Services
+        self.api_service = ApiService(
+            error_repo=self.error_repo, http_clients=http_client_registry
+        )
+        self.embedding_service = EmbeddingService(
+            error_repo=self.error_repo,
+            http_clients=http_client_registry,
+            embedding_cache=embedding_cache,
+            sparse_encoder=sparse_encoding_executor,
+        )
+        self.pinecone_service = PineconeService(
+            error_repo=self.error_repo,
+            http_clients=http_client_registry,
+            index_metadata_cache=index_metadata_cache,
+            retrieval_result_cache=retrieval_result_cache,
+            dataset_replica=dataset_index_replica,
+            vector_metadata_cache=vector_metadata_cache,
+        )
+        self.reranker_service = RerankerService(
+            error_repo=self.error_repo,
+            http_clients=http_client_registry,
+            rerank_score_cache=rerank_score_cache,
+        )
+        self.gemini_service = GeminiService(
+            api_service=self.api_service,
+            llm_usage_repository=self.llm_usage_repository,
+            error_repo=self.error_repo,
+        )
+
+        # Helpers
+        self.categorization_helper = CategorizationHelper()
+        self.generate_drafts_helper = GenerateDraftsHelper()
+        self.data_insert_usecase_helper = DataInsertUsecaseHelper(
+            api_service=self.api_service,
+            embedding_service=self.embedding_service,
+            pinecone_service=self.pinecone_service,
+            error_repo=self.error_repo,
+            vector_stores=vector_store_registry,
+            category_layout=category_namespace_layout,
+            matryoshka=matryoshka_retrieval,
+            migration_monitor=index_migration_monitor,
+            migration_repository=self.reembed_migration_repository,
+        )
+
+        # Usecases
+        self.pinecone_query_usecase = PineconeQueryUseCase(
+            embedding_service=self.embedding_service,
+            pinecone_service=self.pinecone_service,
+            error_repo=self.error_repo,
+            vector_stores=vector_store_registry,
+            category_layout=category_namespace_layout,
+            matryoshka=matryoshka_retrieval,
+            migration_monitor=index_migration_monitor,
+        )
+        self.query_docs_usecase = QueryDocsUsecase(
+            pinecone_query_usecase=self.pinecone_query_usecase,
+            reranker_service=self.reranker_service,
+            retrieval_result_cache=retrieval_result_cache,
+            rerank_policy=adaptive_rerank_policy,
+            local_reranker=local_reranker,
+        )
+        self.retrieval_stage_usecase = RetrievalStageUsecase(
+            pinecone_query_usecase=self.pinecone_query_usecase,
+            query_docs_usecase=self.query_docs_usecase,
+            pinecone_service=self.pinecone_service,
+            retrieval_result_cache=retrieval_result_cache,
+        )
+        self.data_insert_usecase = DataInsertUsecase(
+            data_insert_usecase_helper=self.data_insert_usecase_helper,
+            query_docs_usecase=self.query_docs_usecase,
+            error_repo=self.error_repo,
+        )
+        self.ingestion_job_usecase = IngestionJobUsecase(
+            data_insert_usecase=self.data_insert_usecase,
+            data_insert_usecase_helper=self.data_insert_usecase_helper,
+            job_repository=self.ingestion_job_repository,
+            error_repo=self.error_repo,
+        )
+        self.reembed_migration_usecase = ReembedMigrationUsecase(
+            data_insert_usecase_helper=self.data_insert_usecase_helper,
+            pinecone_service=self.pinecone_service,
+            migration_repository=self.reembed_migration_repository,
+            migration_monitor=index_migration_monitor,
+            error_repo=self.error_repo,
+        )
+        self.template_storage_usecase = TemplateStorageUsecase(
+            data_insert_usecase=self.data_insert_usecase,
+            error_repo=self.error_repo,
+        )
+        self.categorization_usecase = CategorizationUsecase(
+            gemini_service=self.gemini_service,
+            helper=self.categorization_helper,
+            error_repo=self.error_repo,
+        )
+        self.generate_drafts_usecase = GenerateDraftsUsecase(
+            gemini_service=self.gemini_service,
+            helper=self.generate_drafts_helper,
+            error_repo=self.error_repo,
+        )
+        self.request_logging_usecase = RequestLoggingUsecase(
+            request_log_repository=self.request_log_repository,
+            error_repo=self.error_repo,
+        )
+        self.semantic_cache_usecase = SemanticCacheUsecase(
+            embedding_service=self.embedding_service,
+            semantic_workflow_cache=semantic_workflow_cache,
+            retrieval_result_cache=retrieval_result_cache,
+            error_repo=self.error_repo,
+        )
+        self.draft_generation_orchestration_usecase = (
+            DraftGenerationOrchestrationUsecase(
+                generate_drafts_usecase=self.generate_drafts_usecase,
+                query_docs_usecase=self.query_docs_usecase,
+                categorization_usecase=self.categorization_usecase,
+                request_logging_usecase=self.request_logging_usecase,
+                template_storage_usecase=self.template_storage_usecase,
+                websocket_manager=websocket_manager,
+                error_repo=self.error_repo,
+                retrieval_stage_usecase=self.retrieval_stage_usecase,
+                semantic_cache_usecase=self.semantic_cache_usecase,
+            )
+        )
+        self.is_built = True
+
+    async def warm_up(self):
+        """Pre-resolve upstream metadata so the first request skips it"""
+        index_names = [
+            settings.PINECONE_INDEX_NAME,
+            settings.ROCKET_DOCS_PINECONE_INDEX_NAME,
+        ]
+        if matryoshka_retrieval.enabled:
+            index_names.append(matryoshka_retrieval.low_dim_index_name)
+        warm_ups = [
+            self.pinecone_service.warm_index_metadata(
+                [
+                    index_name
+                    for index_name in index_names
+                    if not vector_store_registry.is_local(index_name)
+                ]
+            )
+        ]
+        if settings.BM25_WARM_UP_ON_STARTUP:
+            warm_ups.append(asyncio.to_thread(bm25_encoder_holder.warm_up))
+        warm_ups.append(asyncio.to_thread(vector_store_registry.warm_up))
+        if matryoshka_retrieval.enabled:
+            warm_ups.append(asyncio.to_thread(matryoshka_retrieval.load))
+        await asyncio.gather(*warm_ups)
+
+    def _ensure_built(self):
+        if not self.is_built:
+            raise HTTPException(
+                status_code=503,
+                detail="Application providers are not initialised. \n error while resolving dependencies (from providers.py in _ensure_built())",
+            )
+
+    def get_draft_generation_orchestration_usecase(
+        self,
+    ) -> DraftGenerationOrchestrationUsecase:
+        self._ensure_built()
+        return self.draft_generation_orchestration_usecase
+
+    def get_data_insert_usecase(self) -> DataInsertUsecase:
+        self._ensure_built()
+        return self.data_insert_usecase
+
+    def get_ingestion_job_usecase(self) -> IngestionJobUsecase:
+        self._ensure_built()
+        return self.ingestion_job_usecase
+
+    def get_reembed_migration_usecase(self) -> ReembedMigrationUsecase:
+        self._ensure_built()
+        return self.reembed_migration_usecase
+
+    def get_request_log_repository(self) -> RequestLogRepository:
+        self._ensure_built()
+        return self.request_log_repository
+
+
+# Instantiate the application-scoped providers
+app_providers = AppProviders()
@@ -10,23 +10,147 @@ class Settings(BaseSettings):
     PINECONE_UPSERT_URL: str = "https://{}/vectors/upsert"
     PINECONE_RERANK_URL: str = "https://api.pinecone.io/rerank"
     PINECONE_QUERY_URL: str = "https://{}/query"
+    PINECONE_DELETE_URL: str = "https://{}/vectors/delete"
+    PINECONE_LIST_VECTORS_URL: str = "https://{}/vectors/list"
+    PINECONE_FETCH_VECTORS_URL: str = "https://{}/vectors/fetch"
+    PINECONE_DESCRIBE_INDEX_STATS_URL: str = "https://{}/describe_index_stats"
+    PINECONE_SEARCH_RECORDS_URL: str = "https://{}/records/namespaces/{}/search"
+    PINECONE_UPSERT_RECORDS_URL: str = "https://{}/records/namespaces/{}/upsert"
     PINECONE_LIST_INDEXES_URL: str = "https://api.pinecone.io/indexes"
+    PINECONE_DESCRIBE_INDEX_URL: str = "https://api.pinecone.io/indexes/{}"
+    PINECONE_INDEX_METADATA_TTL_SECONDS: int = 3600
     PINECONE_INDEX_NAME: str = "rocket-support-agent-dataset"
     ROCKET_DOCS_PINECONE_INDEX_NAME: str = "rocket-docs-support-agent"
 
+    # Integrated inference (server-side embedding + hosted rerank), per index
+    PINECONE_INTEGRATED_INFERENCE_INDEXES: list[str] = []
+    PINECONE_INTEGRATED_TEXT_FIELD: str = "content"
+    PINECONE_HOSTED_RERANK_MODEL: str = "bge-reranker-v2-m3"
+    PINECONE_UPSERT_RECORDS_BATCH_SIZE: int = 96
+
     # Indexing settings
     INDEXING_SIMILARITY_METRIC: str = "dotproduct"
 
     # Codebase indexing settings
     EMBEDDINGS_BATCH_SIZE: int = 80
+    PINECONE_MAX_CONCURRENT_REQUESTS: int = 10
+
+    # Upsert chunking settings (Pinecone caps requests at 2MB / 1000 vectors)
+    PINECONE_UPSERT_MAX_REQUEST_BYTES: int = 2_000_000
+    PINECONE_UPSERT_MAX_VECTORS_PER_REQUEST: int = 1000
+    PINECONE_FETCH_BATCH_SIZE: int = 100
+    PINECONE_UPSERT_MAX_CONCURRENCY: int = 4
+    PINECONE_UPSERT_MAX_RETRIES: int = 3
+    PINECONE_UPSERT_RETRY_BACKOFF_SECONDS: float = 0.5
     EMBEDDINGS_DIMENSION: int = 1024
 
+    # BM25 sparse encoder settings
+    BM25_ENCODER_PATH: str = "bm25_encoder.pkl"
+    BM25_COMPACT_ENCODER_DIR: str = "bm25_encoder_compact"
+    BM25_WARM_UP_ON_STARTUP: bool = True
+    BM25_VECTORIZED_ENCODER_ENABLED: bool = True
+    # Keep only the N highest weighted terms per sparse vector (0 keeps all)
+    BM25_SPARSE_TOP_N: int = 0
+
+    # Off-loop sparse encoding (thread pool below the threshold, processes above)
+    SPARSE_ENCODING_THREAD_WORKERS: int = 2
+    SPARSE_ENCODING_PROCESS_WORKERS: int = 2
+    SPARSE_ENCODING_PROCESS_THRESHOLD: int = 16
+    SPARSE_ENCODING_PROCESS_START_METHOD: str = "spawn"
+
+    # Query embedding cache settings
+    EMBEDDING_CACHE_MAX_ENTRIES: int = 10000
+    EMBEDDING_CACHE_PERSISTENT_ENABLED: bool = False
+
+    # Query embedding micro-batching settings
+    EMBEDDING_COALESCE_ENABLED: bool = True
+    EMBEDDING_COALESCE_WINDOW_MS: int = 10
+    EMBEDDING_COALESCE_MAX_BATCH_SIZE: int = 32
+
+    # Retrieval result cache settings
+    RETRIEVAL_CACHE_ENABLED: bool = True
+    RETRIEVAL_CACHE_MAX_ENTRIES: int = 2000
+    RETRIEVAL_CACHE_TTL_SECONDS: int = 900
+    ROCKET_DOCS_RETRIEVAL_CACHE_TTL_SECONDS: int = 86400
+
+    # Semantic workflow cache settings (cosine similarity thresholds per reuse tier)
+    SEMANTIC_CACHE_ENABLED: bool = True
+    SEMANTIC_CACHE_MAX_ENTRIES: int = 5000
+    SEMANTIC_CACHE_TTL_SECONDS: int = 86400
+    SEMANTIC_CACHE_CATEGORIZATION_THRESHOLD: float = 0.95
+    SEMANTIC_CACHE_RETRIEVAL_THRESHOLD: float = 0.97
+    SEMANTIC_CACHE_DRAFT_THRESHOLD: float = 0.99
+    # Reuse a previous final draft only for the same sender, via review
+    SEMANTIC_CACHE_DRAFT_REUSE_ENABLED: bool = False
+    SEMANTIC_CACHE_EXCLUDED_CATEGORIES: list[str] = []
+
+    # Rerank (query, document) score cache settings
+    RERANK_CACHE_ENABLED: bool = True
+    RERANK_CACHE_MAX_ENTRIES: int = 50000
+
+    # Adaptive rerank settings (skip Voyage when Pinecone already decided)
+    ADAPTIVE_RERANK_ENABLED: bool = True
+    ADAPTIVE_RERANK_SCORE_MARGIN: float = 0.15
+    ADAPTIVE_RERANK_SKIP_FEW_CANDIDATES: bool = True
+    LOCAL_RERANK_ENABLED: bool = True
+    LOCAL_RERANK_BM25_WEIGHT: float = 0.3
+
+    # Speculative dataset retrieval (runs in parallel with categorization)
+    SPECULATIVE_RETRIEVAL_ENABLED: bool = True
+    SPECULATIVE_RETRIEVAL_TOP_K: int = 50
+    SPECULATIVE_RETRIEVAL_MIN_SURVIVORS: int = 5
+
+    # Local vector store (indexes served in process instead of by Pinecone)
+    LOCAL_VECTOR_STORE_INDEXES: list[str] = []
+    LOCAL_VECTOR_STORE_DIR: str = "vector_store"
+    LOCAL_VECTOR_STORE_PERSIST_ON_WRITE: bool = True
+    LOCAL_VECTOR_STORE_PERSIST_DELAY_SECONDS: float = 5.0
+
+    # Local read replica of the dataset index
+    DATASET_REPLICA_ENABLED: bool = False
+    DATASET_REPLICA_SNAPSHOT_DIR: str = "dataset_replica"
+    DATASET_REPLICA_MAX_STALENESS_SECONDS: int = 900
+    DATASET_REPLICA_RECONCILE_INTERVAL_SECONDS: int = 300
+
+    # Two-phase retrieval: ID-only query, then metadata for the survivors
+    TWO_PHASE_RETRIEVAL_ENABLED: bool = False
+    VECTOR_METADATA_CACHE_MAX_ENTRIES: int = 20000
+    RERANK_MIN_SCORE: float = 0.2
+
+    # Category-partitioned namespaces for the dataset index
+    DATASET_CATEGORY_NAMESPACES_ENABLED: bool = False
+    DATASET_CATEGORY_NAMESPACE_PREFIX: str = "category-"
+
+    # Two-stage Matryoshka retrieval: low-dimension scan, full-dimension rescore
+    MATRYOSHKA_RETRIEVAL_ENABLED: bool = False
+    MATRYOSHKA_DIMENSION: int = 384
+    MATRYOSHKA_INDEX_NAME: str = "rocket-support-agent-dataset-384"
+    MATRYOSHKA_FULL_VECTOR_DIR: str = "matryoshka_full_vectors"
+    MATRYOSHKA_CANDIDATE_MULTIPLIER: int = 4
+
+    # Online re-embedding migration of the dataset index
+    REEMBED_MIGRATION_PAGES_IN_FLIGHT: int = 4
+    REEMBED_SHADOW_READ_SAMPLE_RATE: float = 0.1
+    REEMBED_SHADOW_READ_MAX_SAMPLES: int = 1000
+
+    # Streaming ingestion of uploaded dataset files
+    INGEST_STREAM_READ_CHUNK_BYTES: int = 65536
+    INGEST_STREAM_MAX_VALUE_BYTES: int = 16_000_000
+    INGEST_STREAM_QUEUE_BATCHES: int = 4
+    INGEST_STREAM_WORKERS: int = 4
+
+    # Background ingestion jobs
+    INGEST_JOB_UPLOAD_DIR: str = "ingest_uploads"
+
     # MongoDB settings
     MONGODB_URL: str = "mongodb://localhost:27017"
     MONGODB_DB_NAME: str = "rocket-support-agent"
     LLM_USAGE_COLLECTION_NAME: str = "llm_usage"
     ERROR_COLLECTION_NAME: str = "errors"
     REQUEST_LOGS_COLLECTION_NAME: str = "request_logs"
+    EMBEDDING_CACHE_COLLECTION_NAME: str = "embedding_cache"
+    REEMBED_MIGRATIONS_COLLECTION_NAME: str = "reembed_migrations"
+    INGESTION_JOBS_COLLECTION_NAME: str = "ingestion_jobs"
 
     # OpenAI settings
     OPENAI_BASE_URL: str = "https://api.openai.com/v1"
@@ -51,6 +175,22 @@ class Settings(BaseSettings):
     VOYAGEAI_BASE_URL: str = "https://api.voyageai.com/v1"
     VOYAGEAI_RERANKING_MODEL: str = "rerank-2"
 
+    # Shared HTTP client pool settings (one keep-alive client per upstream)
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTP_KEEPALIVE_EXPIRY: float = 30.0
+    HTTP_VERIFY_SSL: bool = True
+
+    # Per-upstream HTTP timeouts (seconds)
+    PINECONE_CONNECT_TIMEOUT: float = 60.0
+    PINECONE_READ_TIMEOUT: float = 300.0
+    PINECONE_INDEX_CONNECT_TIMEOUT: float = 60.0
+    PINECONE_INDEX_READ_TIMEOUT: float = 120.0
+    VOYAGEAI_CONNECT_TIMEOUT: float = 60.0
+    VOYAGEAI_READ_TIMEOUT: float = 120.0
+    GEMINI_CONNECT_TIMEOUT: float = 120.0
+    GEMINI_READ_TIMEOUT: float = 240.0
+
     class Config:
         env_file = ".env"
 
@@ -2,6 +2,7 @@ from typing import Dict
 
 from fastapi import Depends, HTTPException
 
+from system.src.app.config.providers import app_providers
 from system.src.app.usecases.generate_drafts_usecases.draft_generation_orchestration_usecase import (
     DraftGenerationOrchestrationUsecase,
 )
@@ -11,7 +12,7 @@ class GenerateDraftsController:
     def __init__(
         self,
         draft_generation_orchestration_usecase: DraftGenerationOrchestrationUsecase = Depends(
-            DraftGenerationOrchestrationUsecase
+            app_providers.get_draft_generation_orchestration_usecase
         ),
     ):
         self.draft_generation_orchestration_usecase = (
@@ -0,0 +1,30 @@
+from typing import Dict
+
+from fastapi import Depends, UploadFile
+
+from system.src.app.config.providers import app_providers
+from system.src.app.usecases.data_insert_usecases.ingestion_job_usecase import (
+    IngestionJobUsecase,
+)
+
+
+class IngestionJobController:
+    def __init__(
+        self,
+        ingestion_job_usecase: IngestionJobUsecase = Depends(
+            app_providers.get_ingestion_job_usecase
+        ),
+    ):
+        self.ingestion_job_usecase = ingestion_job_usecase
+
+    async def submit_job(self, file: UploadFile) -> Dict:
+        return await self.ingestion_job_usecase.submit(file)
+
+    async def get_job(self, job_id: str) -> Dict:
+        return await self.ingestion_job_usecase.status(job_id)
+
+    async def retry_job(self, job_id: str) -> Dict:
+        return await self.ingestion_job_usecase.retry(job_id)
+
+    async def cancel_job(self, job_id: str) -> Dict:
+        return await self.ingestion_job_usecase.cancel(job_id)
@@ -1,5 +1,6 @@
 from fastapi import Depends, UploadFile
 
+from system.src.app.config.providers import app_providers
 from system.src.app.usecases.data_insert_usecases.data_insert_usecase import (
     DataInsertUsecase,
 )
@@ -8,7 +9,9 @@ from system.src.app.usecases.data_insert_usecases.data_insert_usecase import (
 class InsertDataController:
     def __init__(
         self,
-        data_insert_usecase: DataInsertUsecase = Depends(DataInsertUsecase),
+        data_insert_usecase: DataInsertUsecase = Depends(
+            app_providers.get_data_insert_usecase
+        ),
     ):
         self.data_insert_usecase = data_insert_usecase
 
@@ -0,0 +1,38 @@
+from typing import Dict
+
+from fastapi import Depends
+
+from system.src.app.config.providers import app_providers
+from system.src.app.usecases.data_insert_usecases.reembed_migration_usecase import (
+    ReembedMigrationUsecase,
+)
+
+
+class ReembedMigrationController:
+    def __init__(
+        self,
+        reembed_migration_usecase: ReembedMigrationUsecase = Depends(
+            app_providers.get_reembed_migration_usecase
+        ),
+    ):
+        self.reembed_migration_usecase = reembed_migration_usecase
+
+    async def start_migration(self, request: Dict) -> Dict:
+        return await self.reembed_migration_usecase.start(
+            request["target_index"],
+            request["embed_model"],
+            request["dimension"],
+            request.get("bm25_encoder_path"),
+        )
+
+    async def get_migration(self, migration_id: str) -> Dict:
+        return await self.reembed_migration_usecase.status(migration_id)
+
+    async def pause_migration(self, migration_id: str) -> Dict:
+        return await self.reembed_migration_usecase.pause(migration_id)
+
+    async def resume_migration(self, migration_id: str) -> Dict:
+        return await self.reembed_migration_usecase.resume(migration_id)
+
+    async def stop_migration(self, migration_id: str) -> Dict:
+        return await self.reembed_migration_usecase.stop(migration_id)
@@ -2,5 +2,10 @@ from .generate_drafts_schemas import (
     AttachmentSchema,
     GenerateDraftsRequestSchema,
 )
+from .reembed_migration_schema import ReembedMigrationRequestSchema
 
-__all__ = ["AttachmentSchema", "GenerateDraftsRequestSchema"]
+__all__ = [
+    "AttachmentSchema",
+    "GenerateDraftsRequestSchema",
+    "ReembedMigrationRequestSchema",
+]
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ReembedMigrationRequestSchema(BaseModel):
+    """Schema for starting a re-embedding migration of the dataset index"""
+
+    target_index: str
+    embed_model: str = "llama-text-embed-v2"
+    dimension: int = Field(default=1024, gt=0)
+    # Compact directory or pickle of a new BM25 encoder for the target
+    bm25_encoder_path: Optional[str] = None
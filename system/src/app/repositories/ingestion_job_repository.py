@@ -0,0 +1,87 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bson import ObjectId
+from fastapi import Depends, HTTPException
+
+from system.src.app.config.database import mongodb_database
+
+
+class IngestionJobRepository:
+    def __init__(
+        self,
+        collection=Depends(mongodb_database.get_ingestion_jobs_collection),
+    ):
+        self.collection = collection
+
+    @staticmethod
+    def _to_dict(document: Optional[Dict]) -> Optional[Dict]:
+        if document:
+            document["id"] = str(document["_id"])
+            del document["_id"]
+        return document
+
+    async def create_job(self, job_data: Dict) -> Dict:
+        """
+        Add a new ingestion job
+
+        :param job_data: Stored upload, format, status and counters
+        :return: The created job with its ID
+        """
+        try:
+            now = datetime.now()
+            job = {**job_data, "created_at": now, "updated_at": now}
+            result = await self.collection.insert_one(job)
+            job["_id"] = result.inserted_id
+            return self._to_dict(job)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error adding ingestion job: {str(e)}"
+            )
+
+    async def get_job(self, job_id: str) -> Optional[Dict]:
+        try:
+            return self._to_dict(
+                await self.collection.find_one({"_id": ObjectId(job_id)})
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error fetching ingestion job: {str(e)}",
+            )
+
+    async def get_jobs_by_status(self, statuses: List[str]) -> List[Dict]:
+        """
+        Get jobs in any of the given statuses, oldest first
+
+        :param statuses: Job statuses to match
+        :return: Matching jobs
+        """
+        try:
+            cursor = self.collection.find(
+                {"status": {"$in": statuses}}, sort=[("created_at", 1)]
+            )
+            return [self._to_dict(document) async for document in cursor]
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error fetching ingestion jobs: {str(e)}",
+            )
+
+    async def save_checkpoint(self, job_id: str, fields: Dict):
+        """
+        Persist job progress
+
+        :param job_id: Job ID
+        :param fields: Fields to set, e.g. batch watermark and counters
+        """
+        try:
+            await self.collection.update_one(
+                {"_id": ObjectId(job_id)},
+                {"$set": {**fields, "updated_at": datetime.now()}},
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error saving ingestion job checkpoint: {str(e)}",
+            )
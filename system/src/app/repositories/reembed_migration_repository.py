@@ -0,0 +1,128 @@
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from bson import ObjectId
+from fastapi import Depends, HTTPException
+
+from system.src.app.config.database import mongodb_database
+
+
+class ReembedMigrationRepository:
+    def __init__(
+        self,
+        collection=Depends(mongodb_database.get_reembed_migrations_collection),
+    ):
+        self.collection = collection
+
+    @staticmethod
+    def _to_dict(document: Optional[Dict]) -> Optional[Dict]:
+        if document:
+            document["id"] = str(document["_id"])
+            del document["_id"]
+        return document
+
+    async def create_migration(self, migration_data: Dict) -> Dict:
+        """
+        Add a new re-embedding migration
+
+        :param migration_data: Source/target index, model, dimension and status
+        :return: The created migration with its ID
+        """
+        try:
+            now = datetime.now()
+            migration = {**migration_data, "created_at": now, "updated_at": now}
+            result = await self.collection.insert_one(migration)
+            migration["_id"] = result.inserted_id
+            return self._to_dict(migration)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error adding migration: {str(e)}"
+            )
+
+    async def get_migration(self, migration_id: str) -> Optional[Dict]:
+        try:
+            return self._to_dict(
+                await self.collection.find_one({"_id": ObjectId(migration_id)})
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500, detail=f"Error fetching migration: {str(e)}"
+            )
+
+    async def get_active_migration(self) -> Optional[Dict]:
+        """
+        Get the migration whose target still receives dual-writes
+
+        :return: The most recent active migration or None
+        """
+        try:
+            document = await self.collection.find_one(
+                {"active": True}, sort=[("created_at", -1)]
+            )
+            return self._to_dict(document)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error fetching active migration: {str(e)}",
+            )
+
+    async def save_checkpoint(self, migration_id: str, fields: Dict):
+        """
+        Persist migration progress
+
+        :param migration_id: Migration ID
+        :param fields: Fields to set, e.g. namespace position and page token
+        """
+        try:
+            await self.collection.update_one(
+                {"_id": ObjectId(migration_id)},
+                {"$set": {**fields, "updated_at": datetime.now()}},
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error saving migration checkpoint: {str(e)}",
+            )
+
+    async def add_pending_ids(
+        self, migration_id: str, namespace: str, vector_ids: List[str]
+    ):
+        """
+        Record vectors the target index is missing, to be retried
+
+        :param migration_id: Migration ID
+        :param namespace: Namespace of the vectors
+        :param vector_ids: Vector IDs that failed to migrate
+        """
+        try:
+            await self.collection.update_one(
+                {"_id": ObjectId(migration_id)},
+                {
+                    "$addToSet": {
+                        f"pending_ids.{namespace}": {"$each": vector_ids}
+                    },
+                    "$set": {"updated_at": datetime.now()},
+                },
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error recording pending migration ids: {str(e)}",
+            )
+
+    async def remove_pending_ids(
+        self, migration_id: str, namespace: str, vector_ids: List[str]
+    ):
+        try:
+            await self.collection.update_one(
+                {"_id": ObjectId(migration_id)},
+                {
+                    "$pullAll": {f"pending_ids.{namespace}": vector_ids},
+                    "$set": {"updated_at": datetime.now()},
+                },
+            )
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Error clearing pending migration ids: {str(e)}",
+            )
@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, File, UploadFile, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from system.src.app.controllers.ingestion_job_controller import (
+    IngestionJobController,
+)
+from system.src.app.utils.error_handler import handle_exceptions
+
+router = APIRouter(prefix="/ingestion-jobs")
+
+
+def _response(job: dict, detail: str, status_code: int = status.HTTP_200_OK):
+    return JSONResponse(
+        content={
+            "data": jsonable_encoder(job),
+            "status_code": status_code,
+            "detail": detail,
+        },
+        status_code=status_code,
+    )
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+@handle_exceptions
+async def submit_job(
+    file: UploadFile = File(...),
+    controller: IngestionJobController = Depends(IngestionJobController),
+):
+    """
+    Store a dataset file and ingest it in the background
+
+    :param file: JSON file with an "examples" array, or NDJSON
+    :return: The created job; poll it for progress
+    """
+    job = await controller.submit_job(file)
+    return _response(
+        job, f"{file.filename} accepted for ingestion", status.HTTP_202_ACCEPTED
+    )
+
+
+@router.get("/{job_id}")
+@handle_exceptions
+async def get_job(
+    job_id: str,
+    controller: IngestionJobController = Depends(IngestionJobController),
+):
+    """
+    Get ingestion progress, throughput and failed batches
+
+    :param job_id: Job ID
+    :return: Checkpoint, counters, progress and throughput
+    """
+    job = await controller.get_job(job_id)
+    return _response(job, "Ingestion job status")
+
+
+@router.post("/{job_id}/retry", status_code=status.HTTP_202_ACCEPTED)
+@handle_exceptions
+async def retry_job(
+    job_id: str,
+    controller: IngestionJobController = Depends(IngestionJobController),
+):
+    """
+    Reprocess failed batches, or continue a failed job from its checkpoint
+
+    :param job_id: Job ID
+    :return: The restarted job
+    """
+    job = await controller.retry_job(job_id)
+    return _response(job, "Ingestion job restarted", status.HTTP_202_ACCEPTED)
+
+
+@router.post("/{job_id}/cancel")
+@handle_exceptions
+async def cancel_job(
+    job_id: str,
+    controller: IngestionJobController = Depends(IngestionJobController),
+):
+    job = await controller.cancel_job(job_id)
+    return _response(job, "Ingestion job cancelled")
@@ -0,0 +1,70 @@
+from fastapi import APIRouter
+
+from system.src.app.config.providers import app_providers
+from system.src.app.services.adaptive_rerank_policy import (
+    adaptive_rerank_policy,
+)
+from system.src.app.services.bm25_encoder import bm25_encoder_holder
+from system.src.app.services.category_namespaces import (
+    category_namespace_layout,
+)
+from system.src.app.services.dataset_index_replica import (
+    dataset_index_replica,
+)
+from system.src.app.services.embedding_cache import embedding_cache
+from system.src.app.services.index_metadata_cache import index_metadata_cache
+from system.src.app.services.index_migration_monitor import (
+    index_migration_monitor,
+)
+from system.src.app.services.matryoshka_retrieval import matryoshka_retrieval
+from system.src.app.services.rerank_score_cache import rerank_score_cache
+from system.src.app.services.retrieval_result_cache import (
+    retrieval_result_cache,
+)
+from system.src.app.services.semantic_workflow_cache import (
+    semantic_workflow_cache,
+)
+from system.src.app.services.sparse_encoding_executor import (
+    sparse_encoding_executor,
+)
+from system.src.app.services.vector_metadata_cache import (
+    vector_metadata_cache,
+)
+from system.src.app.services.vector_store_registry import (
+    vector_store_registry,
+)
+
+router = APIRouter(prefix="/metrics")
+
+
+@router.get("/caches")
+async def get_cache_metrics():
+    """
+    Get counters for the in-process caches, batching and rerank policy
+
+    :return: Statistics keyed by cache or component name
+    """
+    metrics = {
+        "embedding_cache": embedding_cache.stats(),
+        "index_metadata_cache": index_metadata_cache.stats(),
+        "retrieval_result_cache": retrieval_result_cache.stats(),
+        "rerank_score_cache": rerank_score_cache.stats(),
+        "adaptive_rerank": adaptive_rerank_policy.stats(),
+        "bm25_encoder": bm25_encoder_holder.stats(),
+        "sparse_encoding": sparse_encoding_executor.stats(),
+        "semantic_workflow_cache": semantic_workflow_cache.stats(),
+        "local_vector_stores": vector_store_registry.stats(),
+        "dataset_replica": dataset_index_replica.stats(),
+        "vector_metadata_cache": vector_metadata_cache.stats(),
+        "category_namespaces": category_namespace_layout.stats(),
+        "matryoshka_retrieval": matryoshka_retrieval.stats(),
+        "index_migration": index_migration_monitor.stats(),
+    }
+    if app_providers.is_built:
+        metrics["embedding_coalescer"] = (
+            app_providers.embedding_service.query_coalescer.stats()
+        )
+        metrics["retrieval_stage"] = (
+            app_providers.retrieval_stage_usecase.stats()
+        )
+    return metrics
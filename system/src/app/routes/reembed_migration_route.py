@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Body, Depends, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from system.src.app.controllers.reembed_migration_controller import (
+    ReembedMigrationController,
+)
+from system.src.app.models.schemas import ReembedMigrationRequestSchema
+from system.src.app.utils.error_handler import handle_exceptions
+
+router = APIRouter(prefix="/reembed-migrations")
+
+
+def _response(
+    migration: dict, detail: str, status_code: int = status.HTTP_200_OK
+):
+    return JSONResponse(
+        content={
+            "data": jsonable_encoder(migration),
+            "status_code": status_code,
+            "detail": detail,
+        },
+        status_code=status_code,
+    )
+
+
+@router.post("", status_code=status.HTTP_202_ACCEPTED)
+@handle_exceptions
+async def start_migration(
+    request: ReembedMigrationRequestSchema = Body(...),
+    controller: ReembedMigrationController = Depends(
+        ReembedMigrationController
+    ),
+):
+    """
+    Start re-embedding the dataset index into a new index in the background
+
+    :param request: Target index, embedding model and dimension
+    :return: The created migration
+    """
+    migration = await controller.start_migration(request.model_dump())
+    return _response(migration, "Migration started", status.HTTP_202_ACCEPTED)
+
+
+@router.get("/{migration_id}")
+@handle_exceptions
+async def get_migration(
+    migration_id: str,
+    controller: ReembedMigrationController = Depends(
+        ReembedMigrationController
+    ),
+):
+    """
+    Get migration progress and shadow read comparison
+
+    :param migration_id: Migration ID
+    :return: Checkpoint, progress and shadow read statistics
+    """
+    migration = await controller.get_migration(migration_id)
+    return _response(migration, "Migration status")
+
+
+@router.post("/{migration_id}/pause")
+@handle_exceptions
+async def pause_migration(
+    migration_id: str,
+    controller: ReembedMigrationController = Depends(
+        ReembedMigrationController
+    ),
+):
+    migration = await controller.pause_migration(migration_id)
+    return _response(migration, "Migration paused")
+
+
+@router.post("/{migration_id}/resume")
+@handle_exceptions
+async def resume_migration(
+    migration_id: str,
+    controller: ReembedMigrationController = Depends(
+        ReembedMigrationController
+    ),
+):
+    migration = await controller.resume_migration(migration_id)
+    return _response(migration, "Migration resumed")
+
+
+@router.post("/{migration_id}/stop")
+@handle_exceptions
+async def stop_migration(
+    migration_id: str,
+    controller: ReembedMigrationController = Depends(
+        ReembedMigrationController
+    ),
+):
+    """
+    End the migration: stop copying, dual-writes and shadow reads
+
+    :param migration_id: Migration ID
+    :return: The stopped migration
+    """
+    migration = await controller.stop_migration(migration_id)
+    return _response(migration, "Migration stopped")
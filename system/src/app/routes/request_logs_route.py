@@ -3,6 +3,7 @@ from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 
+from system.src.app.config.providers import app_providers
 from system.src.app.models.schemas.request_log_schema import (
     RequestLogResponseSchema,
     RequestLogStatsSchema,
@@ -23,7 +24,7 @@ async def get_request_stats(
         None, description="End date for statistics (ISO format)"
     ),
     request_log_repository: RequestLogRepository = Depends(
-        RequestLogRepository
+        app_providers.get_request_log_repository
     ),
 ):
     """
@@ -51,7 +52,7 @@ async def get_user_request_logs(
     user_id: str,
     limit: int = Query(100, description="Maximum number of logs to return"),
     request_log_repository: RequestLogRepository = Depends(
-        RequestLogRepository
+        app_providers.get_request_log_repository
     ),
 ):
     """
@@ -78,7 +79,7 @@ async def get_user_request_logs(
 async def get_request_log(
     log_id: str,
     request_log_repository: RequestLogRepository = Depends(
-        RequestLogRepository
+        app_providers.get_request_log_repository
     ),
 ):
     """
@@ -0,0 +1,78 @@
+from typing import Any, Dict, List, Optional
+
+from system.src.app.config.settings import settings
+
+FEW_CANDIDATES = "few_candidates"
+SCORE_MARGIN = "score_margin"
+
+
+class AdaptiveRerankPolicy:
+    """
+    Decides when the remote reranker can be skipped and keeps the counters
+    that show how often it was and what that saved.
+
+    The remote call is skipped when no more than ``top_n`` candidates pass
+    the score threshold (the cut would keep them all anyway) or when the
+    best Pinecone score leads the runner-up by at least ``score_margin``.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        score_margin: float,
+        skip_few_candidates: bool,
+    ) -> None:
+        self.enabled = enabled
+        self.score_margin = score_margin
+        self.skip_few_candidates = skip_few_candidates
+        self.remote_calls = 0
+        self.remote_seconds = 0.0
+        self.skips = {FEW_CANDIDATES: 0, SCORE_MARGIN: 0}
+        self.local_seconds = 0.0
+
+    def skip_reason(self, scores: List[float], top_n: int) -> Optional[str]:
+        """
+        :param scores: Pinecone scores of the candidates, best first
+        :param top_n: Number of results the caller keeps
+        :return: Why the remote rerank can be skipped, or None
+        """
+        if not self.enabled or not scores:
+            return None
+        if self.skip_few_candidates and len(scores) <= top_n:
+            return FEW_CANDIDATES
+        if len(scores) > 1 and scores[0] - scores[1] >= self.score_margin:
+            return SCORE_MARGIN
+        return None
+
+    def record_remote(self, seconds: float):
+        self.remote_calls += 1
+        self.remote_seconds += seconds
+
+    def record_skip(self, reason: str, local_seconds: float):
+        self.skips[reason] += 1
+        self.local_seconds += local_seconds
+
+    def stats(self) -> Dict[str, Any]:
+        skipped = sum(self.skips.values())
+        decisions = skipped + self.remote_calls
+        average_remote = (
+            self.remote_seconds / self.remote_calls if self.remote_calls else 0.0
+        )
+        return {
+            "remote_calls": self.remote_calls,
+            "skipped": dict(self.skips),
+            "skip_rate": round(skipped / decisions, 4) if decisions else 0.0,
+            "average_remote_seconds": round(average_remote, 4),
+            # Skipped calls priced at the observed remote average, less local work
+            "estimated_seconds_saved": round(
+                max(skipped * average_remote - self.local_seconds, 0.0), 4
+            ),
+        }
+
+
+# Shared rerank skipping policy
+adaptive_rerank_policy = AdaptiveRerankPolicy(
+    enabled=settings.ADAPTIVE_RERANK_ENABLED,
+    score_margin=settings.ADAPTIVE_RERANK_SCORE_MARGIN,
+    skip_few_candidates=settings.ADAPTIVE_RERANK_SKIP_FEW_CANDIDATES,
+)
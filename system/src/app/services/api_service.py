@@ -1,18 +1,23 @@
 import httpx
 from fastapi import Depends, HTTPException, status
 
+from system.src.app.config.http_client import (
+    HttpClientRegistry,
+    http_client_registry,
+)
 from system.src.app.repositories.error_repository import ErrorRepo
 
 
 class ApiService:
-    def __init__(self, error_repo: ErrorRepo = Depends(ErrorRepo)) -> None:
-        self.timeout = httpx.Timeout(
-            connect=120,  # Time to establish a connection
-            read=240,  # Time to read the response
-            write=124020,  # Time to send data
-            pool=120,  # Time to wait for a connection from the pool
-        )
+    def __init__(
+        self,
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+        http_clients: HttpClientRegistry = Depends(
+            lambda: http_client_registry
+        ),
+    ) -> None:
         self.error_repo = error_repo
+        self.http_clients = http_clients
 
     async def get(
         self, url: str, headers: dict = None, data: dict = None
@@ -25,14 +30,13 @@ class ApiService:
         :return: The HTTP response.
         """
         try:
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=headers, params=data)
-                response.raise_for_status()
-                try:
-                    return response.json()
-                except:
-                    return response.text
+            client = self.http_clients.get_client_for_url(url)
+            response = await client.get(url, headers=headers, params=data)
+            response.raise_for_status()
+            try:
+                return response.json()
+            except:
+                return response.text
         except httpx.RequestError as exc:
             await self.error_repo.log_error(
                 error=exc,
@@ -83,19 +87,15 @@ class ApiService:
         :return: The HTTP response.
         """
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout, verify=False
-            ) as client:
-                if files:
-                    response = await client.post(
-                        url, headers=headers, data=data, files=files
-                    )
-                else:
-                    response = await client.post(
-                        url, headers=headers, json=data
-                    )
-                response.raise_for_status()
-                return response.json()
+            client = self.http_clients.get_client_for_url(url)
+            if files:
+                response = await client.post(
+                    url, headers=headers, data=data, files=files
+                )
+            else:
+                response = await client.post(url, headers=headers, json=data)
+            response.raise_for_status()
+            return response.json()
         except httpx.RequestError as exc:
             await self.error_repo.log_error(
                 error=exc,
@@ -0,0 +1,237 @@
+import argparse
+import json
+import os
+import pickle
+import threading
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import mmh3
+import numpy as np
+
+from system.src.app.config.settings import settings
+from system.src.app.services.bm25_batch_encoder import BatchBM25Encoder
+from system.src.app.utils.logging_utils import loggers
+
+PARAMS_FILE = "params.json"
+DOC_FREQ_INDICES_FILE = "doc_freq_indices.npy"
+DOC_FREQ_VALUES_FILE = "doc_freq_values.npy"
+
+TOKENIZER_PARAMS = (
+    "lower_case",
+    "remove_punctuation",
+    "remove_stopwords",
+    "stem",
+    "language",
+)
+
+
+class CompactBM25Encoder:
+    """
+    BM25 encoder backed by a sorted numpy vocabulary table.
+
+    Produces the same sparse vectors as ``pinecone_text``'s ``BM25Encoder``
+    but keeps document frequencies in two flat arrays (sorted uint32 token
+    hashes and float32 frequencies) that can be memory-mapped, so worker
+    processes share the table through the page cache instead of each
+    unpickling a Python dict.
+    """
+
+    def __init__(
+        self,
+        params: Dict[str, Any],
+        doc_freq_indices: np.ndarray,
+        doc_freq_values: np.ndarray,
+    ) -> None:
+        from pinecone_text.sparse.bm25_tokenizer import BM25Tokenizer
+
+        self.params = params
+        self.b = params["b"]
+        self.k1 = params["k1"]
+        self.avgdl = params["avgdl"]
+        self.n_docs = params["n_docs"]
+        self.doc_freq_indices = doc_freq_indices
+        self.doc_freq_values = doc_freq_values
+        self._tokenizer = BM25Tokenizer(
+            **{name: params[name] for name in TOKENIZER_PARAMS}
+        )
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "CompactBM25Encoder":
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(directory, PARAMS_FILE)) as f:
+            params = json.load(f)
+        return cls(
+            params,
+            np.load(
+                os.path.join(directory, DOC_FREQ_INDICES_FILE),
+                mmap_mode=mmap_mode,
+            ),
+            np.load(
+                os.path.join(directory, DOC_FREQ_VALUES_FILE),
+                mmap_mode=mmap_mode,
+            ),
+        )
+
+    def _tf(self, text: str) -> Tuple[List[int], List[int]]:
+        counts = Counter(
+            mmh3.hash(token, signed=False) for token in self._tokenizer(text)
+        )
+        return list(counts.keys()), list(counts.values())
+
+    def _doc_freq(self, indices: List[int]) -> np.ndarray:
+        if not indices:
+            return np.zeros(0, dtype=np.float64)
+        if len(self.doc_freq_indices) == 0:
+            return np.ones(len(indices), dtype=np.float64)
+        lookup = np.asarray(indices, dtype=np.uint32)
+        positions = np.searchsorted(self.doc_freq_indices, lookup)
+        positions = np.minimum(positions, len(self.doc_freq_indices) - 1)
+        found = self.doc_freq_indices[positions] == lookup
+        # float64 like pinecone-text's integer doc_freq dict
+        values = self.doc_freq_values[positions].astype(np.float64)
+        return np.where(found, values, 1.0)
+
+    def _encode_single_document(self, text: str) -> Dict[str, List]:
+        indices, doc_tf = self._tf(text)
+        tf = np.array(doc_tf)
+        tf_normed = tf / (
+            self.k1 * (1.0 - self.b + self.b * (tf.sum() / self.avgdl)) + tf
+        )
+        return {"indices": indices, "values": tf_normed.tolist()}
+
+    def _encode_single_query(self, text: str) -> Dict[str, List]:
+        indices, _ = self._tf(text)
+        df = self._doc_freq(indices)
+        idf = np.log((self.n_docs + 1) / (df + 0.5))
+        idf_norm = idf / idf.sum()
+        return {"indices": indices, "values": idf_norm.tolist()}
+
+    def encode_documents(
+        self, texts: Union[str, List[str]]
+    ) -> Union[Dict[str, List], List[Dict[str, List]]]:
+        if isinstance(texts, str):
+            return self._encode_single_document(texts)
+        return [self._encode_single_document(text) for text in texts]
+
+    def encode_queries(
+        self, texts: Union[str, List[str]]
+    ) -> Union[Dict[str, List], List[Dict[str, List]]]:
+        if isinstance(texts, str):
+            return self._encode_single_query(texts)
+        return [self._encode_single_query(text) for text in texts]
+
+
+def convert_pickle_to_compact(pickle_path: str, output_dir: str) -> Dict:
+    """
+    Write a pickled ``BM25Encoder`` out in the compact on-disk format.
+
+    :param pickle_path: Path of the pickled encoder
+    :param output_dir: Directory receiving params.json and the .npy tables
+    :return: Summary of the written vocabulary
+    """
+    with open(pickle_path, "rb") as f:
+        encoder = pickle.load(f)
+
+    params = encoder.get_params()
+    doc_freq = params.pop("doc_freq")
+    indices = np.asarray(doc_freq["indices"], dtype=np.uint32)
+    values = np.asarray(doc_freq["values"], dtype=np.float32)
+    order = np.argsort(indices, kind="stable")
+
+    os.makedirs(output_dir, exist_ok=True)
+    np.save(os.path.join(output_dir, DOC_FREQ_INDICES_FILE), indices[order])
+    np.save(os.path.join(output_dir, DOC_FREQ_VALUES_FILE), values[order])
+    with open(os.path.join(output_dir, PARAMS_FILE), "w") as f:
+        json.dump(params, f, indent=2)
+
+    return {"vocabulary_size": int(len(indices)), "output_dir": output_dir}
+
+
+class BM25EncoderHolder:
+    """
+    Loads the BM25 encoder on first use (or on an explicit warm-up) rather
+    than at import time. The compact memory-mapped format is preferred when
+    present; the legacy pickle is the fallback.
+    """
+
+    def __init__(self, pickle_path: str, compact_dir: str) -> None:
+        self.pickle_path = pickle_path
+        self.compact_dir = compact_dir
+        self._encoder: Optional[Any] = None
+        self._batch_encoder: Optional[BatchBM25Encoder] = None
+        self._lock = threading.Lock()
+        self.source: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+
+    @classmethod
+    def for_path(cls, path: str) -> "BM25EncoderHolder":
+        """Holder for a compact encoder directory or a pickled encoder"""
+        return cls(pickle_path=path, compact_dir=path)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._encoder is not None
+
+    def get(self) -> Any:
+        if self._encoder is None:
+            with self._lock:
+                if self._encoder is None:
+                    self._encoder = self._load()
+        return self._encoder
+
+    def get_batch_encoder(self) -> BatchBM25Encoder:
+        if self._batch_encoder is None:
+            encoder = self.get()
+            with self._lock:
+                if self._batch_encoder is None:
+                    self._batch_encoder = BatchBM25Encoder.from_encoder(encoder)
+        return self._batch_encoder
+
+    def warm_up(self):
+        if settings.BM25_VECTORIZED_ENCODER_ENABLED:
+            self.get_batch_encoder()
+        else:
+            self.get()
+
+    def _load(self) -> Any:
+        start = time.perf_counter()
+        if os.path.exists(os.path.join(self.compact_dir, PARAMS_FILE)):
+            encoder = CompactBM25Encoder.load(self.compact_dir)
+            self.source = "compact"
+        else:
+            with open(self.pickle_path, "rb") as f:
+                encoder = pickle.load(f)
+            self.source = "pickle"
+        self.load_seconds = round(time.perf_counter() - start, 4)
+        loggers["main"].info(
+            f"BM25 encoder loaded from {self.source} in {self.load_seconds}s"
+        )
+        return encoder
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.is_loaded,
+            "source": self.source,
+            "load_seconds": self.load_seconds,
+        }
+
+
+# Shared lazily-loaded BM25 encoder
+bm25_encoder_holder = BM25EncoderHolder(
+    pickle_path=settings.BM25_ENCODER_PATH,
+    compact_dir=settings.BM25_COMPACT_ENCODER_DIR,
+)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Convert the pickled BM25 encoder to the compact format"
+    )
+    parser.add_argument("--pickle-path", default=settings.BM25_ENCODER_PATH)
+    parser.add_argument(
+        "--output-dir", default=settings.BM25_COMPACT_ENCODER_DIR
+    )
+    args = parser.parse_args()
+    print(convert_pickle_to_compact(args.pickle_path, args.output_dir))
@@ -0,0 +1,165 @@
+import argparse
+import asyncio
+import re
+from typing import Any, Dict, List
+
+from system.src.app.config.settings import settings
+from system.src.app.utils.logging_utils import loggers
+
+
+class CategoryNamespaceLayout:
+    """
+    Optional per-category namespace layout for the dataset index.
+
+    Every template stays in the ``default`` namespace and is also written
+    into one namespace per category it belongs to. A category-filtered
+    search then queries only the namespaces of the requested categories,
+    without a metadata filter, and merges the results by score. A template
+    in several requested categories is returned once.
+    """
+
+    def __init__(self, enabled: bool, index_name: str, prefix: str) -> None:
+        self.enabled = enabled
+        self.index_name = index_name
+        self.prefix = prefix
+        self.fan_out_queries = 0
+        self.namespaces_queried = 0
+
+    def applies_to(self, index_name: str) -> bool:
+        return self.enabled and index_name == self.index_name
+
+    def namespace_for(self, category: str) -> str:
+        slug = re.sub(r"[^a-z0-9_-]+", "-", str(category).strip().lower())
+        return f"{self.prefix}{slug}"
+
+    def namespaces_for(self, categories: List[str]) -> List[str]:
+        return list(
+            dict.fromkeys(self.namespace_for(category) for category in categories)
+        )
+
+    def split(self, vectors: List[Dict]) -> Dict[str, List[Dict]]:
+        """
+        Group vectors by the category namespaces they belong in.
+
+        :param vectors: Vectors in Pinecone upsert format
+        :return: Vectors keyed by category namespace
+        """
+        by_namespace: Dict[str, List[Dict]] = {}
+        for vector in vectors:
+            categories = (vector.get("metadata") or {}).get("categories") or []
+            for namespace in self.namespaces_for(categories):
+                by_namespace.setdefault(namespace, []).append(vector)
+        return by_namespace
+
+    def merge(self, responses: List[Dict], top_k: int) -> Dict[str, Any]:
+        """
+        Merge per-namespace query responses by score.
+
+        :param responses: Query responses, one per category namespace
+        :param top_k: Number of matches to keep
+        :return: Pinecone-shaped response with the best ``top_k`` matches
+        """
+        self.fan_out_queries += 1
+        self.namespaces_queried += len(responses)
+        best: Dict[str, Dict] = {}
+        for response in responses:
+            for match in response.get("matches", []):
+                current = best.get(match["id"])
+                if current is None or match["score"] > current["score"]:
+                    best[match["id"]] = match
+        matches = sorted(
+            best.values(), key=lambda match: match["score"], reverse=True
+        )
+        return {"matches": matches[:top_k]}
+
+    async def migrate(
+        self,
+        pinecone_service,
+        batch_size: int = settings.PINECONE_FETCH_BATCH_SIZE,
+        dry_run: bool = False,
+    ) -> Dict[str, int]:
+        """
+        Copy every template of the ``default`` namespace into its category
+        namespaces. Upserts overwrite by ID, so the migration can be re-run
+        safely; templates removed from ``default`` are not removed from the
+        category namespaces.
+
+        :param pinecone_service: Service used to list, fetch and upsert
+        :param batch_size: Vectors fetched per request
+        :param dry_run: Count the writes without upserting anything
+        :return: Vector count per category namespace
+        """
+        index_host = await pinecone_service.get_index_host(self.index_name)
+        vector_ids = await pinecone_service.list_vector_ids(
+            index_host, "default"
+        )
+        counts: Dict[str, int] = {}
+        for i in range(0, len(vector_ids), batch_size):
+            vectors = await pinecone_service.fetch_vectors(
+                index_host, vector_ids[i : i + batch_size], "default"
+            )
+            by_namespace = self.split(vectors)
+            for namespace, namespace_vectors in by_namespace.items():
+                counts[namespace] = counts.get(namespace, 0) + len(
+                    namespace_vectors
+                )
+            if not dry_run:
+                await asyncio.gather(
+                    *[
+                        pinecone_service.upsert_vectors_simplified(
+                            namespace_vectors,
+                            namespace,
+                            index_name=self.index_name,
+                        )
+                        for namespace, namespace_vectors in by_namespace.items()
+                    ]
+                )
+            loggers["pinecone"].info(
+                f"Category namespace migration: {min(i + batch_size, len(vector_ids))}/{len(vector_ids)} templates"
+            )
+        return counts
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "fan_out_queries": self.fan_out_queries,
+            "namespaces_queried": self.namespaces_queried,
+        }
+
+
+# Shared category namespace layout of the dataset index
+category_namespace_layout = CategoryNamespaceLayout(
+    enabled=settings.DATASET_CATEGORY_NAMESPACES_ENABLED,
+    index_name=settings.PINECONE_INDEX_NAME,
+    prefix=settings.DATASET_CATEGORY_NAMESPACE_PREFIX,
+)
+
+
+async def _migrate(dry_run: bool, batch_size: int):
+    from system.src.app.config.database import mongodb_database
+    from system.src.app.config.http_client import http_client_registry
+    from system.src.app.config.providers import app_providers
+
+    mongodb_database.connect()
+    app_providers.build()
+    try:
+        return await category_namespace_layout.migrate(
+            app_providers.pinecone_service,
+            batch_size=batch_size,
+            dry_run=dry_run,
+        )
+    finally:
+        await http_client_registry.disconnect()
+        mongodb_database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Copy the dataset index into per-category namespaces"
+    )
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.PINECONE_FETCH_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    print(asyncio.run(_migrate(args.dry_run, args.batch_size)))
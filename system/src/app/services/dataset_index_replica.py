@@ -0,0 +1,272 @@
+import asyncio
+import time
+from typing import Any, Dict, Optional, Set, Tuple
+
+from system.src.app.config.settings import settings
+from system.src.app.services.local_vector_store import LocalVectorStore
+from system.src.app.utils.logging_utils import loggers
+
+
+class DatasetIndexReplica:
+    """
+    In-process read replica of the dataset index.
+
+    Pinecone stays the source of truth. The replica loads its last
+    snapshot (or starts empty) and reconciles against Pinecone by listing
+    vector IDs per namespace, fetching the missing ones and dropping the
+    ones Pinecone no longer has. Upserts and deletes sent through
+    ``PineconeService`` to the dataset index host are applied as they
+    succeed, and a background task reconciles periodically. Queries are
+    served locally only while the last reconcile is recent enough and no
+    write failed to apply; otherwise callers fall back to Pinecone.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        enabled: bool,
+        snapshot_dir: Optional[str],
+        metric: str,
+        max_staleness_seconds: float,
+        reconcile_interval_seconds: float,
+        fetch_batch_size: int,
+    ) -> None:
+        self.index_name = index_name
+        self.enabled = enabled
+        self.snapshot_dir = snapshot_dir or None
+        self.max_staleness_seconds = max_staleness_seconds
+        self.reconcile_interval_seconds = reconcile_interval_seconds
+        self.fetch_batch_size = fetch_batch_size
+        self.store = LocalVectorStore(
+            index_name,
+            directory=self.snapshot_dir,
+            metric=metric,
+            persist_on_write=False,
+        )
+        self.index_host: Optional[str] = None
+        self.synced_at: Optional[float] = None
+        self.diverged = False
+        # (namespace, id) pairs written while a reconcile is listing/fetching
+        self.touched: Optional[Set[Tuple[str, str]]] = None
+        self.sync_lock = asyncio.Lock()
+        self.reconcile_task: Optional[asyncio.Task] = None
+        self.local_reads = 0
+        self.fallbacks = 0
+        self.applied_upserts = 0
+        self.applied_deletes = 0
+        self.reconciles = 0
+        self.repaired_missing = 0
+        self.repaired_extra = 0
+        self.last_error: Optional[str] = None
+
+    def serves(self, index_name: str) -> bool:
+        return self.enabled and index_name == self.index_name
+
+    def is_fresh(self) -> bool:
+        return (
+            self.synced_at is not None
+            and not self.diverged
+            and time.monotonic() - self.synced_at <= self.max_staleness_seconds
+        )
+
+    def read_store(self) -> Optional[LocalVectorStore]:
+        """The local store when it may serve reads, else None"""
+        if self.is_fresh():
+            self.local_reads += 1
+            return self.store
+        self.fallbacks += 1
+        return None
+
+    def _track(self, namespace: str, vector_ids) -> None:
+        if self.touched is not None:
+            self.touched.update((namespace, vector_id) for vector_id in vector_ids)
+
+    async def apply_upsert(
+        self, index_host: str, vectors: list, namespace: str
+    ) -> None:
+        if not self.enabled or index_host != self.index_host:
+            return
+        try:
+            self._track(namespace, [vector["id"] for vector in vectors])
+            await self.store.upsert(vectors, namespace)
+            self.applied_upserts += len(vectors)
+        except Exception as e:
+            self.diverged = True
+            self.last_error = str(e)
+            loggers["pinecone"].warning(
+                f"Dataset replica could not apply upsert, serving from Pinecone until reconciled: {str(e)}"
+            )
+
+    async def apply_delete(
+        self, index_host: str, vector_ids: list, namespace: str
+    ) -> None:
+        if not self.enabled or index_host != self.index_host:
+            return
+        try:
+            self._track(namespace, vector_ids)
+            await self.store.delete(vector_ids, namespace)
+            self.applied_deletes += len(vector_ids)
+        except Exception as e:
+            self.diverged = True
+            self.last_error = str(e)
+            loggers["pinecone"].warning(
+                f"Dataset replica could not apply delete, serving from Pinecone until reconciled: {str(e)}"
+            )
+
+    async def _fetch_missing(
+        self, pinecone_service, namespace: str, vector_ids: list
+    ) -> int:
+        async def fetch(batch: list) -> list:
+            async with pinecone_service.semaphore:
+                return await pinecone_service.fetch_vectors(
+                    self.index_host, batch, namespace
+                )
+
+        batches = await asyncio.gather(
+            *[
+                fetch(vector_ids[i : i + self.fetch_batch_size])
+                for i in range(0, len(vector_ids), self.fetch_batch_size)
+            ]
+        )
+        # A write that landed meanwhile is newer than what was fetched
+        vectors = [
+            vector
+            for batch in batches
+            for vector in batch
+            if (namespace, vector["id"]) not in self.touched
+        ]
+        await self.store.upsert(vectors, namespace)
+        return len(vectors)
+
+    async def reconcile(self, pinecone_service) -> Dict[str, Any]:
+        """
+        Bring the replica in line with Pinecone's ID sets.
+
+        Only IDs are compared, so an overwrite that bypassed
+        ``PineconeService`` is not detected; writes that go through it are
+        applied directly.
+
+        :param pinecone_service: Service used to list and fetch vectors
+        :return: Per-namespace counts of fetched and dropped vectors
+        """
+        async with self.sync_lock:
+            if self.synced_at is None and self.store.load():
+                loggers["pinecone"].info(
+                    f"Dataset replica loaded snapshot: {self.store.stats()['vectors']}"
+                )
+            self.index_host = await pinecone_service.get_index_host(
+                self.index_name
+            )
+            self.touched = set()
+            report = {}
+            try:
+                index_stats = await pinecone_service.describe_index_stats(
+                    self.index_host
+                )
+                namespaces = set(index_stats.get("namespaces", {})) | set(
+                    self.store.namespaces
+                )
+                for namespace in namespaces:
+                    remote_ids = set(
+                        await pinecone_service.list_vector_ids(
+                            self.index_host, namespace
+                        )
+                    )
+                    local_store = self.store.namespaces.get(namespace)
+                    local_ids = set(local_store.rows) if local_store else set()
+                    touched = {
+                        vector_id
+                        for touched_namespace, vector_id in self.touched
+                        if touched_namespace == namespace
+                    }
+                    missing = sorted(remote_ids - local_ids - touched)
+                    extra = sorted(local_ids - remote_ids - touched)
+
+                    fetched = await self._fetch_missing(
+                        pinecone_service, namespace, missing
+                    )
+                    if extra:
+                        await self.store.delete(extra, namespace)
+                    self.repaired_missing += fetched
+                    self.repaired_extra += len(extra)
+
+                    remote_count = (
+                        index_stats.get("namespaces", {})
+                        .get(namespace, {})
+                        .get("vectorCount", len(remote_ids))
+                    )
+                    if remote_count != len(remote_ids):
+                        loggers["pinecone"].info(
+                            f"Dataset replica: {namespace} stats count {remote_count} differs from listed {len(remote_ids)}"
+                        )
+                    report[namespace] = {"fetched": fetched, "dropped": len(extra)}
+            finally:
+                self.touched = None
+
+            self.synced_at = time.monotonic()
+            self.diverged = False
+            self.last_error = None
+            self.reconciles += 1
+            if self.snapshot_dir:
+                await asyncio.to_thread(self.store.persist)
+            loggers["pinecone"].info(f"Dataset replica reconciled: {report}")
+            return report
+
+    async def _reconcile_forever(self, pinecone_service):
+        while True:
+            try:
+                await self.reconcile(pinecone_service)
+            except Exception as e:
+                self.last_error = str(e)
+                loggers["pinecone"].warning(
+                    f"Dataset replica reconcile failed: {str(e)}"
+                )
+            await asyncio.sleep(self.reconcile_interval_seconds)
+
+    def start(self, pinecone_service):
+        """Bootstrap in the background and keep reconciling periodically"""
+        if self.enabled and self.reconcile_task is None:
+            self.reconcile_task = asyncio.create_task(
+                self._reconcile_forever(pinecone_service)
+            )
+
+    async def stop(self):
+        if self.reconcile_task is not None:
+            self.reconcile_task.cancel()
+            try:
+                await self.reconcile_task
+            except asyncio.CancelledError:
+                pass
+            self.reconcile_task = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "fresh": self.is_fresh(),
+            "seconds_since_sync": (
+                round(time.monotonic() - self.synced_at, 1)
+                if self.synced_at is not None
+                else None
+            ),
+            "vectors": self.store.stats()["vectors"],
+            "local_reads": self.local_reads,
+            "fallbacks": self.fallbacks,
+            "applied_upserts": self.applied_upserts,
+            "applied_deletes": self.applied_deletes,
+            "reconciles": self.reconciles,
+            "repaired_missing": self.repaired_missing,
+            "repaired_extra": self.repaired_extra,
+            "last_error": self.last_error,
+        }
+
+
+# Shared replica of the dataset index
+dataset_index_replica = DatasetIndexReplica(
+    index_name=settings.PINECONE_INDEX_NAME,
+    enabled=settings.DATASET_REPLICA_ENABLED,
+    snapshot_dir=settings.DATASET_REPLICA_SNAPSHOT_DIR,
+    metric=settings.INDEXING_SIMILARITY_METRIC,
+    max_staleness_seconds=settings.DATASET_REPLICA_MAX_STALENESS_SECONDS,
+    reconcile_interval_seconds=settings.DATASET_REPLICA_RECONCILE_INTERVAL_SECONDS,
+    fetch_batch_size=settings.PINECONE_FETCH_BATCH_SIZE,
+)
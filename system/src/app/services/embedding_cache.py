@@ -0,0 +1,153 @@
+import hashlib
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from bson import Binary
+
+from system.src.app.config.database import mongodb_database
+from system.src.app.config.settings import settings
+from system.src.app.utils.logging_utils import loggers
+
+CacheKey = Tuple[str, str, int, str]
+
+
+class EmbeddingCache:
+    """
+    Two-tier cache for query embeddings keyed on
+    (model, input_type, dimension, normalized text hash).
+
+    The in-memory tier is a bounded LRU of float32 arrays; the optional
+    persistent tier stores the same float32 bytes in MongoDB so repeated
+    queries survive restarts.
+    """
+
+    def __init__(self, max_entries: int, persistent_enabled: bool) -> None:
+        self.max_entries = max_entries
+        self.persistent_enabled = persistent_enabled
+        self.entries: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.persistent_hits = 0
+
+    @staticmethod
+    def normalize_text(text: str) -> str:
+        return " ".join(unicodedata.normalize("NFKC", text).split())
+
+    def make_key(
+        self, model: str, input_type: str, dimension: int, text: str
+    ) -> CacheKey:
+        text_hash = hashlib.sha256(
+            self.normalize_text(text).encode("utf-8")
+        ).hexdigest()
+        return (model, input_type, dimension, text_hash)
+
+    @staticmethod
+    def _document_id(key: CacheKey) -> str:
+        return ":".join(str(part) for part in key)
+
+    def _remember(self, key: CacheKey, vector: np.ndarray):
+        self.entries[key] = vector
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    async def get_many(
+        self, keys: List[CacheKey]
+    ) -> List[Optional[List[float]]]:
+        """
+        Look up vectors for ``keys``, memory tier first then the persistent
+        tier. Misses are returned as ``None`` in the matching position.
+        """
+        results: List[Optional[List[float]]] = [None] * len(keys)
+        missing = []
+        for position, key in enumerate(keys):
+            vector = self.entries.get(key)
+            if vector is not None:
+                self.entries.move_to_end(key)
+                results[position] = vector.tolist()
+            else:
+                missing.append(position)
+
+        if missing and self.persistent_enabled:
+            found = await self._load_persistent([keys[i] for i in missing])
+            for position in list(missing):
+                vector = found.get(keys[position])
+                if vector is not None:
+                    self._remember(keys[position], vector)
+                    results[position] = vector.tolist()
+                    missing.remove(position)
+                    self.persistent_hits += 1
+
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        return results
+
+    async def put_many(self, keys: List[CacheKey], vectors: List[List[float]]):
+        documents = []
+        for key, values in zip(keys, vectors):
+            vector = np.asarray(values, dtype=np.float32)
+            self._remember(key, vector)
+            documents.append((key, vector))
+
+        if documents and self.persistent_enabled:
+            await self._store_persistent(documents)
+
+    async def _load_persistent(
+        self, keys: List[CacheKey]
+    ) -> Dict[CacheKey, np.ndarray]:
+        try:
+            collection = mongodb_database.get_embedding_cache_collection()
+            ids = {self._document_id(key): key for key in keys}
+            found = {}
+            async for document in collection.find({"_id": {"$in": list(ids)}}):
+                found[ids[document["_id"]]] = np.frombuffer(
+                    document["vector"], dtype=np.float32
+                )
+            return found
+        except Exception as e:
+            loggers["main"].error(
+                f"Embedding cache persistent lookup failed: {str(e)}"
+            )
+            return {}
+
+    async def _store_persistent(self, documents: List[Tuple[CacheKey, Any]]):
+        try:
+            collection = mongodb_database.get_embedding_cache_collection()
+            for key, vector in documents:
+                model, input_type, dimension, _ = key
+                await collection.replace_one(
+                    {"_id": self._document_id(key)},
+                    {
+                        "model": model,
+                        "input_type": input_type,
+                        "dimension": dimension,
+                        "vector": Binary(vector.tobytes()),
+                        "created_at": datetime.now(),
+                    },
+                    upsert=True,
+                )
+        except Exception as e:
+            loggers["main"].error(
+                f"Embedding cache persistent write failed: {str(e)}"
+            )
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "persistent_hits": self.persistent_hits,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Shared query embedding cache
+embedding_cache = EmbeddingCache(
+    max_entries=settings.EMBEDDING_CACHE_MAX_ENTRIES,
+    persistent_enabled=settings.EMBEDDING_CACHE_PERSISTENT_ENABLED,
+)
@@ -0,0 +1,99 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from system.src.app.utils.logging_utils import loggers
+
+BatchKey = Tuple[str, str, int]
+EmbedBatch = Callable[[List[str], str, str, int], Awaitable[List[List[float]]]]
+
+
+class EmbeddingCoalescer:
+    """
+    Micro-batches concurrent single-text embedding requests.
+
+    Requests for the same (model, input_type, dimension) that arrive within
+    ``window_seconds`` of the first one are sent as a single batched embed
+    call; a batch is flushed early once it reaches ``max_batch_size``.
+    """
+
+    def __init__(
+        self, embed_batch: EmbedBatch, window_seconds: float, max_batch_size: int
+    ) -> None:
+        self.embed_batch = embed_batch
+        self.window_seconds = window_seconds
+        self.max_batch_size = max_batch_size
+        self.pending: Dict[BatchKey, List[Tuple[str, asyncio.Future]]] = {}
+        self.timers: Dict[BatchKey, asyncio.TimerHandle] = {}
+        self.in_flight: Set[asyncio.Task] = set()
+        self.requests_submitted = 0
+        self.texts_sent = 0
+        self.batches_sent = 0
+
+    async def embed(
+        self, text: str, model: str, input_type: str, dimension: int
+    ) -> List[float]:
+        """
+        Queue one text for the next batch and wait for its vector.
+
+        :return: The embedding vector for ``text``.
+        """
+        loop = asyncio.get_running_loop()
+        batch_key = (model, input_type, dimension)
+        future = loop.create_future()
+        self.pending.setdefault(batch_key, []).append((text, future))
+        self.requests_submitted += 1
+
+        if len(self.pending[batch_key]) >= self.max_batch_size:
+            self._flush(batch_key)
+        elif batch_key not in self.timers:
+            self.timers[batch_key] = loop.call_later(
+                self.window_seconds, self._flush, batch_key
+            )
+        return await future
+
+    def _flush(self, batch_key: BatchKey):
+        timer = self.timers.pop(batch_key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self.pending.pop(batch_key, [])
+        if not items:
+            return
+        task = asyncio.create_task(self._send(batch_key, items))
+        self.in_flight.add(task)
+        task.add_done_callback(self.in_flight.discard)
+
+    async def _send(
+        self, batch_key: BatchKey, items: List[Tuple[str, asyncio.Future]]
+    ):
+        model, input_type, dimension = batch_key
+        # Identical texts in one window are embedded once
+        unique_texts = list(dict.fromkeys(text for text, _ in items))
+        self.texts_sent += len(unique_texts)
+        self.batches_sent += 1
+        try:
+            vectors = await self.embed_batch(
+                unique_texts, model, input_type, dimension
+            )
+            by_text = dict(zip(unique_texts, vectors))
+            for text, future in items:
+                if not future.done():
+                    future.set_result(by_text[text])
+            loggers["pinecone"].info(
+                f"Coalesced {len(items)} embedding requests into one call of {len(unique_texts)} inputs"
+            )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests_submitted": self.requests_submitted,
+            "texts_sent": self.texts_sent,
+            "batches_sent": self.batches_sent,
+            "average_batch_size": (
+                round(self.texts_sent / self.batches_sent, 2)
+                if self.batches_sent
+                else 0.0
+            ),
+        }
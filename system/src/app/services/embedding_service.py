@@ -1,32 +1,67 @@
+import asyncio
 import logging
-import pickle
+from typing import Optional
 
 import httpx
 from fastapi import Depends, HTTPException, status
 
+from system.src.app.config.http_client import (
+    PINECONE,
+    HttpClientRegistry,
+    http_client_registry,
+)
 from system.src.app.config.settings import settings
 from system.src.app.utils.logging_utils import loggers
 from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.services.bm25_encoder import BM25EncoderHolder
+from system.src.app.services.embedding_cache import (
+    EmbeddingCache,
+    embedding_cache,
+)
+from system.src.app.services.embedding_coalescer import EmbeddingCoalescer
+from system.src.app.services.sparse_encoding_executor import (
+    SparseEncodingExecutor,
+    sparse_encoding_executor,
+)
 
 logger = logging.getLogger(__name__)
 
-with open("bm25_encoder.pkl", "rb") as f:
-    bm25 = pickle.load(f)
-
 
 class EmbeddingService:
-    def __init__(self, error_repo: ErrorRepo = Depends(ErrorRepo)):
+    def __init__(
+        self,
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+        http_clients: HttpClientRegistry = Depends(
+            lambda: http_client_registry
+        ),
+        embedding_cache: EmbeddingCache = Depends(lambda: embedding_cache),
+        sparse_encoder: SparseEncodingExecutor = Depends(
+            lambda: sparse_encoding_executor
+        ),
+    ):
         self.pinecone_api_key = settings.PINECONE_API_KEY
         self.dense_embed_url = settings.PINECONE_EMBED_URL
         self.pinecone_embedding_url = settings.PINECONE_EMBED_URL
         self.pinecone_api_version = settings.PINECONE_API_VERSION
-        self.timeout = httpx.Timeout(
-            connect=60.0,  # Time to establish a connection
-            read=300.0,  # Time to read the response
-            write=300.0,  # Time to send data
-            pool=60.0,  # Time to wait for a connection from the pool
-        )
         self.error_repo = error_repo
+        self.http_clients = http_clients
+        self.embedding_cache = embedding_cache
+        self.sparse_encoder = sparse_encoder
+        self.query_coalescer = EmbeddingCoalescer(
+            embed_batch=self._embed_batch,
+            window_seconds=settings.EMBEDDING_COALESCE_WINDOW_MS / 1000,
+            max_batch_size=settings.EMBEDDING_COALESCE_MAX_BATCH_SIZE,
+        )
+
+    async def _embed_batch(
+        self, inputs: list, embedding_model: str, input_type: str, dimension: int
+    ) -> list:
+        return await self.pinecone_dense_embeddings(
+            inputs=inputs,
+            embedding_model=embedding_model,
+            input_type=input_type,
+            dimension=dimension,
+        )
         
     async def pinecone_dense_embeddings(
         self,
@@ -61,16 +96,16 @@ class EmbeddingService:
         url = self.dense_embed_url
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                response.raise_for_status()
-                loggers["main"].info("embeddings generated")
-                response = response.json()
-                loggers["pinecone"].info(
-                    f"pinecone hosted embedding model tokens usage: {response['usage']}"
-                )
-                list_result = [item["values"] for item in response["data"]]
-                return list_result
+            client = self.http_clients.get_client(PINECONE)
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            loggers["main"].info("embeddings generated")
+            response = response.json()
+            loggers["pinecone"].info(
+                f"pinecone hosted embedding model tokens usage: {response['usage']}"
+            )
+            list_result = [item["values"] for item in response["data"]]
+            return list_result
 
         except httpx.HTTPStatusError as exc:
             await self.error_repo.log_error(
@@ -106,9 +141,60 @@ class EmbeddingService:
             )
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_msg)
 
-    def pinecone_sparse_embeddings(self, inputs):
+    async def pinecone_query_embeddings(
+        self,
+        inputs: list,
+        embedding_model: str = "llama-text-embed-v2",
+        dimension: int = 1024,
+    ) -> list:
+        """
+        Dense query embeddings served from the embedding cache, calling the
+        hosted embed endpoint only for texts that are not cached.
+
+        :param inputs: Query texts to embed.
+        :param embedding_model: Hosted embedding model name.
+        :param dimension: Output dimension.
+        :return: One vector per input, in input order.
+        """
+        input_type = "query"
+        keys = [
+            self.embedding_cache.make_key(
+                embedding_model, input_type, dimension, text
+            )
+            for text in inputs
+        ]
+        vectors = await self.embedding_cache.get_many(keys)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            missing_inputs = [inputs[i] for i in missing]
+            if settings.EMBEDDING_COALESCE_ENABLED:
+                # Concurrent callers share one batched embed call
+                fresh_vectors = await asyncio.gather(
+                    *[
+                        self.query_coalescer.embed(
+                            text, embedding_model, input_type, dimension
+                        )
+                        for text in missing_inputs
+                    ]
+                )
+            else:
+                fresh_vectors = await self._embed_batch(
+                    missing_inputs, embedding_model, input_type, dimension
+                )
+            await self.embedding_cache.put_many(
+                [keys[i] for i in missing], fresh_vectors
+            )
+            for position, vector in zip(missing, fresh_vectors):
+                vectors[position] = vector
+        return vectors
+
+    async def pinecone_sparse_embeddings(
+        self, inputs, encoder: Optional[BM25EncoderHolder] = None
+    ):
         try:
-            sparse_vector = bm25.encode_documents(inputs)
+            sparse_vector = await self.sparse_encoder.encode_documents(
+                inputs, encoder
+            )
             return sparse_vector
 
         except Exception as e:
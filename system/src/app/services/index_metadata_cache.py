@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from system.src.app.config.settings import settings
+from system.src.app.utils.logging_utils import loggers
+
+
+class IndexMetadataCache:
+    """
+    TTL cache for Pinecone control-plane lookups (index host resolution).
+
+    Concurrent misses for the same key share a single in-flight request
+    (singleflight), and entries can be dropped by key or by index host when
+    the data plane reports that an index no longer exists.
+    """
+
+    def __init__(self, ttl_seconds: float) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.entries: Dict[str, Tuple[float, Any]] = {}
+        self.in_flight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, key: str) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    async def get(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return the cached value for ``key`` or load it with ``loader``.
+
+        :param key: Cache key (the index name).
+        :param loader: Coroutine function fetching the value on a miss.
+        :return: Cached or freshly loaded value.
+        """
+        value = self.peek(key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key, loader))
+            self.in_flight[key] = task
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        try:
+            value = await loader()
+            self.entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            return value
+        finally:
+            self.in_flight.pop(key, None)
+
+    def invalidate(self, key: str):
+        if self.entries.pop(key, None) is not None:
+            loggers["pinecone"].info(f"Index metadata invalidated: {key}")
+
+    def invalidate_value(self, value: Any):
+        for key, (_, cached_value) in list(self.entries.items()):
+            if cached_value == value:
+                self.invalidate(key)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self.entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Shared cache of index name -> data-plane host
+index_metadata_cache = IndexMetadataCache(
+    settings.PINECONE_INDEX_METADATA_TTL_SECONDS
+)
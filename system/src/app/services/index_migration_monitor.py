@@ -0,0 +1,114 @@
+import random
+import statistics
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from system.src.app.config.settings import settings
+from system.src.app.services.bm25_encoder import BM25EncoderHolder
+
+
+class IndexMigrationMonitor:
+    """
+    Process-wide view of the re-embedding migration of the dataset index.
+
+    While a migration is active, dataset upserts are also written to its
+    target index, and a sample of dataset queries is repeated against the
+    target in the background. Each shadow read records both latencies and
+    the overlap between the two result sets, so the new index can be
+    judged before traffic is switched to it. A migration to a new BM25
+    vocabulary loads that encoder here, separately from the shared one,
+    for the target's sparse vectors.
+    """
+
+    def __init__(
+        self, index_name: str, sample_rate: float, max_samples: int
+    ) -> None:
+        self.index_name = index_name
+        self.sample_rate = sample_rate
+        self.migration: Optional[Dict[str, Any]] = None
+        self.sparse_encoder: Optional[BM25EncoderHolder] = None
+        self.samples: deque = deque(maxlen=max_samples)
+        self.shadow_errors = 0
+        self.dual_writes = 0
+        self.dual_write_failures = 0
+
+    @property
+    def active(self) -> bool:
+        return self.migration is not None
+
+    def activate(
+        self,
+        migration: Dict[str, Any],
+        sparse_encoder: Optional[BM25EncoderHolder] = None,
+    ):
+        if self.migration is None or self.migration["id"] != migration["id"]:
+            self.samples.clear()
+        self.migration = {
+            key: migration[key]
+            for key in ("id", "target_index", "embed_model", "dimension")
+        }
+        self.migration["reuse_dense"] = migration.get("reuse_dense", False)
+        self.migration["bm25_encoder_path"] = migration.get(
+            "bm25_encoder_path"
+        )
+        path = self.migration["bm25_encoder_path"]
+        if path is None:
+            self.sparse_encoder = None
+        elif sparse_encoder is not None:
+            self.sparse_encoder = sparse_encoder
+        elif self.sparse_encoder is None or (
+            self.sparse_encoder.pickle_path != path
+        ):
+            self.sparse_encoder = BM25EncoderHolder.for_path(path)
+
+    def deactivate(self):
+        self.migration = None
+        self.sparse_encoder = None
+
+    def should_shadow(self, index_name: str) -> bool:
+        return (
+            self.migration is not None
+            and index_name == self.index_name
+            and random.random() < self.sample_rate
+        )
+
+    def record(
+        self,
+        primary_ms: float,
+        shadow_ms: float,
+        primary_ids: List[str],
+        shadow_ids: List[str],
+    ):
+        overlap = (
+            len(set(primary_ids) & set(shadow_ids)) / len(primary_ids)
+            if primary_ids
+            else 1.0
+        )
+        self.samples.append((primary_ms, shadow_ms, overlap))
+
+    def stats(self) -> Dict[str, Any]:
+        report = {
+            "migration": self.migration,
+            "shadow_reads": len(self.samples),
+            "shadow_errors": self.shadow_errors,
+            "dual_writes": self.dual_writes,
+            "dual_write_failures": self.dual_write_failures,
+        }
+        if self.samples:
+            primary_ms, shadow_ms, overlap = zip(*self.samples)
+            report.update(
+                {
+                    "primary_p50_ms": round(statistics.median(primary_ms), 2),
+                    "shadow_p50_ms": round(statistics.median(shadow_ms), 2),
+                    "mean_overlap": round(statistics.mean(overlap), 4),
+                }
+            )
+        return report
+
+
+# Shared monitor of the dataset index migration
+index_migration_monitor = IndexMigrationMonitor(
+    index_name=settings.PINECONE_INDEX_NAME,
+    sample_rate=settings.REEMBED_SHADOW_READ_SAMPLE_RATE,
+    max_samples=settings.REEMBED_SHADOW_READ_MAX_SAMPLES,
+)
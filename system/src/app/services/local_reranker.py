@@ -0,0 +1,92 @@
+import math
+import re
+from collections import Counter
+from typing import List, Tuple
+
+from system.src.app.config.settings import settings
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class LocalReranker:
+    """
+    In-process reranker for an already-fetched candidate list.
+
+    Scores each candidate with BM25 against the query, using the candidate
+    list itself as the corpus, and fuses the min-max normalized BM25 score
+    with the min-max normalized Pinecone hybrid score (which already carries
+    the dense cosine similarity).
+    """
+
+    def __init__(self, bm25_weight: float, k1: float = 1.2, b: float = 0.75):
+        self.bm25_weight = bm25_weight
+        self.k1 = k1
+        self.b = b
+
+    @staticmethod
+    def _tokenize(text: str) -> List[str]:
+        return TOKEN_PATTERN.findall((text or "").lower())
+
+    def _bm25_scores(self, query: str, documents: List[str]) -> List[float]:
+        query_terms = set(self._tokenize(query))
+        doc_terms = [Counter(self._tokenize(doc)) for doc in documents]
+        n_docs = len(documents)
+        avgdl = sum(sum(terms.values()) for terms in doc_terms) / n_docs or 1.0
+        doc_freq = Counter(
+            term for terms in doc_terms for term in query_terms if term in terms
+        )
+
+        scores = []
+        for terms in doc_terms:
+            length = sum(terms.values())
+            score = 0.0
+            for term in query_terms:
+                tf = terms.get(term, 0)
+                if not tf:
+                    continue
+                idf = math.log(
+                    1 + (n_docs - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5)
+                )
+                score += idf * (
+                    tf
+                    * (self.k1 + 1)
+                    / (tf + self.k1 * (1 - self.b + self.b * length / avgdl))
+                )
+            scores.append(score)
+        return scores
+
+    @staticmethod
+    def _min_max(values: List[float]) -> List[float]:
+        low, high = min(values), max(values)
+        if high == low:
+            return [1.0 for _ in values]
+        return [(value - low) / (high - low) for value in values]
+
+    def rerank(
+        self,
+        query: str,
+        documents: List[str],
+        base_scores: List[float],
+        top_n: int,
+    ) -> List[Tuple[int, float]]:
+        """
+        :param query: Query text
+        :param documents: Candidate texts
+        :param base_scores: Pinecone scores for the candidates
+        :param top_n: Number of results to keep
+        :return: (candidate index, fused score) pairs, best first
+        """
+        if not documents:
+            return []
+        bm25 = self._min_max(self._bm25_scores(query, documents))
+        base = self._min_max(base_scores)
+        fused = [
+            self.bm25_weight * lexical + (1 - self.bm25_weight) * vector
+            for lexical, vector in zip(bm25, base)
+        ]
+        ranked = sorted(enumerate(fused), key=lambda item: item[1], reverse=True)
+        return ranked[:top_n]
+
+
+# Shared in-process reranker used when the remote rerank is skipped
+local_reranker = LocalReranker(bm25_weight=settings.LOCAL_RERANK_BM25_WEIGHT)
@@ -0,0 +1,633 @@
+import asyncio
+import json
+import operator
+import os
+import shutil
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from system.src.app.services.vector_store import VectorStore
+from system.src.app.utils.logging_utils import loggers
+
+PARAMS_FILE = "params.json"
+IDS_FILE = "ids.json"
+METADATA_FILE = "metadata.json"
+DENSE_FILE = "dense.npy"
+SPARSE_INDPTR_FILE = "sparse_indptr.npy"
+SPARSE_INDICES_FILE = "sparse_indices.npy"
+SPARSE_VALUES_FILE = "sparse_values.npy"
+
+RANGE_OPERATORS = {
+    "$gt": operator.gt,
+    "$gte": operator.ge,
+    "$lt": operator.lt,
+    "$lte": operator.le,
+}
+
+EMPTY_SPARSE = (
+    np.zeros(0, dtype=np.uint32),
+    np.zeros(0, dtype=np.float32),
+)
+
+
+class _Namespace:
+    """
+    Rows of one namespace: a dense float32 matrix, per-row sparse vectors
+    and metadata. Deleted or overwritten rows are tombstoned and dropped
+    on compaction; the sparse inverted index and metadata field index are
+    rebuilt lazily after writes.
+    """
+
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+        self.ids: List[Optional[str]] = []
+        self.rows: Dict[str, int] = {}
+        self.dense = np.zeros((0, dimension), dtype=np.float32)
+        self.alive = np.zeros(0, dtype=bool)
+        self.sparse: List[Tuple[np.ndarray, np.ndarray]] = []
+        self.metadata: List[Dict[str, Any]] = []
+        self.inverted: Optional[Tuple[np.ndarray, ...]] = None
+        self.field_index: Dict[str, Dict[Any, np.ndarray]] = {}
+
+    @property
+    def size(self) -> int:
+        return len(self.ids)
+
+    @property
+    def count(self) -> int:
+        return len(self.rows)
+
+    def _reserve(self, extra: int):
+        needed = self.size + extra
+        capacity = len(self.dense)
+        if needed <= capacity and self.dense.flags.writeable:
+            return
+        capacity = max(needed, capacity * 2, 64)
+        dense = np.zeros((capacity, self.dimension), dtype=np.float32)
+        dense[: self.size] = self.dense[: self.size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        self.dense, self.alive = dense, alive
+
+    def _invalidate(self):
+        self.inverted = None
+        self.field_index = {}
+
+    def upsert(self, vectors: List[Dict], normalize: bool):
+        self._reserve(len(vectors))
+        for vector in vectors:
+            previous = self.rows.get(vector["id"])
+            if previous is not None:
+                self.alive[previous] = False
+                self.ids[previous] = None
+            row = self.size
+            values = np.asarray(vector["values"], dtype=np.float32)
+            if normalize:
+                norm = np.linalg.norm(values)
+                values = values / norm if norm else values
+            self.dense[row] = values
+            self.alive[row] = True
+            sparse = vector.get("sparse_values")
+            self.sparse.append(
+                (
+                    np.asarray(sparse["indices"], dtype=np.uint32),
+                    np.asarray(sparse["values"], dtype=np.float32),
+                )
+                if sparse
+                else EMPTY_SPARSE
+            )
+            self.metadata.append(vector.get("metadata") or {})
+            self.ids.append(vector["id"])
+            self.rows[vector["id"]] = row
+        self._invalidate()
+
+    def delete(self, ids: List[str]) -> int:
+        deleted = 0
+        for vector_id in ids:
+            row = self.rows.pop(vector_id, None)
+            if row is not None:
+                self.alive[row] = False
+                self.ids[row] = None
+                deleted += 1
+        if deleted:
+            self._invalidate()
+        return deleted
+
+    def compact(self):
+        keep = np.flatnonzero(self.alive[: self.size])
+        self.dense = self.dense[keep]
+        self.alive = np.ones(len(keep), dtype=bool)
+        self.ids = [self.ids[row] for row in keep]
+        self.sparse = [self.sparse[row] for row in keep]
+        self.metadata = [self.metadata[row] for row in keep]
+        self.rows = {vector_id: row for row, vector_id in enumerate(self.ids)}
+        self._invalidate()
+
+    def snapshot(self) -> Tuple[np.ndarray, list, list, list]:
+        """Copies of the live rows, so they can be written without the lock"""
+        keep = np.flatnonzero(self.alive[: self.size])
+        return (
+            self.dense[keep],
+            [self.sparse[row] for row in keep],
+            [self.ids[row] for row in keep],
+            [self.metadata[row] for row in keep],
+        )
+
+    def _inverted_index(self) -> Tuple[np.ndarray, ...]:
+        if self.inverted is None:
+            lengths = [len(indices) for indices, _ in self.sparse]
+            if sum(lengths):
+                terms = np.concatenate([indices for indices, _ in self.sparse])
+                values = np.concatenate([values for _, values in self.sparse])
+                rows = np.repeat(np.arange(self.size), lengths)
+                order = np.argsort(terms, kind="stable")
+                terms, rows, values = terms[order], rows[order], values[order]
+                unique_terms, starts = np.unique(terms, return_index=True)
+                ends = np.append(starts[1:], len(terms))
+            else:
+                unique_terms = np.zeros(0, dtype=np.uint32)
+                starts = ends = rows = np.zeros(0, dtype=np.int64)
+                values = np.zeros(0, dtype=np.float32)
+            self.inverted = (unique_terms, starts, ends, rows, values)
+        return self.inverted
+
+    def sparse_scores(self, sparse_vector: Dict) -> np.ndarray:
+        scores = np.zeros(self.size, dtype=np.float32)
+        unique_terms, starts, ends, rows, values = self._inverted_index()
+        if not len(unique_terms):
+            return scores
+        terms = np.asarray(sparse_vector["indices"], dtype=np.uint32)
+        positions = np.minimum(
+            np.searchsorted(unique_terms, terms), len(unique_terms) - 1
+        )
+        for position, term, weight in zip(
+            positions, terms, sparse_vector["values"]
+        ):
+            if unique_terms[position] == term:
+                start, end = starts[position], ends[position]
+                np.add.at(scores, rows[start:end], weight * values[start:end])
+        return scores
+
+    def sparse_scores_for(self, rows: List[int], sparse_vector: Dict) -> np.ndarray:
+        """Sparse dot products for a few rows, without the inverted index"""
+        terms = np.asarray(sparse_vector["indices"], dtype=np.uint32)
+        order = np.argsort(terms)
+        terms = terms[order]
+        weights = np.asarray(sparse_vector["values"], dtype=np.float32)[order]
+        scores = np.zeros(len(rows), dtype=np.float32)
+        if not len(terms):
+            return scores
+        for i, row in enumerate(rows):
+            indices, values = self.sparse[row]
+            positions = np.minimum(
+                np.searchsorted(terms, indices), len(terms) - 1
+            )
+            hits = terms[positions] == indices
+            scores[i] = np.dot(values[hits], weights[positions[hits]])
+        return scores
+
+    def _rows_with(self, field: str, wanted: list) -> np.ndarray:
+        index = self.field_index.get(field)
+        if index is None:
+            postings: Dict[Any, List[int]] = {}
+            for row, metadata in enumerate(self.metadata):
+                value = metadata.get(field)
+                for item in value if isinstance(value, list) else [value]:
+                    if item is not None and not isinstance(item, dict):
+                        postings.setdefault(item, []).append(row)
+            index = {
+                value: np.asarray(rows, dtype=np.int64)
+                for value, rows in postings.items()
+            }
+            self.field_index[field] = index
+        mask = np.zeros(self.size, dtype=bool)
+        for value in wanted:
+            rows = index.get(value)
+            if rows is not None:
+                mask[rows] = True
+        return mask
+
+    def _field_mask(self, field: str, condition: Any) -> np.ndarray:
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+        mask = np.ones(self.size, dtype=bool)
+        for op, operand in condition.items():
+            if op == "$eq":
+                mask &= self._rows_with(field, [operand])
+            elif op == "$in":
+                mask &= self._rows_with(field, operand)
+            elif op == "$ne":
+                mask &= ~self._rows_with(field, [operand])
+            elif op == "$nin":
+                mask &= ~self._rows_with(field, operand)
+            elif op == "$exists":
+                present = np.array(
+                    [field in metadata for metadata in self.metadata],
+                    dtype=bool,
+                )
+                mask &= present if operand else ~present
+            elif op in RANGE_OPERATORS:
+                compare = RANGE_OPERATORS[op]
+                mask &= np.array(
+                    [
+                        isinstance(metadata.get(field), (int, float))
+                        and compare(metadata[field], operand)
+                        for metadata in self.metadata
+                    ],
+                    dtype=bool,
+                )
+            else:
+                raise ValueError(f"Unsupported metadata filter operator: {op}")
+        return mask
+
+    def filter_mask(self, filter_dict: Optional[Dict]) -> np.ndarray:
+        mask = self.alive[: self.size].copy()
+        for field, condition in (filter_dict or {}).items():
+            if field == "$and":
+                for clause in condition:
+                    mask &= self.filter_mask(clause)
+            elif field == "$or":
+                any_mask = np.zeros(self.size, dtype=bool)
+                for clause in condition:
+                    any_mask |= self.filter_mask(clause)
+                mask &= any_mask
+            else:
+                mask &= self._field_mask(field, condition)
+        return mask
+
+
+class LocalVectorStore(VectorStore):
+    """
+    In-process VectorStore for indexes small enough to hold in memory.
+
+    Dense scores are a brute-force matrix-vector product over float32 rows;
+    sparse scores come from an inverted index (postings sorted by token
+    hash), and hybrid queries weight them by ``alpha`` like the Pinecone
+    hybrid query. Metadata ``$eq``/``$in`` filters are answered from a
+    per-field value index. The index persists to a directory of ``.npy``
+    files that are memory-mapped on load.
+
+    With ``persist_on_write`` a write only marks the index dirty; a
+    background task rewrites the directory off the event loop at most once
+    per ``persist_delay_seconds``, and ``flush`` writes pending changes at
+    shutdown.
+    """
+
+    def __init__(
+        self,
+        index_name: str,
+        directory: Optional[str] = None,
+        metric: str = "dotproduct",
+        persist_on_write: bool = True,
+        on_write: Optional[Callable[[str], None]] = None,
+        persist_delay_seconds: float = 5.0,
+    ) -> None:
+        super().__init__(index_name)
+        self.directory = directory
+        self.metric = metric
+        self.persist_on_write = persist_on_write and directory is not None
+        self.on_write = on_write
+        self.persist_delay_seconds = persist_delay_seconds
+        self.dimension: Optional[int] = None
+        self.namespaces: Dict[str, _Namespace] = {}
+        self.lock = threading.Lock()
+        self.persist_lock = threading.RLock()
+        self.dirty = False
+        self.persist_task: Optional[asyncio.Task] = None
+        self.queries = 0
+
+    def _namespace(self, namespace: str, dimension: int) -> _Namespace:
+        if self.dimension is None:
+            self.dimension = dimension
+        elif dimension != self.dimension:
+            raise ValueError(
+                f"Vector dimension {dimension} does not match index dimension {self.dimension}"
+            )
+        if namespace not in self.namespaces:
+            self.namespaces[namespace] = _Namespace(dimension)
+        return self.namespaces[namespace]
+
+    def _written(self):
+        self.dirty = True
+        if self.persist_on_write and (
+            self.persist_task is None or self.persist_task.done()
+        ):
+            self.persist_task = asyncio.create_task(self._persist_later())
+        if self.on_write is not None:
+            self.on_write(self.index_name)
+
+    async def _persist_later(self):
+        # Writes arriving while waiting or persisting share the next pass
+        while self.dirty:
+            await asyncio.sleep(self.persist_delay_seconds)
+            try:
+                await asyncio.to_thread(self.persist_if_dirty)
+            except Exception as e:
+                loggers["main"].error(
+                    f"Error persisting local vector store {self.index_name}: {str(e)}"
+                )
+
+    async def flush(self):
+        """Persist pending writes now, e.g. at shutdown"""
+        if self.persist_task is not None:
+            self.persist_task.cancel()
+            self.persist_task = None
+        # Also waits for a persist already running in a worker thread
+        await asyncio.to_thread(self.persist_if_dirty)
+
+    def persist_if_dirty(self):
+        with self.persist_lock:
+            if self.dirty:
+                self.persist()
+
+    async def upsert(
+        self, vectors: List[Dict], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        if not vectors:
+            return {"upsertedCount": 0}
+        with self.lock:
+            store = self._namespace(namespace, len(vectors[0]["values"]))
+            store.upsert(vectors, normalize=self.metric == "cosine")
+            # Overwrites leave tombstones that persisting no longer drops
+            if store.count < store.size // 2:
+                store.compact()
+        self._written()
+        return {"upsertedCount": len(vectors)}
+
+    async def delete(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        with self.lock:
+            store = self.namespaces.get(namespace)
+            deleted = store.delete(ids) if store else 0
+            if store and store.count < store.size // 2:
+                store.compact()
+        if deleted:
+            self._written()
+        return {"deleted": deleted}
+
+    async def query(
+        self,
+        vector: List[float],
+        sparse_vector: Optional[Dict] = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        filter_dict: Optional[Dict] = None,
+        include_metadata: bool = True,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        return self.query_sync(
+            vector,
+            sparse_vector,
+            top_k,
+            alpha,
+            filter_dict,
+            include_metadata,
+            namespace,
+        )
+
+    def query_sync(
+        self,
+        vector: List[float],
+        sparse_vector: Optional[Dict] = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        filter_dict: Optional[Dict] = None,
+        include_metadata: bool = True,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        self.queries += 1
+        store = self.namespaces.get(namespace)
+        if store is None or not store.count:
+            return {"matches": [], "namespace": namespace}
+        if alpha < 0 or alpha > 1:
+            raise ValueError("Alpha must be between 0 and 1")
+
+        query = np.asarray(vector, dtype=np.float32)
+        if self.metric == "cosine":
+            norm = np.linalg.norm(query)
+            query = query / norm if norm else query
+
+        with self.lock:
+            candidates = np.flatnonzero(store.filter_mask(filter_dict))
+            if not len(candidates):
+                return {"matches": [], "namespace": namespace}
+            if len(candidates) * 4 < store.size:
+                scores = store.dense[candidates] @ query
+            else:
+                # Gathering most rows costs more than scoring all of them
+                scores = (store.dense[: store.size] @ query)[candidates]
+            if sparse_vector is not None:
+                scores = alpha * scores + (1 - alpha) * (
+                    store.sparse_scores(sparse_vector)[candidates]
+                )
+
+            k = min(top_k, len(candidates))
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best], kind="stable")]
+            matches = []
+            for position in best:
+                row = candidates[position]
+                match = {"id": store.ids[row], "score": float(scores[position])}
+                if include_metadata:
+                    match["metadata"] = store.metadata[row]
+                matches.append(match)
+        return {"matches": matches, "namespace": namespace}
+
+    def rescore(
+        self,
+        ids: List[str],
+        vector: List[float],
+        sparse_vector: Optional[Dict] = None,
+        alpha: float = 0.8,
+        include_metadata: bool = True,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Exact hybrid scores for a given set of IDs, best first.
+
+        :param ids: Candidate vector IDs
+        :param vector: Dense query vector
+        :param sparse_vector: Sparse query vector; hybrid when given
+        :return: Pinecone-shaped matches, plus the IDs that are not stored
+        """
+        store = self.namespaces.get(namespace)
+        found = [i for i in ids if store is not None and i in store.rows]
+        missing = [i for i in ids if store is None or i not in store.rows]
+        if not found:
+            return {"matches": [], "missing": missing, "namespace": namespace}
+
+        query = np.asarray(vector, dtype=np.float32)
+        if self.metric == "cosine":
+            norm = np.linalg.norm(query)
+            query = query / norm if norm else query
+
+        with self.lock:
+            rows = [store.rows[vector_id] for vector_id in found]
+            scores = store.dense[rows] @ query
+            if sparse_vector is not None:
+                scores = alpha * scores + (1 - alpha) * store.sparse_scores_for(
+                    rows, sparse_vector
+                )
+            matches = []
+            for position in np.argsort(-scores, kind="stable"):
+                row = rows[position]
+                match = {"id": store.ids[row], "score": float(scores[position])}
+                if include_metadata:
+                    match["metadata"] = store.metadata[row]
+                matches.append(match)
+        return {"matches": matches, "missing": missing, "namespace": namespace}
+
+    async def fetch_metadata(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Dict[str, Any]]:
+        store = self.namespaces.get(namespace)
+        if store is None:
+            return {}
+        return {
+            vector_id: store.metadata[store.rows[vector_id]]
+            for vector_id in ids
+            if vector_id in store.rows
+        }
+
+    async def describe(self) -> Dict[str, Any]:
+        namespaces = {
+            name: {"vectorCount": store.count}
+            for name, store in self.namespaces.items()
+        }
+        return {
+            "dimension": self.dimension,
+            "metric": self.metric,
+            "totalVectorCount": sum(
+                stats["vectorCount"] for stats in namespaces.values()
+            ),
+            "namespaces": namespaces,
+        }
+
+    def persist(self):
+        """
+        Write every namespace, compacted, to ``directory``.
+
+        Live rows are copied under the lock and written after releasing
+        it, so writers are only held up for the copy. Files are written to
+        a temporary directory that then replaces the previous one, so a
+        crash mid-write leaves the old copy intact.
+        """
+        if self.directory is None:
+            return
+        with self.persist_lock:
+            with self.lock:
+                self.dirty = False
+                snapshots = {
+                    name: store.snapshot()
+                    for name, store in self.namespaces.items()
+                }
+                params = {
+                    "dimension": self.dimension,
+                    "metric": self.metric,
+                    "namespaces": list(self.namespaces),
+                }
+            try:
+                self._write(snapshots, params)
+            except Exception:
+                self.dirty = True
+                raise
+
+    def _write(self, snapshots: Dict[str, Tuple], params: Dict[str, Any]):
+        tmp_dir = f"{self.directory}.tmp"
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        os.makedirs(tmp_dir)
+        for name, (dense, sparse, ids, metadata) in snapshots.items():
+            ns_dir = os.path.join(tmp_dir, name)
+            os.makedirs(ns_dir)
+            lengths = [len(indices) for indices, _ in sparse]
+            indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+            np.cumsum(lengths, out=indptr[1:])
+            np.save(os.path.join(ns_dir, DENSE_FILE), dense)
+            np.save(os.path.join(ns_dir, SPARSE_INDPTR_FILE), indptr)
+            np.save(
+                os.path.join(ns_dir, SPARSE_INDICES_FILE),
+                np.concatenate(
+                    [EMPTY_SPARSE[0]] + [indices for indices, _ in sparse]
+                ),
+            )
+            np.save(
+                os.path.join(ns_dir, SPARSE_VALUES_FILE),
+                np.concatenate(
+                    [EMPTY_SPARSE[1]] + [values for _, values in sparse]
+                ),
+            )
+            with open(os.path.join(ns_dir, IDS_FILE), "w") as f:
+                json.dump(ids, f)
+            with open(os.path.join(ns_dir, METADATA_FILE), "w") as f:
+                json.dump(metadata, f)
+        with open(os.path.join(tmp_dir, PARAMS_FILE), "w") as f:
+            json.dump(params, f)
+
+        old_dir = f"{self.directory}.old"
+        shutil.rmtree(old_dir, ignore_errors=True)
+        if os.path.isdir(self.directory):
+            os.rename(self.directory, old_dir)
+        os.rename(tmp_dir, self.directory)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+    def load(self, mmap: bool = True) -> bool:
+        """
+        Load a persisted index; dense rows and sparse postings stay
+        memory-mapped until the first write to a namespace.
+
+        :return: False when nothing has been persisted yet
+        """
+        if self.directory is None or not os.path.exists(
+            os.path.join(self.directory, PARAMS_FILE)
+        ):
+            return False
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(self.directory, PARAMS_FILE)) as f:
+            params = json.load(f)
+
+        namespaces = {}
+        for name in params["namespaces"]:
+            ns_dir = os.path.join(self.directory, name)
+            store = _Namespace(params["dimension"])
+            store.dense = np.load(
+                os.path.join(ns_dir, DENSE_FILE), mmap_mode=mmap_mode
+            )
+            indptr = np.load(os.path.join(ns_dir, SPARSE_INDPTR_FILE))
+            indices = np.load(
+                os.path.join(ns_dir, SPARSE_INDICES_FILE), mmap_mode=mmap_mode
+            )
+            values = np.load(
+                os.path.join(ns_dir, SPARSE_VALUES_FILE), mmap_mode=mmap_mode
+            )
+            with open(os.path.join(ns_dir, IDS_FILE)) as f:
+                store.ids = json.load(f)
+            with open(os.path.join(ns_dir, METADATA_FILE)) as f:
+                store.metadata = json.load(f)
+            store.rows = {
+                vector_id: row for row, vector_id in enumerate(store.ids)
+            }
+            store.alive = np.ones(len(store.ids), dtype=bool)
+            store.sparse = [
+                (indices[start:end], values[start:end])
+                for start, end in zip(indptr[:-1], indptr[1:])
+            ]
+            namespaces[name] = store
+
+        with self.lock:
+            self.dimension = params["dimension"]
+            self.metric = params["metric"]
+            self.namespaces = namespaces
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "dimension": self.dimension,
+            "metric": self.metric,
+            "vectors": {
+                name: store.count for name, store in self.namespaces.items()
+            },
+            "queries": self.queries,
+        }
@@ -0,0 +1,238 @@
+import argparse
+import asyncio
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from system.src.app.config.settings import settings
+from system.src.app.services.local_vector_store import LocalVectorStore
+from system.src.app.services.vector_store import VectorStore
+from system.src.app.utils.logging_utils import loggers
+
+
+class MatryoshkaRetrieval:
+    """
+    Two-stage retrieval over Matryoshka embeddings of the dataset index.
+
+    ``llama-text-embed-v2`` is trained so that the leading values of an
+    embedding, re-normalized, form a usable smaller embedding. Dataset
+    upserts write such truncated vectors to a low-dimension index and keep
+    the full vectors, with their metadata, in a local store. A search scans
+    the low-dimension index for ``top_k * candidate_multiplier`` IDs only
+    and rescores those candidates exactly against the full vectors.
+    """
+
+    def __init__(
+        self,
+        enabled: bool,
+        index_name: str,
+        low_dim_index_name: str,
+        dimension: int,
+        candidate_multiplier: int,
+        full_store: LocalVectorStore,
+    ) -> None:
+        self.enabled = enabled
+        self.index_name = index_name
+        self.low_dim_index_name = low_dim_index_name
+        self.dimension = dimension
+        self.candidate_multiplier = candidate_multiplier
+        self.full_store = full_store
+        self.loaded = False
+        self.searches = 0
+        self.candidates = 0
+        self.missing_full_vectors = 0
+
+    def applies_to(self, index_name: str) -> bool:
+        return self.enabled and index_name == self.index_name
+
+    def load(self):
+        """Load the persisted full vectors once"""
+        if not self.loaded:
+            if self.full_store.load():
+                loggers["main"].info(
+                    f"Loaded full-dimension vectors: {self.full_store.stats()['vectors']}"
+                )
+            self.loaded = True
+
+    def truncate(self, vector: List[float]) -> List[float]:
+        values = np.asarray(vector[: self.dimension], dtype=np.float32)
+        norm = np.linalg.norm(values)
+        return (values / norm if norm else values).tolist()
+
+    def low_dim_vectors(self, vectors: List[Dict]) -> List[Dict]:
+        return [
+            {**vector, "values": self.truncate(vector["values"])}
+            for vector in vectors
+        ]
+
+    def candidate_count(self, top_k: int) -> int:
+        return top_k * self.candidate_multiplier
+
+    async def upsert(
+        self,
+        vectors: List[Dict],
+        low_dim_store: VectorStore,
+        namespace: str = "default",
+    ) -> None:
+        """
+        Dual-write full-dimension vectors: truncated to the low-dimension
+        index, in full to the local store.
+
+        :param vectors: Full-dimension vectors in Pinecone upsert format
+        :param low_dim_store: Backend serving the low-dimension index
+        """
+        self.load()
+        await asyncio.gather(
+            low_dim_store.upsert(self.low_dim_vectors(vectors), namespace),
+            self.full_store.upsert(vectors, namespace),
+        )
+
+    def rescore(
+        self,
+        candidates: Dict[str, Any],
+        vector: List[float],
+        sparse_vector: Optional[Dict],
+        alpha: float,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Second stage: exact hybrid scores of the candidates.
+
+        :param candidates: ID-only response of the low-dimension query
+        :param vector: Full-dimension dense query vector
+        :param sparse_vector: Sparse query vector; hybrid when given
+        :return: Rescored matches with metadata, best first, plus the
+            candidates whose full vectors are not stored locally
+        """
+        self.load()
+        matches = candidates.get("matches", [])
+        response = self.full_store.rescore(
+            [match["id"] for match in matches],
+            vector,
+            sparse_vector,
+            alpha,
+            namespace=namespace,
+        )
+        self.searches += 1
+        self.candidates += len(matches)
+        if response["missing"]:
+            self.missing_full_vectors += len(response["missing"])
+            loggers["main"].warning(
+                f"{len(response['missing'])} candidates have no local full vector; keeping their low-dimension scores"
+            )
+        missing = set(response["missing"])
+        return {
+            "matches": response["matches"],
+            "missing": [match for match in matches if match["id"] in missing],
+            "namespace": namespace,
+        }
+
+    async def backfill(
+        self,
+        pinecone_service,
+        low_dim_store: VectorStore,
+        batch_size: int = settings.PINECONE_FETCH_BATCH_SIZE,
+    ) -> Dict[str, int]:
+        """
+        Copy the full-dimension dataset index into the low-dimension index
+        and the local store. Upserts overwrite by ID, so it can be re-run.
+
+        :param pinecone_service: Service used to list and fetch vectors
+        :param low_dim_store: Backend serving the low-dimension index
+        :param batch_size: Vectors fetched per request
+        :return: Vector count per namespace
+        """
+        index_host = await pinecone_service.get_index_host(self.index_name)
+        index_stats = await pinecone_service.describe_index_stats(index_host)
+        counts = {}
+        # Persist once at the end instead of after every batch
+        persist_on_write = self.full_store.persist_on_write
+        self.full_store.persist_on_write = False
+        try:
+            for namespace in index_stats.get("namespaces", {}) or ["default"]:
+                vector_ids = await pinecone_service.list_vector_ids(
+                    index_host, namespace
+                )
+                for i in range(0, len(vector_ids), batch_size):
+                    vectors = await pinecone_service.fetch_vectors(
+                        index_host, vector_ids[i : i + batch_size], namespace
+                    )
+                    await self.upsert(vectors, low_dim_store, namespace)
+                counts[namespace] = len(vector_ids)
+                loggers["pinecone"].info(
+                    f"Matryoshka backfill: {len(vector_ids)} vectors in {namespace}"
+                )
+        finally:
+            self.full_store.persist_on_write = persist_on_write
+        await self.full_store.flush()
+        return counts
+
+    async def flush(self):
+        """Persist full vectors still waiting for the background write"""
+        if self.loaded:
+            await self.full_store.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "low_dim_index": self.low_dim_index_name,
+            "dimension": self.dimension,
+            "searches": self.searches,
+            "candidates_rescored": self.candidates,
+            "missing_full_vectors": self.missing_full_vectors,
+            "full_vectors": self.full_store.stats()["vectors"],
+        }
+
+
+# Shared two-stage retrieval of the dataset index
+matryoshka_retrieval = MatryoshkaRetrieval(
+    enabled=settings.MATRYOSHKA_RETRIEVAL_ENABLED,
+    index_name=settings.PINECONE_INDEX_NAME,
+    low_dim_index_name=settings.MATRYOSHKA_INDEX_NAME,
+    dimension=settings.MATRYOSHKA_DIMENSION,
+    candidate_multiplier=settings.MATRYOSHKA_CANDIDATE_MULTIPLIER,
+    full_store=LocalVectorStore(
+        settings.PINECONE_INDEX_NAME,
+        directory=settings.MATRYOSHKA_FULL_VECTOR_DIR,
+        metric=settings.INDEXING_SIMILARITY_METRIC,
+        persist_on_write=settings.LOCAL_VECTOR_STORE_PERSIST_ON_WRITE,
+        persist_delay_seconds=settings.LOCAL_VECTOR_STORE_PERSIST_DELAY_SECONDS,
+    ),
+)
+
+
+async def _backfill(batch_size: int):
+    from system.src.app.config.database import mongodb_database
+    from system.src.app.config.http_client import http_client_registry
+    from system.src.app.config.providers import app_providers
+    from system.src.app.services.vector_store_registry import (
+        vector_store_registry,
+    )
+
+    mongodb_database.connect()
+    app_providers.build()
+    try:
+        await app_providers.data_insert_usecase_helper.ensure_pinecone_index_exists()
+        return await matryoshka_retrieval.backfill(
+            app_providers.pinecone_service,
+            vector_store_registry.get(
+                matryoshka_retrieval.low_dim_index_name,
+                app_providers.pinecone_service,
+            ),
+            batch_size=batch_size,
+        )
+    finally:
+        await vector_store_registry.flush()
+        await http_client_registry.disconnect()
+        mongodb_database.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Fill the low-dimension index and local full vectors"
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.PINECONE_FETCH_BATCH_SIZE
+    )
+    args = parser.parse_args()
+    print(asyncio.run(_backfill(args.batch_size)))
@@ -1,19 +1,60 @@
 import asyncio
+import json
 import time
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 from fastapi import Depends, HTTPException, status
 from pinecone import Pinecone
 
+from system.src.app.config.http_client import (
+    PINECONE,
+    PINECONE_INDEX,
+    HttpClientRegistry,
+    http_client_registry,
+)
 from system.src.app.config.settings import settings
 from system.src.app.utils.logging_utils import loggers
 from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.services.dataset_index_replica import (
+    DatasetIndexReplica,
+    dataset_index_replica,
+)
+from system.src.app.services.index_metadata_cache import (
+    IndexMetadataCache,
+    index_metadata_cache,
+)
+from system.src.app.services.retrieval_result_cache import (
+    RetrievalResultCache,
+    retrieval_result_cache,
+)
+from system.src.app.services.vector_metadata_cache import (
+    VectorMetadataCache,
+    vector_metadata_cache,
+)
 
 
 class PineconeService:
-    def __init__(self, error_repo: ErrorRepo = Depends(ErrorRepo)):
+    def __init__(
+        self,
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+        http_clients: HttpClientRegistry = Depends(
+            lambda: http_client_registry
+        ),
+        index_metadata_cache: IndexMetadataCache = Depends(
+            lambda: index_metadata_cache
+        ),
+        retrieval_result_cache: RetrievalResultCache = Depends(
+            lambda: retrieval_result_cache
+        ),
+        dataset_replica: DatasetIndexReplica = Depends(
+            lambda: dataset_index_replica
+        ),
+        vector_metadata_cache: VectorMetadataCache = Depends(
+            lambda: vector_metadata_cache
+        ),
+    ):
         self.pinecone_api_key = settings.PINECONE_API_KEY
         self.api_version = settings.PINECONE_API_VERSION
         self.index_url = settings.PINECONE_CREATE_INDEX_URL
@@ -21,15 +62,32 @@ class PineconeService:
         self.upsert_url = settings.PINECONE_UPSERT_URL
         self.query_url = settings.PINECONE_QUERY_URL
         self.list_index_url = settings.PINECONE_LIST_INDEXES_URL
-        self.semaphore = asyncio.Semaphore(10)
-        self.pc = Pinecone(api_key=settings.PINECONE_API_KEY)
-        self.timeout = httpx.Timeout(
-            connect=60.0,  # Time to establish a connection
-            read=120.0,  # Time to read the response
-            write=120.0,  # Time to send data
-            pool=60.0,  # Time to wait for a connection from the pool
+        self.describe_index_url = settings.PINECONE_DESCRIBE_INDEX_URL
+        self.delete_url = settings.PINECONE_DELETE_URL
+        self.search_records_url = settings.PINECONE_SEARCH_RECORDS_URL
+        self.describe_index_stats_url = (
+            settings.PINECONE_DESCRIBE_INDEX_STATS_URL
         )
+        self.upsert_records_url = settings.PINECONE_UPSERT_RECORDS_URL
+        self.list_vectors_url = settings.PINECONE_LIST_VECTORS_URL
+        self.fetch_vectors_url = settings.PINECONE_FETCH_VECTORS_URL
+        self.semaphore = asyncio.Semaphore(
+            settings.PINECONE_MAX_CONCURRENT_REQUESTS
+        )
+        self.pc = Pinecone(api_key=settings.PINECONE_API_KEY)
         self.error_repo = error_repo
+        self.http_clients = http_clients
+        self.index_metadata_cache = index_metadata_cache
+        self.retrieval_result_cache = retrieval_result_cache
+        self.dataset_replica = dataset_replica
+        self.vector_metadata_cache = vector_metadata_cache
+
+    def _invalidate_missing_index(
+        self, index_host: str, exc: httpx.HTTPStatusError
+    ):
+        """Drop a cached index host once the data plane reports it as gone."""
+        if exc.response.status_code == 404:
+            self.index_metadata_cache.invalidate_value(index_host)
         
     async def list_pinecone_indexes(self):
         url = self.list_index_url
@@ -40,10 +98,10 @@ class PineconeService:
         }
 
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                return response.json()
+            client = self.http_clients.get_client(PINECONE)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            return response.json()
 
         except httpx.HTTPStatusError as exc:
             await self.error_repo.log_error(
@@ -105,36 +163,36 @@ class PineconeService:
             }
 
             try:
-                async with httpx.AsyncClient(verify=False) as client:
-                    response = await client.post(
-                        self.index_url, headers=headers, json=index_data
-                    )
-                    response.raise_for_status()
+                client = self.http_clients.get_client(PINECONE)
+                response = await client.post(
+                    self.index_url, headers=headers, json=index_data
+                )
+                response.raise_for_status()
 
-                    retry_count = 0
-                    max_retries = 30
-                    while retry_count < max_retries:
-                        status = (
-                            self.pc.describe_index(index_name)
-                            .get("status")
-                            .get("state")
-                        )
-                        loggers["main"].info(f"Index status: {status}")
+                retry_count = 0
+                max_retries = 30
+                while retry_count < max_retries:
+                    status = (
+                        self.pc.describe_index(index_name)
+                        .get("status")
+                        .get("state")
+                    )
+                    loggers["main"].info(f"Index status: {status}")
 
-                        if status == "Ready":
-                            loggers["main"].info(f"Index {index_name} is ready")
-                            break
+                    if status == "Ready":
+                        loggers["main"].info(f"Index {index_name} is ready")
+                        break
 
-                        retry_count += 1
-                        time.sleep(2)
+                    retry_count += 1
+                    time.sleep(2)
 
-                    if retry_count > max_retries:
-                        raise HTTPException(
-                            status_code=500, detail="Index creation timed out"
-                        )
+                if retry_count > max_retries:
+                    raise HTTPException(
+                        status_code=500, detail="Index creation timed out"
+                    )
 
-                    loggers["main"].info("Index Created")
-                    return response.json()
+                loggers["main"].info("Index Created")
+                return response.json()
 
             except httpx.HTTPStatusError as exc:
                 await self.error_repo.log_error(
@@ -215,16 +273,19 @@ class PineconeService:
 
         payload = {"vectors": input, "namespace": namespace}
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout, verify=False
-            ) as client:
-                response = await client.post(
-                    url=url, headers=headers, json=payload
-                )
-                response.raise_for_status()
-                return response.json()
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(
+                url=url, headers=headers, json=payload
+            )
+            response.raise_for_status()
+            await self.dataset_replica.apply_upsert(
+                index_host, input, namespace
+            )
+            self.vector_metadata_cache.put_many(index_host, namespace, input)
+            return response.json()
 
         except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
             await self.error_repo.log_error(
                 error=exc,
                 additional_context={
@@ -333,16 +394,16 @@ class PineconeService:
 
         url = self.query_url.format(index_host)
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout, verify=False
-            ) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                loggers["pinecone"].info(
-                    f"pinecone hybrid query read units: {response.json()['usage']}"
-                )
-                return response.json()
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            loggers["pinecone"].info(
+                f"pinecone hybrid query read units: {response.json()['usage']}"
+            )
+            return response.json()
 
         except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
             await self.error_repo.log_error(
                 error=exc,
                 additional_context={
@@ -426,16 +487,16 @@ class PineconeService:
         url = self.query_url.format(index_host)
 
         try:
-            async with httpx.AsyncClient(
-                verify=False, timeout=self.timeout
-            ) as client:
-                response = await client.post(url, headers=headers, json=payload)
-                loggers["pinecone"].info(
-                    f"pinecone Normal query read units: {response.json()['usage']}"
-                )
-                return response.json()
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            loggers["pinecone"].info(
+                f"pinecone Normal query read units: {response.json()['usage']}"
+            )
+            return response.json()
 
         except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
             await self.error_repo.log_error(
                 error=exc,
                 additional_context={
@@ -506,7 +567,7 @@ class PineconeService:
             raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_msg)
 
     async def get_index_details(self, index_name: str):
-        url = f"https://api.pinecone.io/indexes/{index_name}"
+        url = self.describe_index_url.format(index_name)
 
         headers = {
             "Api-Key": self.pinecone_api_key,
@@ -514,11 +575,11 @@ class PineconeService:
         }
 
         try:
-            async with httpx.AsyncClient(verify=False) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                index_details = response.json()
-                return index_details
+            client = self.http_clients.get_client(PINECONE)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+            index_details = response.json()
+            return index_details
 
         except httpx.HTTPStatusError as exc:
             await self.error_repo.log_error(
@@ -557,17 +618,24 @@ class PineconeService:
                 detail=error_msg,
             )
 
+    async def _fetch_index_host(self, index_name: str) -> str:
+        error_msg = f"Host not found in index details for {index_name}"
+        index_details = await self.get_index_details(index_name)
+        if "host" not in index_details:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=error_msg,
+            )
+        loggers["pinecone"].info(f"Index details: {index_details['host']}")
+        return index_details["host"]
+
     async def get_index_host(self, index_name: str) -> str:
+        """Resolve an index host, served from the TTL cache when possible"""
         error_msg = f"Host not found in index details for {index_name}"
         try:
-            index_details = await self.get_index_details(index_name)
-            if "host" not in index_details:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=error_msg,
-                )
-            loggers["pinecone"].info(f"Index details: {index_details['host']}")
-            return index_details["host"]
+            return await self.index_metadata_cache.get(
+                index_name, lambda: self._fetch_index_host(index_name)
+            )
         except HTTPException:
             raise
         except Exception as exc:
@@ -576,7 +644,7 @@ class PineconeService:
                 additional_context={
                     "file": "pinecone_service.py",
                     "method": "get_index_host",
-                    "url": f"https://api.pinecone.io/indexes/{index_name}",
+                    "url": self.describe_index_url.format(index_name),
                     "operation": "get_index_host",
                 },
             )
@@ -596,28 +664,30 @@ class PineconeService:
             "X-Pinecone-API-Version": self.api_version,
         }
 
-        # Construct the delete URL (assuming it follows pattern similar to other operations)
-        delete_url = f"https://{index_host}/vectors/delete"
+        delete_url = self.delete_url.format(index_host)
 
         payload = {"ids": vector_ids, "namespace": namespace}
 
         try:
-            async with httpx.AsyncClient(
-                timeout=self.timeout, verify=False
-            ) as client:
-                response = await client.post(
-                    url=delete_url, headers=headers, json=payload
-                )
-                response.raise_for_status()
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(
+                url=delete_url, headers=headers, json=payload
+            )
+            response.raise_for_status()
+            await self.dataset_replica.apply_delete(
+                index_host, vector_ids, namespace
+            )
+            self.vector_metadata_cache.evict(index_host, namespace, vector_ids)
 
-                # Pinecone delete doesn't return much, just success
-                loggers["main"].info(
-                    f"Successfully deleted {len(vector_ids)} vectors from namespace '{namespace}'"
-                )
+            # Pinecone delete doesn't return much, just success
+            loggers["main"].info(
+                f"Successfully deleted {len(vector_ids)} vectors from namespace '{namespace}'"
+            )
 
-                return {"deleted": len(vector_ids)}
+            return {"deleted": len(vector_ids)}
 
         except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
             await self.error_repo.log_error(
                 error=exc,
                 additional_context={
@@ -655,18 +725,615 @@ class PineconeService:
                 detail=error_msg,
             )
 
+    def split_upsert_chunks(self, vectors: list) -> List[list]:
+        """
+        Split vectors into request-sized chunks.
+
+        A chunk is closed once adding the next vector would exceed either the
+        estimated serialized payload size or the per-request vector count.
+        A single oversized vector still gets a chunk of its own.
+
+        :param vectors: Vectors in Pinecone upsert format
+        :return: List of vector chunks
+        """
+        max_bytes = settings.PINECONE_UPSERT_MAX_REQUEST_BYTES
+        max_count = settings.PINECONE_UPSERT_MAX_VECTORS_PER_REQUEST
+        # Room for the {"vectors": [...], "namespace": ...} envelope
+        envelope_bytes = 256
+
+        chunks = []
+        current = []
+        current_bytes = envelope_bytes
+        for vector in vectors:
+            vector_bytes = len(json.dumps(vector, separators=(",", ":"))) + 1
+            if current and (
+                current_bytes + vector_bytes > max_bytes
+                or len(current) >= max_count
+            ):
+                chunks.append(current)
+                current = []
+                current_bytes = envelope_bytes
+            current.append(vector)
+            current_bytes += vector_bytes
+        if current:
+            chunks.append(current)
+        return chunks
+
+    @staticmethod
+    def _is_retryable_upsert_error(error: BaseException) -> bool:
+        """Rate limits, server errors and transport failures may pass later"""
+        # upsert_vectors re-raises httpx errors as HTTPException
+        cause = error.__cause__ or error.__context__ or error
+        if isinstance(cause, httpx.HTTPStatusError):
+            status_code = cause.response.status_code
+            return status_code == 429 or status_code >= 500
+        return isinstance(cause, httpx.TransportError)
+
+    async def upsert_vectors_chunked(
+        self, index_host: str, vectors: list, namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Upsert vectors as size-bounded chunks sent in parallel.
+
+        Chunks run under their own concurrency limit; after each round only
+        the chunks that failed with a rate limit, server or transport error
+        are retried, with linear backoff. Other failures, such as a 400 for
+        a wrong dimension, are reported without retrying.
+
+        :param index_host: Index data-plane host
+        :param vectors: Vectors in Pinecone upsert format
+        :param namespace: Target namespace
+        :return: Aggregate ``upsertedCount`` and the number of chunks sent
+        """
+        chunks = self.split_upsert_chunks(vectors)
+        if not chunks:
+            return {"upsertedCount": 0, "chunks": 0}
+
+        chunk_semaphore = asyncio.Semaphore(
+            settings.PINECONE_UPSERT_MAX_CONCURRENCY
+        )
+
+        async def send(chunk: list) -> Dict[str, Any]:
+            async with chunk_semaphore:
+                return await self.upsert_vectors(index_host, chunk, namespace)
+
+        upserted_count = 0
+        pending = list(range(len(chunks)))
+        rejected = []
+        last_errors: Dict[int, Exception] = {}
+        for attempt in range(settings.PINECONE_UPSERT_MAX_RETRIES + 1):
+            if not pending:
+                break
+            if attempt:
+                await asyncio.sleep(
+                    settings.PINECONE_UPSERT_RETRY_BACKOFF_SECONDS * attempt
+                )
+                loggers["pinecone"].warning(
+                    f"Retrying {len(pending)} failed upsert chunks (attempt {attempt})"
+                )
+
+            results = await asyncio.gather(
+                *[send(chunks[i]) for i in pending], return_exceptions=True
+            )
+            failed = []
+            for chunk_index, result in zip(pending, results):
+                if isinstance(result, Exception):
+                    last_errors[chunk_index] = result
+                    if self._is_retryable_upsert_error(result):
+                        failed.append(chunk_index)
+                    else:
+                        rejected.append(chunk_index)
+                else:
+                    upserted_count += result.get(
+                        "upsertedCount", len(chunks[chunk_index])
+                    )
+            pending = failed
+
+        loggers["pinecone"].info(
+            f"Upserted {upserted_count} vectors in {len(chunks)} chunks"
+        )
+        failed = rejected + pending
+        if failed:
+            failed_vectors = sum(len(chunks[i]) for i in failed)
+            error_msg = (
+                f"Error in chunked upsert: {len(failed)} of {len(chunks)} chunks "
+                f"({failed_vectors} vectors) failed, {len(rejected)} rejected "
+                f"without retry - {str(last_errors[failed[0]])}"
+            )
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "upsert_vectors_chunked",
+                    "operation": "upsert_vectors_chunked",
+                    "upserted_count": upserted_count,
+                    "failed_chunks": len(failed),
+                    "rejected_chunks": len(rejected),
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        return {"upsertedCount": upserted_count, "chunks": len(chunks)}
+
     async def upsert_vectors_simplified(
-        self, vectors: list, namespace: str = "default"
+        self,
+        vectors: list,
+        namespace: str = "default",
+        index_name: str = settings.PINECONE_INDEX_NAME,
     ) -> Dict[str, Any]:
         """Simplified upsert method that gets index host automatically"""
-        index_host = await self.get_index_host(settings.PINECONE_INDEX_NAME)
-        return await self.upsert_vectors(index_host, vectors, namespace)
+        index_host = await self.get_index_host(index_name)
+        try:
+            return await self.upsert_vectors_chunked(
+                index_host, vectors, namespace
+            )
+        finally:
+            # Even a partial failure may have written some chunks
+            self.retrieval_result_cache.bump_version(index_name)
 
     async def delete_vectors_simplified(
-        self, vector_ids: list, namespace: str = "default"
+        self,
+        vector_ids: list,
+        namespace: str = "default",
+        index_name: str = settings.PINECONE_INDEX_NAME,
     ) -> Dict[str, Any]:
         """Simplified delete method that gets index host automatically"""
         if not vector_ids:
             return {"deleted": 0}
+        index_host = await self.get_index_host(index_name)
+        try:
+            return await self.delete_vectors(index_host, vector_ids, namespace)
+        finally:
+            self.retrieval_result_cache.bump_version(index_name)
+
+    async def describe_index_stats(self, index_host: str) -> Dict[str, Any]:
+        """Vector counts per namespace and dimension of an index"""
+        headers = {
+            "Api-Key": self.pinecone_api_key,
+            "Content-Type": "application/json",
+            "X-Pinecone-API-Version": self.api_version,
+        }
+        url = self.describe_index_stats_url.format(index_host)
+
+        try:
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(url, headers=headers, json={})
+            response.raise_for_status()
+            return response.json()
+
+        except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
+            await self.error_repo.log_error(
+                error=exc,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "describe_index_stats",
+                    "url": url,
+                    "status_code": exc.response.status_code,
+                    "response_text": (
+                        exc.response.text
+                        if hasattr(exc.response, "text")
+                        else None
+                    ),
+                    "operation": "describe_index_stats",
+                },
+            )
+            error_msg = f"HTTP status error in describe index stats: {exc.response.text} - {str(exc)}"
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        except Exception as exc:
+            error_msg = f"Error in describe index stats: {str(exc)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "describe_index_stats",
+                    "url": url,
+                    "operation": "describe_index_stats",
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+    async def list_vector_ids(
+        self, index_host: str, namespace: str = "default"
+    ) -> List[str]:
+        """
+        List every vector ID in a namespace, following pagination.
+
+        :param index_host: Index data-plane host
+        :param namespace: Namespace to list
+        :return: Vector IDs
+        """
+        vector_ids, next_token = await self.list_vector_ids_page(
+            index_host, namespace
+        )
+        while next_token:
+            page_ids, next_token = await self.list_vector_ids_page(
+                index_host, namespace, next_token
+            )
+            vector_ids.extend(page_ids)
+        return vector_ids
+
+    async def list_vector_ids_page(
+        self,
+        index_host: str,
+        namespace: str = "default",
+        pagination_token: Optional[str] = None,
+        limit: int = 100,
+    ) -> Tuple[List[str], Optional[str]]:
+        """
+        List one page of vector IDs in a namespace.
+
+        :param index_host: Index data-plane host
+        :param namespace: Namespace to list
+        :param pagination_token: Token of the page to list; first page if None
+        :param limit: Maximum IDs per page
+        :return: Vector IDs and the token of the next page, None on the last
+        """
+        headers = {
+            "Api-Key": self.pinecone_api_key,
+            "X-Pinecone-API-Version": self.api_version,
+        }
+        url = self.list_vectors_url.format(index_host)
+        params = {"namespace": namespace, "limit": limit}
+        if pagination_token:
+            params["paginationToken"] = pagination_token
+
+        try:
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.get(url, headers=headers, params=params)
+            response.raise_for_status()
+            page = response.json()
+            return (
+                [vector["id"] for vector in page.get("vectors", [])],
+                page.get("pagination", {}).get("next"),
+            )
+
+        except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
+            await self.error_repo.log_error(
+                error=exc,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "list_vector_ids_page",
+                    "url": url,
+                    "status_code": exc.response.status_code,
+                    "response_text": (
+                        exc.response.text
+                        if hasattr(exc.response, "text")
+                        else None
+                    ),
+                    "operation": "list_vector_ids",
+                },
+            )
+            error_msg = f"HTTP status error listing vector ids: {exc.response.text} - {str(exc)}"
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        except Exception as exc:
+            error_msg = f"Error listing vector ids: {str(exc)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "list_vector_ids_page",
+                    "url": url,
+                    "operation": "list_vector_ids",
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+    async def fetch_vectors(
+        self, index_host: str, vector_ids: list, namespace: str = "default"
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch stored vectors by ID.
+
+        :param index_host: Index data-plane host
+        :param vector_ids: IDs to fetch; missing IDs are skipped
+        :param namespace: Namespace holding the vectors
+        :return: Vectors in upsert format (``sparse_values`` key)
+        """
+        headers = {
+            "Api-Key": self.pinecone_api_key,
+            "X-Pinecone-API-Version": self.api_version,
+        }
+        url = self.fetch_vectors_url.format(index_host)
+
+        try:
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.get(
+                url,
+                headers=headers,
+                params={"ids": vector_ids, "namespace": namespace},
+            )
+            response.raise_for_status()
+            vectors = []
+            for vector in response.json().get("vectors", {}).values():
+                fetched = {
+                    "id": vector["id"],
+                    "values": vector.get("values", []),
+                    "metadata": vector.get("metadata", {}),
+                }
+                if vector.get("sparseValues"):
+                    fetched["sparse_values"] = vector["sparseValues"]
+                vectors.append(fetched)
+            return vectors
+
+        except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
+            await self.error_repo.log_error(
+                error=exc,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "fetch_vectors",
+                    "url": url,
+                    "status_code": exc.response.status_code,
+                    "response_text": (
+                        exc.response.text
+                        if hasattr(exc.response, "text")
+                        else None
+                    ),
+                    "operation": "fetch_vectors",
+                },
+            )
+            error_msg = f"HTTP status error fetching vectors: {exc.response.text} - {str(exc)}"
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        except Exception as exc:
+            error_msg = f"Error fetching vectors: {str(exc)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "fetch_vectors",
+                    "url": url,
+                    "operation": "fetch_vectors",
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+    async def fetch_metadata(
+        self, index_host: str, vector_ids: list, namespace: str = "default"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Metadata for the given vectors, from the metadata cache where
+        possible and fetched by ID otherwise.
+
+        :param index_host: Index data-plane host
+        :param vector_ids: Vector IDs
+        :param namespace: Namespace holding the vectors
+        :return: Metadata by vector ID; IDs Pinecone no longer has are absent
+        """
+        found, missing = self.vector_metadata_cache.get_many(
+            index_host, namespace, vector_ids
+        )
+        if missing:
+            batch_size = settings.PINECONE_FETCH_BATCH_SIZE
+            batches = await asyncio.gather(
+                *[
+                    self.fetch_vectors(
+                        index_host, missing[i : i + batch_size], namespace
+                    )
+                    for i in range(0, len(missing), batch_size)
+                ]
+            )
+            fetched = [vector for batch in batches for vector in batch]
+            self.vector_metadata_cache.put_many(index_host, namespace, fetched)
+            self.vector_metadata_cache.fetched += len(fetched)
+            found.update(
+                {vector["id"]: vector.get("metadata") or {} for vector in fetched}
+            )
+        return found
+
+    def uses_integrated_inference(self, index_name: str) -> bool:
+        return index_name in settings.PINECONE_INTEGRATED_INFERENCE_INDEXES
+
+    async def search_records(
+        self,
+        index_host: str,
+        query_text: str,
+        top_k: int,
+        fields: list,
+        filter_dict: dict | None = None,
+        rerank_top_n: int | None = None,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Search an integrated-embedding index by text, with optional hosted
+        rerank, in a single request.
+
+        :param index_host: Index data-plane host
+        :param query_text: Query text embedded server-side
+        :param top_k: Number of candidates retrieved before reranking
+        :param fields: Record fields to return
+        :param filter_dict: Optional metadata filter
+        :param rerank_top_n: Rerank with the hosted model and keep this many
+        :param namespace: Namespace to search
+        :return: Pinecone search response (``result.hits``)
+        """
+        headers = {
+            "Api-Key": self.pinecone_api_key,
+            "Content-Type": "application/json",
+            "X-Pinecone-API-Version": self.api_version,
+        }
+
+        query = {"inputs": {"text": query_text}, "top_k": top_k}
+        if filter_dict:
+            query["filter"] = filter_dict
+        payload = {"query": query, "fields": fields}
+        if rerank_top_n:
+            payload["rerank"] = {
+                "model": settings.PINECONE_HOSTED_RERANK_MODEL,
+                "rank_fields": [settings.PINECONE_INTEGRATED_TEXT_FIELD],
+                "top_n": rerank_top_n,
+            }
+
+        url = self.search_records_url.format(index_host, namespace)
+        try:
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            response = await client.post(url, headers=headers, json=payload)
+            response.raise_for_status()
+            loggers["pinecone"].info(
+                f"pinecone integrated search usage: {response.json().get('usage', {})}"
+            )
+            return response.json()
+
+        except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
+            await self.error_repo.log_error(
+                error=exc,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "search_records",
+                    "url": url,
+                    "status_code": exc.response.status_code,
+                    "response_text": (
+                        exc.response.text
+                        if hasattr(exc.response, "text")
+                        else None
+                    ),
+                    "operation": "search_records",
+                },
+            )
+            error_msg = f"HTTP status error in integrated search: {exc.response.text} - {str(exc)}"
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        except Exception as exc:
+            error_msg = f"Error in integrated search: {str(exc)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "search_records",
+                    "url": url,
+                    "operation": "search_records",
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+    async def upsert_records(
+        self, index_host: str, records: list, namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Upsert text records into an integrated-embedding index; Pinecone
+        embeds the configured text field server-side.
+
+        :param index_host: Index data-plane host
+        :param records: Records with ``_id`` and text/metadata fields
+        :param namespace: Target namespace
+        :return: Number of records upserted
+        """
+        headers = {
+            "Api-Key": self.pinecone_api_key,
+            "Content-Type": "application/x-ndjson",
+            "X-Pinecone-API-Version": self.api_version,
+        }
+        url = self.upsert_records_url.format(index_host, namespace)
+        batch_size = settings.PINECONE_UPSERT_RECORDS_BATCH_SIZE
+
+        try:
+            client = self.http_clients.get_client(PINECONE_INDEX)
+            for i in range(0, len(records), batch_size):
+                body = "\n".join(
+                    json.dumps(record) for record in records[i : i + batch_size]
+                )
+                response = await client.post(url, headers=headers, content=body)
+                response.raise_for_status()
+            return {"upsertedCount": len(records)}
+
+        except httpx.HTTPStatusError as exc:
+            self._invalidate_missing_index(index_host, exc)
+            await self.error_repo.log_error(
+                error=exc,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "upsert_records",
+                    "url": url,
+                    "status_code": exc.response.status_code,
+                    "response_text": (
+                        exc.response.text
+                        if hasattr(exc.response, "text")
+                        else None
+                    ),
+                    "operation": "upsert_records",
+                },
+            )
+            error_msg = f"Error in upsert records http status error : {str(exc)} - {exc.response.text}"
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+        except Exception as exc:
+            error_msg = f"Error in upsert records: {str(exc)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_service.py",
+                    "method": "upsert_records",
+                    "url": url,
+                    "operation": "upsert_records",
+                },
+            )
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=error_msg,
+            )
+
+    async def upsert_records_simplified(
+        self, records: list, namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """Simplified records upsert that gets index host automatically"""
         index_host = await self.get_index_host(settings.PINECONE_INDEX_NAME)
-        return await self.delete_vectors(index_host, vector_ids, namespace)
+        try:
+            return await self.upsert_records(index_host, records, namespace)
+        finally:
+            self.retrieval_result_cache.bump_version(
+                settings.PINECONE_INDEX_NAME
+            )
+
+    def is_index_host_cached(self, index_name: str) -> bool:
+        return self.index_metadata_cache.peek(index_name) is not None
+
+    async def warm_index_metadata(self, index_names: list):
+        """Resolve index hosts ahead of the first request"""
+        results = await asyncio.gather(
+            *[self.get_index_host(name) for name in index_names],
+            return_exceptions=True,
+        )
+        for index_name, result in zip(index_names, results):
+            if isinstance(result, Exception):
+                loggers["pinecone"].warning(
+                    f"Index metadata warm-up failed for {index_name}: {str(result)}"
+                )
+            else:
+                loggers["pinecone"].info(
+                    f"Index metadata warmed for {index_name}: {result}"
+                )
@@ -0,0 +1,79 @@
+from typing import Any, Dict, List, Optional
+
+from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.vector_store import VectorStore
+
+
+class PineconeVectorStore(VectorStore):
+    """VectorStore backed by a Pinecone serverless index over REST."""
+
+    is_remote = True
+
+    def __init__(
+        self, pinecone_service: PineconeService, index_name: str
+    ) -> None:
+        super().__init__(index_name)
+        self.pinecone_service = pinecone_service
+
+    async def upsert(
+        self, vectors: List[Dict], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        return await self.pinecone_service.upsert_vectors_simplified(
+            vectors, namespace, index_name=self.index_name
+        )
+
+    async def query(
+        self,
+        vector: List[float],
+        sparse_vector: Optional[Dict] = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        filter_dict: Optional[Dict] = None,
+        include_metadata: bool = True,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        host = await self.pinecone_service.get_index_host(
+            index_name=self.index_name
+        )
+        if sparse_vector is not None:
+            return await self.pinecone_service.pinecone_hybrid_query(
+                host,
+                namespace,
+                top_k,
+                alpha,
+                vector,
+                sparse_vector,
+                include_metadata,
+                filter_dict,
+            )
+        return await self.pinecone_service.pinecone_query(
+            index_host=host,
+            namespace=namespace,
+            top_k=top_k,
+            vector=vector,
+            include_metadata=include_metadata,
+            filter_dict=filter_dict,
+        )
+
+    async def delete(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        return await self.pinecone_service.delete_vectors_simplified(
+            ids, namespace, index_name=self.index_name
+        )
+
+    async def fetch_metadata(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Dict[str, Any]]:
+        host = await self.pinecone_service.get_index_host(
+            index_name=self.index_name
+        )
+        return await self.pinecone_service.fetch_metadata(
+            host, ids, namespace
+        )
+
+    async def describe(self) -> Dict[str, Any]:
+        host = await self.pinecone_service.get_index_host(
+            index_name=self.index_name
+        )
+        return await self.pinecone_service.describe_index_stats(host)
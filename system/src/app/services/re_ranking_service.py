@@ -1,26 +1,104 @@
 import httpx
 from fastapi import Depends, HTTPException, status
 
+from system.src.app.config.http_client import (
+    VOYAGEAI,
+    HttpClientRegistry,
+    http_client_registry,
+)
 from system.src.app.repositories.error_repository import ErrorRepo
 from system.src.app.config.settings import settings
+from system.src.app.services.rerank_score_cache import (
+    RerankScoreCache,
+    rerank_score_cache,
+)
 from system.src.app.utils.logging_utils import loggers
 
 
 class RerankerService:
-    def __init__(self, error_repo: ErrorRepo = Depends(ErrorRepo)):
+    def __init__(
+        self,
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+        http_clients: HttpClientRegistry = Depends(
+            lambda: http_client_registry
+        ),
+        rerank_score_cache: RerankScoreCache = Depends(
+            lambda: rerank_score_cache
+        ),
+    ):
         self.voyage_api_key = settings.VOYAGEAI_API_KEY
         self.voyage_base_url = settings.VOYAGEAI_BASE_URL
         self.RERANK_SUFFIX = "rerank"
-        self.timeout = httpx.Timeout(
-            connect=60.0,  # Time to establish a connection
-            read=120.0,  # Time to read the response
-            write=120.0,  # Time to send data
-            pool=60.0,  # Time to wait for a connection from the pool
-        )
         self.error_repo = error_repo
-        
+        self.http_clients = http_clients
+        self.rerank_score_cache = rerank_score_cache
+
     async def voyage_rerank(
         self, model_name: str, query: str, documents: list, top_n: int
+    ):
+        """
+        Rerank documents for a query, scoring only uncached pairs with Voyage.
+
+        Cached and fresh scores are merged before the ``top_n`` cut, so the
+        result matches a full rerank of ``documents``.
+
+        :param model_name: Voyage rerank model
+        :param query: Query text
+        :param documents: Candidate document texts
+        :param top_n: Number of results to keep
+        :return: Voyage-shaped response: ``data`` items with index and relevance_score
+        """
+        if not settings.RERANK_CACHE_ENABLED:
+            return await self._voyage_rerank_request(
+                model_name, query, documents, top_n
+            )
+
+        keys = self.rerank_score_cache.make_keys(model_name, query, documents)
+        scores = self.rerank_score_cache.get_many(keys)
+        missing = [i for i, score in enumerate(scores) if score is None]
+
+        usage = {}
+        if missing:
+            response = await self._voyage_rerank_request(
+                model_name,
+                query,
+                [documents[i] for i in missing],
+                len(missing),
+            )
+            usage = response.get("usage", {})
+            fresh = {
+                missing[item["index"]]: item.get("relevance_score", 0)
+                for item in response.get("data", [])
+            }
+            for position, score in fresh.items():
+                scores[position] = score
+            self.rerank_score_cache.put_many(
+                [keys[i] for i in fresh], list(fresh.values())
+            )
+
+        ranked = sorted(
+            (
+                (position, score)
+                for position, score in enumerate(scores)
+                if score is not None
+            ),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:top_n]
+        loggers["voyageai"].info(
+            f"Rerank scored {len(missing)} of {len(documents)} documents with Voyage, {len(documents) - len(missing)} from cache"
+        )
+        return {
+            "data": [
+                {"index": position, "relevance_score": score}
+                for position, score in ranked
+            ],
+            "model": model_name,
+            "usage": usage,
+        }
+
+    async def _voyage_rerank_request(
+        self, model_name: str, query: str, documents: list, top_n: int
     ):
         headers = {
             "content-type": "application/json",
@@ -37,17 +115,15 @@ class RerankerService:
         rerank_url = f"{self.voyage_base_url}/{self.RERANK_SUFFIX}"
 
         try:
-            async with httpx.AsyncClient(
-                verify=False, timeout=self.timeout
-            ) as client:
-                response = await client.post(
-                    rerank_url, headers=headers, json=payload
-                )
-                response.raise_for_status()
-                loggers["voyageai"].info(
-                    f"Reranking model hosted by Voyage tokens usage : {response.json().get('usage', {})}"
-                )
-                return response.json()
+            client = self.http_clients.get_client(VOYAGEAI)
+            response = await client.post(
+                rerank_url, headers=headers, json=payload
+            )
+            response.raise_for_status()
+            loggers["voyageai"].info(
+                f"Reranking model hosted by Voyage tokens usage : {response.json().get('usage', {})}"
+            )
+            return response.json()
         except httpx.HTTPStatusError as exc:
             await self.error_repo.log_error(
                 error=exc,
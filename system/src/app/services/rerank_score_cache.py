@@ -0,0 +1,71 @@
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from system.src.app.config.settings import settings
+from system.src.app.services.embedding_cache import EmbeddingCache
+
+PairKey = Tuple[str, str, str]
+
+
+class RerankScoreCache:
+    """
+    Bounded LRU of reranker relevance scores keyed on
+    (model, query hash, document hash).
+
+    Scores from a cross-encoder depend only on the (query, document) pair,
+    so they can be reused across calls whose candidate lists overlap.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[PairKey, float]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _hash(text: str) -> str:
+        return hashlib.sha256(
+            EmbeddingCache.normalize_text(text).encode("utf-8")
+        ).hexdigest()
+
+    def make_keys(
+        self, model: str, query: str, documents: List[str]
+    ) -> List[PairKey]:
+        query_hash = self._hash(query)
+        return [(model, query_hash, self._hash(doc)) for doc in documents]
+
+    def get_many(self, keys: List[PairKey]) -> List[Optional[float]]:
+        scores = []
+        for key in keys:
+            score = self.entries.get(key)
+            if score is None:
+                self.misses += 1
+            else:
+                self.entries.move_to_end(key)
+                self.hits += 1
+            scores.append(score)
+        return scores
+
+    def put_many(self, keys: List[PairKey], scores: List[float]):
+        for key, score in zip(keys, scores):
+            self.entries[key] = score
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Shared (query, document) rerank score cache
+rerank_score_cache = RerankScoreCache(
+    max_entries=settings.RERANK_CACHE_MAX_ENTRIES
+)
@@ -0,0 +1,111 @@
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from system.src.app.config.settings import settings
+from system.src.app.services.embedding_cache import EmbeddingCache
+from system.src.app.utils.logging_utils import loggers
+
+ResultKey = Tuple[Any, ...]
+
+
+class RetrievalResultCache:
+    """
+    LRU + TTL cache of reranked retrieval results.
+
+    Keys cover everything that changes the result: normalized query, index
+    name, categories filter, top_k, alpha, top_n and hybrid mode. Each index
+    also has a version that is part of the key; writes to an index bump its
+    version so stale results can never be served after an upsert or delete.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        default_ttl_seconds: float,
+        index_ttl_seconds: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.default_ttl_seconds = default_ttl_seconds
+        self.index_ttl_seconds = index_ttl_seconds or {}
+        self.entries: "OrderedDict[ResultKey, Tuple[float, Any]]" = OrderedDict()
+        self.index_versions: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        query: str,
+        index_name: str,
+        categories: Optional[list],
+        top_k: int,
+        alpha: float,
+        top_n: int,
+        is_hybrid: bool = True,
+    ) -> ResultKey:
+        return (
+            index_name,
+            self.index_versions.get(index_name, 0),
+            EmbeddingCache.normalize_text(query),
+            tuple(sorted(categories)) if categories else (),
+            top_k,
+            alpha,
+            top_n,
+            is_hybrid,
+        )
+
+    def get(self, key: ResultKey) -> Optional[Any]:
+        entry = self.entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: ResultKey, value: Any):
+        index_name, version = key[0], key[1]
+        # A write landed while this result was being computed
+        if version != self.index_versions.get(index_name, 0):
+            return
+        ttl = self.index_ttl_seconds.get(index_name, self.default_ttl_seconds)
+        self.entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def bump_version(self, index_name: str):
+        """Invalidate every cached result for ``index_name``."""
+        self.index_versions[index_name] = (
+            self.index_versions.get(index_name, 0) + 1
+        )
+        for key in [key for key in self.entries if key[0] == index_name]:
+            del self.entries[key]
+        loggers["main"].info(
+            f"Retrieval cache invalidated for {index_name} "
+            f"(version {self.index_versions[index_name]})"
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "index_versions": dict(self.index_versions),
+        }
+
+
+# Shared cache of reranked retrieval results
+retrieval_result_cache = RetrievalResultCache(
+    max_entries=settings.RETRIEVAL_CACHE_MAX_ENTRIES,
+    default_ttl_seconds=settings.RETRIEVAL_CACHE_TTL_SECONDS,
+    index_ttl_seconds={
+        settings.ROCKET_DOCS_PINECONE_INDEX_NAME: settings.ROCKET_DOCS_RETRIEVAL_CACHE_TTL_SECONDS,
+    },
+)
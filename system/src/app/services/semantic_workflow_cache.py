@@ -0,0 +1,128 @@
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from system.src.app.config.settings import settings
+
+CATEGORIZATION = "categorization"
+RETRIEVAL = "retrieval"
+DRAFT = "draft"
+
+# Stages each tier lets the workflow skip, best first
+TIERS = (DRAFT, RETRIEVAL, CATEGORIZATION)
+
+
+class SemanticWorkflowCache:
+    """
+    Local vector index of recently completed draft workflows.
+
+    Unit-normalized email embeddings live in a preallocated float32 ring
+    buffer; a lookup is one matrix-vector product. The best match's cosine
+    similarity decides how much of the stored workflow can be reused:
+    the categorization, the categorization plus retrieval results, or the
+    final draft as well.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        thresholds: Dict[str, float],
+        excluded_categories: List[str],
+    ) -> None:
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.thresholds = thresholds
+        self.excluded_categories = set(excluded_categories)
+        self.vectors: Optional[np.ndarray] = None
+        self.expires_at = np.zeros(max_entries, dtype=np.float64)
+        self.payloads: List[Optional[Dict[str, Any]]] = [None] * max_entries
+        self.next_slot = 0
+        self.size = 0
+        self.lookups = 0
+        self.tier_hits = {tier: 0 for tier in TIERS}
+        self.gemini_calls_saved = 0
+        self.retrievals_saved = 0
+
+    @staticmethod
+    def _normalize(vector: List[float]) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(array)
+        return array / norm if norm else array
+
+    def is_excluded(self, categories: Optional[list]) -> bool:
+        return bool(self.excluded_categories.intersection(categories or []))
+
+    def tier_for(self, score: float) -> Optional[str]:
+        for tier in TIERS:
+            if score >= self.thresholds[tier]:
+                return tier
+        return None
+
+    def lookup(
+        self, vector: List[float]
+    ) -> Tuple[Optional[str], float, Optional[Dict[str, Any]]]:
+        """
+        Find the closest live workflow.
+
+        :param vector: Embedding of the incoming email
+        :return: Reuse tier (or None), cosine similarity and stored payload
+        """
+        self.lookups += 1
+        if self.vectors is None or not self.size:
+            return None, 0.0, None
+
+        scores = self.vectors[: self.size] @ self._normalize(vector)
+        scores[self.expires_at[: self.size] <= time.monotonic()] = -1.0
+        best = int(np.argmax(scores))
+        score = float(scores[best])
+        tier = self.tier_for(score)
+        if tier is None:
+            return None, score, None
+        return tier, score, self.payloads[best]
+
+    def record_hit(self, tier: str, gemini_calls_saved: int):
+        self.tier_hits[tier] += 1
+        self.gemini_calls_saved += gemini_calls_saved
+        if tier in (DRAFT, RETRIEVAL):
+            self.retrievals_saved += 1
+
+    def store(self, vector: List[float], payload: Dict[str, Any]):
+        normalized = self._normalize(vector)
+        if self.vectors is None:
+            self.vectors = np.zeros(
+                (self.max_entries, len(normalized)), dtype=np.float32
+            )
+        slot = self.next_slot
+        self.vectors[slot] = normalized
+        self.expires_at[slot] = time.monotonic() + self.ttl_seconds
+        self.payloads[slot] = payload
+        self.next_slot = (slot + 1) % self.max_entries
+        self.size = min(self.size + 1, self.max_entries)
+
+    def stats(self) -> Dict[str, Any]:
+        hits = sum(self.tier_hits.values())
+        return {
+            "entries": self.size,
+            "lookups": self.lookups,
+            "hits": hits,
+            "hit_rate": round(hits / self.lookups, 4) if self.lookups else 0.0,
+            "tier_hits": dict(self.tier_hits),
+            "gemini_calls_saved": self.gemini_calls_saved,
+            "retrievals_saved": self.retrievals_saved,
+            "thresholds": dict(self.thresholds),
+        }
+
+
+# Shared semantic cache of completed draft workflows
+semantic_workflow_cache = SemanticWorkflowCache(
+    max_entries=settings.SEMANTIC_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.SEMANTIC_CACHE_TTL_SECONDS,
+    thresholds={
+        DRAFT: settings.SEMANTIC_CACHE_DRAFT_THRESHOLD,
+        RETRIEVAL: settings.SEMANTIC_CACHE_RETRIEVAL_THRESHOLD,
+        CATEGORIZATION: settings.SEMANTIC_CACHE_CATEGORIZATION_THRESHOLD,
+    },
+    excluded_categories=settings.SEMANTIC_CACHE_EXCLUDED_CATEGORIES,
+)
@@ -0,0 +1,135 @@
+import asyncio
+import functools
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from system.src.app.config.settings import settings
+from system.src.app.services.bm25_encoder import (
+    BM25EncoderHolder,
+    bm25_encoder_holder,
+)
+from system.src.app.utils.logging_utils import loggers
+
+
+def _warm_worker():
+    # Runs once per worker process so the first batch does not pay the load
+    bm25_encoder_holder.warm_up()
+
+
+def _encode_with(
+    holder: BM25EncoderHolder, texts: List[str]
+) -> List[Dict[str, List]]:
+    if settings.BM25_VECTORIZED_ENCODER_ENABLED:
+        return holder.get_batch_encoder().encode_documents(
+            texts, top_n=settings.BM25_SPARSE_TOP_N or None
+        )
+    return holder.get().encode_documents(texts)
+
+
+def _encode_documents(texts: List[str]) -> List[Dict[str, List]]:
+    return _encode_with(bm25_encoder_holder, texts)
+
+
+class SparseEncodingExecutor:
+    """
+    Runs BM25 sparse encoding off the event loop.
+
+    Query-sized inputs go to a small thread pool (cheap hand-off, the
+    encoder is already loaded in-process); inputs of at least
+    ``process_threshold`` texts go to a process pool so ingestion batches
+    do not contend for the GIL with request handling.
+    """
+
+    def __init__(
+        self, thread_workers: int, process_workers: int, process_threshold: int
+    ) -> None:
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self.process_threshold = process_threshold
+        self.thread_pool: Optional[ThreadPoolExecutor] = None
+        self.process_pool: Optional[ProcessPoolExecutor] = None
+        self.thread_batches = 0
+        self.process_batches = 0
+        self.encode_seconds = 0.0
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self.thread_pool is None:
+            self.thread_pool = ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="sparse-encoding",
+            )
+        return self.thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self.process_pool is None:
+            self.process_pool = ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context(
+                    settings.SPARSE_ENCODING_PROCESS_START_METHOD
+                ),
+                initializer=_warm_worker,
+            )
+        return self.process_pool
+
+    def uses_process_pool(self, size: int) -> bool:
+        return self.process_workers > 0 and size >= self.process_threshold
+
+    async def encode_documents(
+        self, texts: List[str], encoder: Optional[BM25EncoderHolder] = None
+    ) -> List[Dict[str, List]]:
+        """
+        Encode ``texts`` with the BM25 encoder without blocking the loop.
+
+        :param texts: Texts to encode
+        :param encoder: Another encoder than the shared one, e.g. a
+            migration target's; it is only loaded in this process, so it
+            always runs on the thread pool
+        :return: One ``{"indices", "values"}`` sparse vector per text
+        """
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        if encoder is not None:
+            self.thread_batches += 1
+            result = await loop.run_in_executor(
+                self._get_thread_pool(),
+                functools.partial(_encode_with, encoder, texts),
+            )
+        elif self.uses_process_pool(len(texts)):
+            self.process_batches += 1
+            result = await loop.run_in_executor(
+                self._get_process_pool(), _encode_documents, texts
+            )
+        else:
+            self.thread_batches += 1
+            result = await loop.run_in_executor(
+                self._get_thread_pool(), _encode_documents, texts
+            )
+        self.encode_seconds += time.perf_counter() - start
+        return result
+
+    def shutdown(self):
+        if self.thread_pool is not None:
+            self.thread_pool.shutdown(wait=False, cancel_futures=True)
+            self.thread_pool = None
+        if self.process_pool is not None:
+            self.process_pool.shutdown(wait=True, cancel_futures=True)
+            self.process_pool = None
+        loggers["main"].info("Sparse encoding executor shut down")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "thread_batches": self.thread_batches,
+            "process_batches": self.process_batches,
+            "process_threshold": self.process_threshold,
+            "encode_seconds": round(self.encode_seconds, 4),
+        }
+
+
+# Shared executor for BM25 sparse encoding
+sparse_encoding_executor = SparseEncodingExecutor(
+    thread_workers=settings.SPARSE_ENCODING_THREAD_WORKERS,
+    process_workers=settings.SPARSE_ENCODING_PROCESS_WORKERS,
+    process_threshold=settings.SPARSE_ENCODING_PROCESS_THRESHOLD,
+)
@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from system.src.app.config.settings import settings
+
+MetadataKey = Tuple[str, str, str]
+
+
+class VectorMetadataCache:
+    """
+    Bounded LRU of stored vector metadata keyed on
+    (index host, namespace, vector ID).
+
+    Filled write-through by upserts and by fetch-by-ID calls, and evicted
+    by deletes, so ID-only queries can attach metadata locally instead of
+    carrying every match's full metadata in the query response.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self.entries: "OrderedDict[MetadataKey, Dict[str, Any]]" = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.fetched = 0
+
+    def get_many(
+        self, index_host: str, namespace: str, vector_ids: List[str]
+    ) -> Tuple[Dict[str, Dict[str, Any]], List[str]]:
+        """
+        :return: Cached metadata by ID and the IDs that were not cached
+        """
+        found, missing = {}, []
+        for vector_id in vector_ids:
+            key = (index_host, namespace, vector_id)
+            metadata = self.entries.get(key)
+            if metadata is None:
+                self.misses += 1
+                missing.append(vector_id)
+            else:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                found[vector_id] = metadata
+        return found, missing
+
+    def put_many(self, index_host: str, namespace: str, vectors: List[Dict]):
+        for vector in vectors:
+            key = (index_host, namespace, vector["id"])
+            self.entries[key] = vector.get("metadata") or {}
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def evict(self, index_host: str, namespace: str, vector_ids: List[str]):
+        for vector_id in vector_ids:
+            self.entries.pop((index_host, namespace, vector_id), None)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetched": self.fetched,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# Shared metadata cache for two-phase retrieval
+vector_metadata_cache = VectorMetadataCache(
+    max_entries=settings.VECTOR_METADATA_CACHE_MAX_ENTRIES
+)
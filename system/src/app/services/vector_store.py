@@ -0,0 +1,85 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+
+class VectorStore(ABC):
+    """
+    Backend-neutral access to one vector index.
+
+    Requests and responses use Pinecone's shapes: vectors are dicts with
+    ``id``, ``values``, ``sparse_values`` and ``metadata``, and a query
+    returns ``{"matches": [{"id", "score", "metadata"}]}``, so callers
+    format results the same way whichever backend serves the index.
+    """
+
+    # Whether results cross the network, so payload size matters
+    is_remote = False
+
+    def __init__(self, index_name: str) -> None:
+        self.index_name = index_name
+
+    @abstractmethod
+    async def upsert(
+        self, vectors: List[Dict], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Insert or overwrite vectors by ID.
+
+        :param vectors: Vectors in Pinecone upsert format
+        :param namespace: Target namespace
+        :return: ``upsertedCount``
+        """
+
+    @abstractmethod
+    async def query(
+        self,
+        vector: List[float],
+        sparse_vector: Optional[Dict] = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        filter_dict: Optional[Dict] = None,
+        include_metadata: bool = True,
+        namespace: str = "default",
+    ) -> Dict[str, Any]:
+        """
+        Dense query, or hybrid query weighted by ``alpha`` when a sparse
+        vector is given.
+
+        :param vector: Dense query vector
+        :param sparse_vector: Sparse query vector with indices and values
+        :param alpha: Dense weight; the sparse vector gets ``1 - alpha``
+        :param filter_dict: Pinecone metadata filter, e.g. ``$in``
+        :return: Pinecone-shaped query response
+        """
+
+    @abstractmethod
+    async def delete(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Any]:
+        """
+        Delete vectors by ID.
+
+        :param ids: Vector IDs
+        :param namespace: Namespace holding the vectors
+        :return: ``deleted`` count
+        """
+
+    @abstractmethod
+    async def fetch_metadata(
+        self, ids: List[str], namespace: str = "default"
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Stored metadata of the given vectors.
+
+        :param ids: Vector IDs
+        :param namespace: Namespace holding the vectors
+        :return: Metadata by vector ID; unknown IDs are absent
+        """
+
+    @abstractmethod
+    async def describe(self) -> Dict[str, Any]:
+        """
+        Index statistics in Pinecone's ``describe_index_stats`` shape.
+
+        :return: dimension, totalVectorCount and per-namespace vectorCount
+        """
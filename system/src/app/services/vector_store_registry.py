@@ -0,0 +1,129 @@
+import os
+from typing import Any, Callable, Dict, List, Optional
+
+from system.src.app.config.settings import settings
+from system.src.app.services.dataset_index_replica import (
+    DatasetIndexReplica,
+    dataset_index_replica,
+)
+from system.src.app.services.local_vector_store import LocalVectorStore
+from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.pinecone_vector_store import PineconeVectorStore
+from system.src.app.services.retrieval_result_cache import (
+    retrieval_result_cache,
+)
+from system.src.app.services.vector_store import VectorStore
+from system.src.app.utils.logging_utils import loggers
+
+
+class VectorStoreRegistry:
+    """
+    Chooses the VectorStore backend per index.
+
+    Indexes listed as local are served by a process-wide LocalVectorStore
+    persisted under ``directory/<index name>``; every other index goes to
+    Pinecone through a thin adapter over the caller's PineconeService.
+    Queries against the dataset index are served by its read replica
+    while the replica is fresh.
+    """
+
+    def __init__(
+        self,
+        local_index_names: List[str],
+        directory: str,
+        metric: str,
+        persist_on_write: bool,
+        on_write: Optional[Callable[[str], None]] = None,
+        replica: Optional[DatasetIndexReplica] = None,
+        persist_delay_seconds: float = 5.0,
+    ) -> None:
+        self.local_index_names = set(local_index_names)
+        self.directory = directory
+        self.metric = metric
+        self.persist_on_write = persist_on_write
+        self.on_write = on_write
+        self.replica = replica
+        self.persist_delay_seconds = persist_delay_seconds
+        self.local_stores: Dict[str, LocalVectorStore] = {}
+
+    def is_local(self, index_name: str) -> bool:
+        return index_name in self.local_index_names
+
+    def local(self, index_name: str) -> LocalVectorStore:
+        store = self.local_stores.get(index_name)
+        if store is None:
+            store = LocalVectorStore(
+                index_name,
+                directory=os.path.join(self.directory, index_name),
+                metric=self.metric,
+                persist_on_write=self.persist_on_write,
+                on_write=self.on_write,
+                persist_delay_seconds=self.persist_delay_seconds,
+            )
+            if store.load():
+                loggers["main"].info(
+                    f"Loaded local vector store for {index_name}: {store.stats()['vectors']}"
+                )
+            self.local_stores[index_name] = store
+        return store
+
+    def get(
+        self, index_name: str, pinecone_service: PineconeService
+    ) -> VectorStore:
+        """
+        Return the backend serving ``index_name``.
+
+        :param index_name: Index name
+        :param pinecone_service: Used when the index is served by Pinecone
+        :return: Local store or Pinecone adapter
+        """
+        if self.is_local(index_name):
+            return self.local(index_name)
+        return PineconeVectorStore(pinecone_service, index_name)
+
+    def for_query(
+        self, index_name: str, pinecone_service: PineconeService
+    ) -> VectorStore:
+        """
+        Return the backend to read ``index_name`` from, preferring a fresh
+        read replica over Pinecone.
+
+        :param index_name: Index name
+        :param pinecone_service: Used when the index is served by Pinecone
+        :return: Local store, replica store or Pinecone adapter
+        """
+        if not self.is_local(index_name) and (
+            self.replica is not None and self.replica.serves(index_name)
+        ):
+            replica_store = self.replica.read_store()
+            if replica_store is not None:
+                return replica_store
+        return self.get(index_name, pinecone_service)
+
+    def warm_up(self):
+        """Load every local index so the first query skips disk reads"""
+        for index_name in self.local_index_names:
+            self.local(index_name)
+
+    async def flush(self):
+        """Persist pending local writes, e.g. at shutdown"""
+        for store in self.local_stores.values():
+            await store.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            index_name: store.stats()
+            for index_name, store in self.local_stores.items()
+        }
+
+
+# Shared backend selection for all index reads and writes
+vector_store_registry = VectorStoreRegistry(
+    local_index_names=settings.LOCAL_VECTOR_STORE_INDEXES,
+    directory=settings.LOCAL_VECTOR_STORE_DIR,
+    metric=settings.INDEXING_SIMILARITY_METRIC,
+    persist_on_write=settings.LOCAL_VECTOR_STORE_PERSIST_ON_WRITE,
+    on_write=retrieval_result_cache.bump_version,
+    replica=dataset_index_replica,
+    persist_delay_seconds=settings.LOCAL_VECTOR_STORE_PERSIST_DELAY_SECONDS,
+)
@@ -16,8 +16,28 @@ from system.src.app.utils.logging_utils import loggers
 class CategorizationHelper:
     def __init__(self):
         self.categories_file_path = "session-data/categories.json"
+        self.categories_mtime = self._get_categories_mtime()
         self.categories, self.category_descriptions = self._load_categories()
 
+    def _get_categories_mtime(self) -> float | None:
+        try:
+            return os.stat(self.categories_file_path).st_mtime
+        except OSError:
+            return None
+
+    def refresh_categories(self) -> None:
+        """
+        Reload categories only when the JSON file changed on disk, so a
+        long-lived helper stays in sync with /insert-data uploads without
+        re-reading the file on every request.
+        """
+        mtime = self._get_categories_mtime()
+        if mtime != self.categories_mtime:
+            self.categories, self.category_descriptions = (
+                self._load_categories()
+            )
+            self.categories_mtime = mtime
+
     def _load_categories(self) -> tuple[List[str], Dict[str, str]]:
         """
         Load categories and descriptions from JSON file.
@@ -74,6 +94,7 @@ class CategorizationHelper:
 
             with open(self.categories_file_path, "w", encoding="utf-8") as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
+            self.categories_mtime = self._get_categories_mtime()
 
             loggers["main"].info(
                 f"Categories updated and saved to {self.categories_file_path}"
@@ -146,6 +167,8 @@ class CategorizationHelper:
 
         :return: Formatted system prompt
         """
+        self.refresh_categories()
+
         # Format categories list
         categories_list = "\n".join(
             [f"- {category}" for category in self.categories]
@@ -1,9 +1,10 @@
 import json
 import os
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from fastapi import Depends, UploadFile
 
+from system.src.app.config.settings import settings
 from system.src.app.repositories.error_repository import ErrorRepo
 from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper import (
     DataInsertUsecaseHelper,
@@ -11,6 +12,10 @@ from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper imp
 from system.src.app.usecases.query_docs_usecases.query_docs_usecase import (
     QueryDocsUsecase,
 )
+from system.src.app.utils.streaming_json import (
+    iter_json_array_items,
+    iter_ndjson_lines,
+)
 
 
 class DataInsertUsecase:
@@ -26,44 +31,86 @@ class DataInsertUsecase:
         self.query_docs_usecase = query_docs_usecase
         self.error_repo = error_repo
 
-    async def _process_file(self, file: UploadFile):
-        try:
-            content = await file.read()
-            data = json.loads(content.decode("utf-8"))
-            categories = {"categories": data.get("categories", [])}
-            examples = data.get("examples", [])
+    @staticmethod
+    def is_ndjson(filename: Optional[str], content_type: Optional[str]) -> bool:
+        filename = (filename or "").lower()
+        content_type = (content_type or "").split(";")[0].strip()
+        return filename.endswith((".ndjson", ".jsonl")) or content_type in (
+            "application/x-ndjson",
+            "application/jsonl",
+        )
+
+    async def stream_examples(
+        self,
+        read: Callable[[int], Awaitable[bytes]],
+        ndjson: bool,
+        fields: Dict,
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield the examples of a dataset file without reading it whole.
+
+        JSON files are a single object whose "examples" array is parsed
+        item by item; other top-level keys such as "categories" are stored
+        in ``fields``. NDJSON files hold one example per line, and a line
+        without a "query" supplies top-level keys instead.
+
+        :param read: Async read(size) of the file, returning b"" at the end
+        :param ndjson: Whether the file is NDJSON
+        :param fields: Receives the non-example top-level keys
+        """
+        if ndjson:
+            async for line in iter_ndjson_lines(
+                read, settings.INGEST_STREAM_READ_CHUNK_BYTES
+            ):
+                if isinstance(line, dict) and "query" not in line:
+                    fields.update(line)
+                else:
+                    yield line
+        else:
+            async for example in iter_json_array_items(
+                read,
+                "examples",
+                fields.__setitem__,
+                chunk_size=settings.INGEST_STREAM_READ_CHUNK_BYTES,
+                max_value_bytes=settings.INGEST_STREAM_MAX_VALUE_BYTES,
+            ):
+                yield example
+
+    def save_categories(self, fields: Dict):
+        categories = {"categories": fields.get("categories", [])}
 
-            # Ensure the directory exists
-            os.makedirs("session-data", exist_ok=True)
-            with open("session-data/categories.json", "w") as f:
-                json.dump(categories, f)
-            return examples
+        # Ensure the directory exists
+        os.makedirs("session-data", exist_ok=True)
+        with open("session-data/categories.json", "w") as f:
+            json.dump(categories, f)
 
+    async def _ingest_file(self, file: UploadFile) -> Dict:
+        fields: Dict = {}
+        try:
+            ingest_result = (
+                await self.data_insert_usecase_helper.ingest_example_stream(
+                    self.stream_examples(
+                        file.read,
+                        self.is_ndjson(file.filename, file.content_type),
+                        fields,
+                    )
+                )
+            )
         except json.JSONDecodeError as e:
+            # Batches parsed before the error have already been upserted
             error_msg = f"Invalid JSON format: {str(e)}"
             await self.error_repo.log_error(
                 error=error_msg,
                 additional_context={
                     "file": "data_insert_usecase.py",
-                    "method": "_process_file",
+                    "method": "_ingest_file",
                     "operation": "json_decode",
                     "filename": file.filename if file else "unknown",
                 },
             )
             return {"error": error_msg}
-        except Exception as e:
-            error_msg = f"Error processing file: {str(e)}"
-            await self.error_repo.log_error(
-                error=error_msg,
-                additional_context={
-                    "file": "data_insert_usecase.py",
-                    "method": "_process_file",
-                    "operation": "file_processing",
-                    "filename": file.filename if file else "unknown",
-                    "response_text": error_msg,
-                },
-            )
-            return {"error": error_msg}
+        self.save_categories(fields)
+        return ingest_result
 
     async def execute(
         self,
@@ -72,34 +119,33 @@ class DataInsertUsecase:
     ):
         try:
             if file:
-                examples = await self._process_file(file)
+                # Uploads are streamed so memory stays bounded by batch size
+                ingest_result = await self._ingest_file(file)
+                if "error" in ingest_result:
+                    return ingest_result
             elif new_template:
                 # Handle new template data (list of dicts with response templates)
                 examples = new_template
                 print(f"Processing new template with {len(examples)} examples")
+                ingest_result = (
+                    await self.data_insert_usecase_helper.ingest_examples(
+                        examples
+                    )
+                )
+                ingest_result["examples_processed"] = len(examples)
             else:
                 return {"error": "No file or new template provided"}
 
-            embeddings = (
-                await self.data_insert_usecase_helper.generate_embeddings(
-                    examples
-                )
-            )
-            upsert_result = (
-                await self.data_insert_usecase_helper.upsert_chunks_in_pinecone(
-                    embeddings
-                )
-            )
-
             # query_rocket_docs = "What is the C.L.E.A.R. framework?"
             # query_dataset = "I've the doubt regarding the return of tokens, if you're available can you help me?"
             # query_dataset = "capital of france?"
             # response = await self.query_docs_usecase.query_docs(query_dataset, settings.PINECONE_INDEX_NAME)
             # response_rocket_docs = await self.query_docs_usecase.query_docs(query_rocket_docs, settings.ROCKET_DOCS_PINECONE_INDEX_NAME)
             return {
-                "examples_processed": len(examples),
-                "embeddings_generated": len(embeddings),
-                "upserted_count": upsert_result.get("upserted_count", 0),
+                "examples_processed": ingest_result["examples_processed"],
+                "embeddings_generated": ingest_result["embeddings_generated"],
+                "upserted_count": ingest_result["upserted_count"],
+                "batch_timings": ingest_result["batch_timings"],
                 # "query_response": response,
                 # "query_rocket_docs_response": response_rocket_docs,
                 "status": "success",
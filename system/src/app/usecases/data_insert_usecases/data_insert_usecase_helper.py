@@ -1,13 +1,35 @@
+import asyncio
 import hashlib
-from typing import Dict, List
+import time
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional
 
 from fastapi import Depends, HTTPException, status
 
 from system.src.app.config.settings import settings
 from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.repositories.reembed_migration_repository import (
+    ReembedMigrationRepository,
+)
 from system.src.app.services.api_service import ApiService
+from system.src.app.services.bm25_encoder import BM25EncoderHolder
+from system.src.app.services.category_namespaces import (
+    CategoryNamespaceLayout,
+    category_namespace_layout,
+)
 from system.src.app.services.embedding_service import EmbeddingService
+from system.src.app.services.index_migration_monitor import (
+    IndexMigrationMonitor,
+    index_migration_monitor,
+)
+from system.src.app.services.matryoshka_retrieval import (
+    MatryoshkaRetrieval,
+    matryoshka_retrieval,
+)
 from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.vector_store_registry import (
+    VectorStoreRegistry,
+    vector_store_registry,
+)
 from system.src.app.utils.logging_utils import loggers
 
 
@@ -18,76 +40,290 @@ class DataInsertUsecaseHelper:
         embedding_service: EmbeddingService = Depends(EmbeddingService),
         pinecone_service: PineconeService = Depends(PineconeService),
         error_repo: ErrorRepo = Depends(ErrorRepo),
+        vector_stores: VectorStoreRegistry = Depends(
+            lambda: vector_store_registry
+        ),
+        category_layout: CategoryNamespaceLayout = Depends(
+            lambda: category_namespace_layout
+        ),
+        matryoshka: MatryoshkaRetrieval = Depends(
+            lambda: matryoshka_retrieval
+        ),
+        migration_monitor: IndexMigrationMonitor = Depends(
+            lambda: index_migration_monitor
+        ),
+        migration_repository: ReembedMigrationRepository = Depends(
+            ReembedMigrationRepository
+        ),
     ):
         self.api_service = api_service
         self.embedding_service = embedding_service
         self.pinecone_service = pinecone_service
         self.error_repo = error_repo
+        self.vector_stores = vector_stores
+        self.category_layout = category_layout
+        self.matryoshka = matryoshka
+        self.migration_monitor = migration_monitor
+        self.migration_repository = migration_repository
 
     def _generate_vector_id(self, query: str, subject: str) -> str:
         """Generate a unique vector ID based on query and category"""
         combined = f"{query}_{subject}"
         return hashlib.sha256(combined.encode()).hexdigest()
 
+    def _batch_texts(self, batch: List[Dict]) -> List[str]:
+        return [
+            f"Subject: {example['subject']}\n{example['query']}"
+            for example in batch
+        ]
+
+    async def _embed_batch(self, batch: List[Dict]) -> List[Dict]:
+        texts = self._batch_texts(batch)
+        dense_embeddings, sparse_embeddings = await asyncio.gather(
+            self.embedding_service.pinecone_dense_embeddings(texts),
+            self.embedding_service.pinecone_sparse_embeddings(texts),
+        )
+        return [
+            {
+                "dense": dense_embeddings[j],
+                "sparse": sparse_embeddings[j],
+                "example": example,  # Include the original example data
+            }
+            for j, example in enumerate(batch)
+        ]
+
+    async def _log_batch_error(
+        self,
+        error: Exception,
+        batch_index: int,
+        batch_size: int,
+        total: Optional[int],
+    ):
+        error_msg = f"Error generating embeddings: {str(error)}"
+        await self.error_repo.log_error(
+            error=error_msg,
+            additional_context={
+                "file": "data_insert_usecase_helper.py",
+                "method": "generate_embeddings",
+                "operation": "batch_embedding_generation",
+                "response_text": error_msg,
+                "batch_index": batch_index,
+                "batch_size": batch_size,
+                "total_examples": total,
+            },
+        )
+
+    def _split_batches(self, examples: List[Dict]) -> List[List[Dict]]:
+        batch_size = settings.EMBEDDINGS_BATCH_SIZE
+        return [
+            examples[i : i + batch_size]
+            for i in range(0, len(examples), batch_size)
+        ]
+
     async def generate_embeddings(self, examples: List[Dict]) -> List[Dict]:
         if not examples:
             loggers["main"].info("No examples to embed")
             return []
 
-        batch_size = settings.EMBEDDINGS_BATCH_SIZE
-        all_embeddings = []
-
-        for i in range(0, len(examples), batch_size):
-            batch = examples[i : i + batch_size]
-            texts = [
-                f"Subject: {example['subject']}\n{example['query']}"
-                for example in batch
-            ]
+        batches = self._split_batches(examples)
 
+        async def embed(batch_index: int, batch: List[Dict]) -> List[Dict]:
             try:
-                dense_embeddings = (
-                    await self.embedding_service.pinecone_dense_embeddings(
-                        texts
-                    )
-                )
-                sparse_embeddings = (
-                    self.embedding_service.pinecone_sparse_embeddings(texts)
-                )
-
-                for j, example in enumerate(batch):
-                    embedding_data = {
-                        "dense": dense_embeddings[j],
-                        "sparse": sparse_embeddings[j],
-                        "example": example,  # Include the original example data
-                    }
-                    all_embeddings.append(embedding_data)
-
+                async with self.pinecone_service.semaphore:
+                    return await self._embed_batch(batch)
             except Exception as e:
-                error_msg = f"Error generating embeddings: {str(e)}"
-                await self.error_repo.log_error(
-                    error=error_msg,
-                    additional_context={
-                        "file": "data_insert_usecase_helper.py",
-                        "method": "generate_embeddings",
-                        "operation": "batch_embedding_generation",
-                        "response_text": error_msg,
-                        "batch_index": i // batch_size,
-                        "batch_size": len(batch),
-                        "total_examples": len(examples),
-                    },
+                await self._log_batch_error(
+                    e, batch_index, len(batch), len(examples)
                 )
-                continue
+                return []
+
+        results = await asyncio.gather(
+            *[embed(i, batch) for i, batch in enumerate(batches)]
+        )
+        all_embeddings = [item for result in results for item in result]
 
         loggers["main"].info(f"Generated {len(all_embeddings)} embeddings")
         return all_embeddings
 
-    async def upsert_chunks_in_pinecone(self, chunks: List[Dict]) -> Dict:
-        if not chunks:
-            return {"upserted_count": 0}
+    async def ingest_examples(self, examples: List[Dict]) -> Dict:
+        """
+        Embed and upsert examples batch by batch with bounded concurrency.
 
-        # Ensure index exists before upserting (safety check)
-        await self.ensure_pinecone_index_exists()
+        Each batch is upserted as soon as its own embeddings are ready, so
+        the embedding of one batch overlaps the upsert of another. The
+        shared Pinecone semaphore bounds in-flight upstream calls.
+
+        :param examples: Examples with subject, query, response, categories and from
+        :return: Embedding/upsert counts and per-batch timings
+        """
+        if not examples:
+            loggers["main"].info("No examples to embed")
+            return {
+                "embeddings_generated": 0,
+                "upserted_count": 0,
+                "batch_timings": [],
+            }
+
+        # Integrated-inference indexes embed records server-side and are
+        # provisioned with their field map, so there is nothing to create
+        integrated = self.pinecone_service.uses_integrated_inference(
+            settings.PINECONE_INDEX_NAME
+        )
+        if not integrated:
+            await self.ensure_pinecone_index_exists()
+        batches = self._split_batches(examples)
 
+        results = await asyncio.gather(
+            *[
+                self.process_batch(i, batch, integrated, len(examples))
+                for i, batch in enumerate(batches)
+            ]
+        )
+        return self._summarize_batches(results)
+
+    async def ingest_example_stream(
+        self,
+        examples: AsyncIterator[Dict],
+        skip_batch: Optional[Callable[[int], bool]] = None,
+        handle_batch: Optional[
+            Callable[[int, List[Dict]], Awaitable[Dict]]
+        ] = None,
+        batch_size: Optional[int] = None,
+    ) -> Dict:
+        """
+        Embed and upsert examples as they are parsed from an upload.
+
+        Parsed examples are grouped into batches and handed to a fixed set
+        of workers through a bounded queue, so at most the queued batches
+        plus one per worker are held in memory however large the upload
+        is. Parsing waits while the queue is full.
+
+        :param examples: Async iterator of examples, e.g. a streamed file
+        :param skip_batch: Batch indexes for which it returns True are
+            parsed but not processed, e.g. batches done before a restart
+        :param handle_batch: Replaces process_batch, e.g. to checkpoint
+        :param batch_size: Examples per batch, EMBEDDINGS_BATCH_SIZE if unset
+        :return: Example count, embedding/upsert counts and per-batch timings
+        """
+        integrated = self.pinecone_service.uses_integrated_inference(
+            settings.PINECONE_INDEX_NAME
+        )
+        if not integrated:
+            await self.ensure_pinecone_index_exists()
+
+        batch_size = batch_size or settings.EMBEDDINGS_BATCH_SIZE
+        queue: asyncio.Queue = asyncio.Queue(
+            maxsize=settings.INGEST_STREAM_QUEUE_BATCHES
+        )
+        results: List[Dict] = []
+        examples_processed = 0
+
+        async def enqueue(batch_index: int, batch: List[Dict]):
+            if skip_batch is None or not skip_batch(batch_index):
+                await queue.put((batch_index, batch))
+
+        async def produce():
+            nonlocal examples_processed
+            batch_index, batch = 0, []
+            async for example in examples:
+                batch.append(example)
+                examples_processed += 1
+                if len(batch) == batch_size:
+                    await enqueue(batch_index, batch)
+                    batch_index, batch = batch_index + 1, []
+            if batch:
+                await enqueue(batch_index, batch)
+            for _ in range(settings.INGEST_STREAM_WORKERS):
+                await queue.put(None)
+
+        async def consume():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    return
+                batch_index, batch = item
+                if handle_batch is None:
+                    result = await self.process_batch(
+                        batch_index, batch, integrated
+                    )
+                else:
+                    result = await handle_batch(batch_index, batch)
+                results.append(result)
+
+        tasks = [asyncio.create_task(produce())] + [
+            asyncio.create_task(consume())
+            for _ in range(settings.INGEST_STREAM_WORKERS)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        results.sort(key=lambda result: result["timing"]["batch_index"])
+        return {
+            "examples_processed": examples_processed,
+            **self._summarize_batches(results),
+        }
+
+    async def process_batch(
+        self,
+        batch_index: int,
+        batch: List[Dict],
+        integrated: bool,
+        total: Optional[int] = None,
+    ) -> Dict:
+        timing = {
+            "batch_index": batch_index,
+            "batch_size": len(batch),
+            "embed_seconds": None,
+            "upsert_seconds": None,
+            "status": "success",
+        }
+        if integrated:
+            start = time.perf_counter()
+            async with self.pinecone_service.semaphore:
+                result = await self._upsert_records(batch)
+            timing["upsert_seconds"] = round(time.perf_counter() - start, 4)
+            return {
+                "timing": timing,
+                "embedded": len(batch),
+                "upserted": result.get("upserted_count", 0),
+            }
+        try:
+            start = time.perf_counter()
+            async with self.pinecone_service.semaphore:
+                embeddings = await self._embed_batch(batch)
+            timing["embed_seconds"] = round(time.perf_counter() - start, 4)
+        except Exception as e:
+            await self._log_batch_error(e, batch_index, len(batch), total)
+            timing["status"] = "embedding_failed"
+            timing["error"] = str(e)
+            return {"timing": timing, "embedded": 0, "upserted": 0}
+
+        start = time.perf_counter()
+        async with self.pinecone_service.semaphore:
+            result = await self._upsert_embeddings(embeddings)
+        timing["upsert_seconds"] = round(time.perf_counter() - start, 4)
+        return {
+            "timing": timing,
+            "embedded": len(embeddings),
+            "upserted": result.get("upserted_count", 0),
+        }
+
+    def _summarize_batches(self, results: List[Dict]) -> Dict:
+        batch_timings = [result["timing"] for result in results]
+        for timing in batch_timings:
+            loggers["data_insert"].info(f"batch timing: {timing}")
+
+        return {
+            "embeddings_generated": sum(r["embedded"] for r in results),
+            "upserted_count": sum(r["upserted"] for r in results),
+            "batch_timings": batch_timings,
+        }
+
+    def _build_vectors(self, chunks: List[Dict]) -> List[Dict]:
         vectors_to_upsert = []
         for chunk in chunks:
             example = chunk["example"]  # Get the original example data
@@ -116,13 +352,55 @@ class DataInsertUsecaseHelper:
             }
             loggers["data_insert"].info(f"data: {data}")
             vectors_to_upsert.append(vector_data)
+        return vectors_to_upsert
+
+    def _build_records(self, examples: List[Dict]) -> List[Dict]:
+        return [
+            {
+                "_id": self._generate_vector_id(
+                    example["query"], example["subject"]
+                ),
+                settings.PINECONE_INTEGRATED_TEXT_FIELD: example["query"],
+                "response": example["response"],
+                "categories": example["categories"],
+                "from": example["from"],
+                "subject": example["subject"],
+            }
+            for example in examples
+        ]
+
+    async def _upsert_records(self, examples: List[Dict]) -> Dict:
+        records = self._build_records(examples)
+        result = await self.pinecone_service.upsert_records_simplified(records)
+        loggers["main"].info(
+            f"Upserted {len(records)} records to integrated index"
+        )
+        return {"upserted_count": result.get("upsertedCount", len(records))}
+
+    async def _upsert_embeddings(self, chunks: List[Dict]) -> Dict:
+        vectors_to_upsert = self._build_vectors(chunks)
 
         if vectors_to_upsert:
-            result = await self.pinecone_service.upsert_vectors_simplified(
-                vectors_to_upsert
+            vector_store = self.vector_stores.get(
+                settings.PINECONE_INDEX_NAME, self.pinecone_service
             )
+            result = await vector_store.upsert(vectors_to_upsert)
+            if self.category_layout.applies_to(settings.PINECONE_INDEX_NAME):
+                await self._upsert_category_namespaces(
+                    vector_store, vectors_to_upsert
+                )
+            if self.migration_monitor.active:
+                await self.dual_write_migration_target(vectors_to_upsert)
+            if self.matryoshka.enabled:
+                await self.matryoshka.upsert(
+                    vectors_to_upsert,
+                    self.vector_stores.get(
+                        self.matryoshka.low_dim_index_name,
+                        self.pinecone_service,
+                    ),
+                )
             loggers["main"].info(
-                f"Upserted {len(vectors_to_upsert)} vectors to Pinecone"
+                f"Upserted {len(vectors_to_upsert)} vectors to {type(vector_store).__name__}"
             )
 
             # Pinecone returns 'upsertedCount', but we need 'upserted_count' for consistency
@@ -131,11 +409,155 @@ class DataInsertUsecaseHelper:
 
         return {"upserted_count": 0}
 
+    async def reembed_vectors(
+        self,
+        vectors: List[Dict],
+        embed_model: str,
+        dimension: int,
+        sparse_encoder: Optional[BM25EncoderHolder] = None,
+        reuse_dense: bool = False,
+    ) -> List[Dict]:
+        """
+        Re-embed stored vectors from the text kept in their metadata.
+
+        :param vectors: Vectors with content and subject metadata
+        :param embed_model: Dense embedding model for the new vectors
+        :param dimension: Dense embedding dimension for the new vectors
+        :param sparse_encoder: BM25 encoder for the new sparse vectors;
+            the shared encoder when None
+        :param reuse_dense: Keep the dense values, e.g. when only the BM25
+            vocabulary changes
+        :return: Vectors with the same IDs and metadata, embedded anew
+        """
+        texts = self._batch_texts(
+            [
+                {
+                    "subject": vector["metadata"].get("subject", ""),
+                    "query": vector["metadata"].get("content", ""),
+                }
+                for vector in vectors
+            ]
+        )
+        if reuse_dense:
+            dense_embeddings = [vector["values"] for vector in vectors]
+            sparse_embeddings = (
+                await self.embedding_service.pinecone_sparse_embeddings(
+                    texts, sparse_encoder
+                )
+            )
+        else:
+            dense_embeddings, sparse_embeddings = await asyncio.gather(
+                self.embedding_service.pinecone_dense_embeddings(
+                    texts, embedding_model=embed_model, dimension=dimension
+                ),
+                self.embedding_service.pinecone_sparse_embeddings(
+                    texts, sparse_encoder
+                ),
+            )
+        return [
+            {
+                "id": vector["id"],
+                "values": dense_embeddings[j],
+                "sparse_values": {
+                    "indices": sparse_embeddings[j]["indices"],
+                    "values": sparse_embeddings[j]["values"],
+                },
+                "metadata": vector["metadata"],
+            }
+            for j, vector in enumerate(vectors)
+        ]
+
+    async def dual_write_migration_target(
+        self, vectors: List[Dict], namespace: str = "default"
+    ):
+        """
+        Write new templates to the target index of the active migration.
+
+        A failure does not fail the ingestion; the IDs are recorded on the
+        migration and retried by it.
+
+        :param vectors: Vectors just upserted to the dataset index
+        """
+        migration = self.migration_monitor.migration
+        try:
+            target_vectors = await self.reembed_vectors(
+                vectors,
+                migration["embed_model"],
+                migration["dimension"],
+                sparse_encoder=self.migration_monitor.sparse_encoder,
+                reuse_dense=migration["reuse_dense"],
+            )
+            await self.vector_stores.get(
+                migration["target_index"], self.pinecone_service
+            ).upsert(target_vectors, namespace)
+            self.migration_monitor.dual_writes += len(vectors)
+        except Exception as e:
+            self.migration_monitor.dual_write_failures += len(vectors)
+            error_msg = f"Error dual-writing to migration target: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "data_insert_usecase_helper.py",
+                    "method": "dual_write_migration_target",
+                    "operation": "migration_dual_write",
+                    "target_index": migration["target_index"],
+                    "vector_count": len(vectors),
+                    "response_text": error_msg,
+                },
+            )
+            await self.migration_repository.add_pending_ids(
+                migration["id"],
+                namespace,
+                [vector["id"] for vector in vectors],
+            )
+
+    async def _upsert_category_namespaces(
+        self, vector_store, vectors: List[Dict]
+    ):
+        """Dual-write vectors into the namespaces of their categories"""
+        by_namespace = self.category_layout.split(vectors)
+        await asyncio.gather(
+            *[
+                vector_store.upsert(namespace_vectors, namespace)
+                for namespace, namespace_vectors in by_namespace.items()
+            ]
+        )
+        loggers["main"].info(
+            f"Upserted {len(vectors)} vectors into {len(by_namespace)} category namespaces"
+        )
+
+    async def upsert_chunks_in_pinecone(self, chunks: List[Dict]) -> Dict:
+        if not chunks:
+            return {"upserted_count": 0}
+
+        # Ensure index exists before upserting (safety check)
+        await self.ensure_pinecone_index_exists()
+
+        return await self._upsert_embeddings(chunks)
+
     async def ensure_pinecone_index_exists(self):
         """
         Ensure that the Pinecone index exists. If not, create it.
         This should be called before any Pinecone operations.
         """
+        required_indexes = {
+            settings.PINECONE_INDEX_NAME: settings.EMBEDDINGS_DIMENSION
+        }
+        if self.matryoshka.enabled:
+            required_indexes[self.matryoshka.low_dim_index_name] = (
+                self.matryoshka.dimension
+            )
+        # A cached host means the index was resolved recently, so it exists;
+        # a local index is created by its first upsert
+        required_indexes = {
+            index_name: dimension
+            for index_name, dimension in required_indexes.items()
+            if not self.pinecone_service.is_index_host_cached(index_name)
+            and not self.vector_stores.is_local(index_name)
+        }
+        if not required_indexes:
+            return
+
         try:
             # First, list all existing indexes
             indexes_response = (
@@ -148,26 +570,27 @@ class DataInsertUsecaseHelper:
                 f"Found existing Pinecone indexes: {index_names}"
             )
 
-            # Check if our target index exists
-            if settings.PINECONE_INDEX_NAME not in index_names:
-                loggers["main"].warning(
-                    f"Index '{settings.PINECONE_INDEX_NAME}' not found. Creating it..."
-                )
+            for index_name, dimension in required_indexes.items():
+                # Check if our target index exists
+                if index_name not in index_names:
+                    loggers["main"].warning(
+                        f"Index '{index_name}' not found. Creating it..."
+                    )
 
-                # Create the index with settings from configuration
-                await self.pinecone_service.create_index(
-                    index_name=settings.PINECONE_INDEX_NAME,
-                    dimension=settings.EMBEDDINGS_DIMENSION,
-                    metric=settings.INDEXING_SIMILARITY_METRIC,
-                )
+                    # Create the index with settings from configuration
+                    await self.pinecone_service.create_index(
+                        index_name=index_name,
+                        dimension=dimension,
+                        metric=settings.INDEXING_SIMILARITY_METRIC,
+                    )
 
-                loggers["main"].info(
-                    f"Successfully created Pinecone index: {settings.PINECONE_INDEX_NAME}"
-                )
-            else:
-                loggers["main"].info(
-                    f"Pinecone index '{settings.PINECONE_INDEX_NAME}' already exists"
-                )
+                    loggers["main"].info(
+                        f"Successfully created Pinecone index: {index_name}"
+                    )
+                else:
+                    loggers["main"].info(
+                        f"Pinecone index '{index_name}' already exists"
+                    )
 
         except Exception as e:
             error_msg = f"Error ensuring Pinecone index exists: {str(e)}"
@@ -177,7 +600,7 @@ class DataInsertUsecaseHelper:
                     "file": "data_insert_usecase_helper.py",
                     "method": "ensure_pinecone_index_exists",
                     "operation": "pinecone_index_management",
-                    "target_index": settings.PINECONE_INDEX_NAME,
+                    "target_index": list(required_indexes),
                     "response_text": error_msg,
                 },
             )
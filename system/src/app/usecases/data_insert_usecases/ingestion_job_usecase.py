@@ -0,0 +1,389 @@
+import asyncio
+import math
+import os
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, List
+
+from fastapi import Depends, HTTPException, UploadFile, status
+
+from system.src.app.config.settings import settings
+from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.repositories.ingestion_job_repository import (
+    IngestionJobRepository,
+)
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase import (
+    DataInsertUsecase,
+)
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper import (
+    DataInsertUsecaseHelper,
+)
+from system.src.app.utils.logging_utils import loggers
+
+RUNNING = "running"
+COMPLETED = "completed"
+COMPLETED_WITH_ERRORS = "completed_with_errors"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+class IngestionJobUsecase:
+    """
+    Background ingestion of uploaded dataset files.
+
+    The upload is stored on disk and a job recorded in MongoDB before the
+    request returns. The job streams the stored file through the batch
+    queue and, after every batch, checkpoints a watermark below which all
+    batches are finished, the finished batches above it, the counters and
+    any failed batch with its error. A restarted process resumes running
+    jobs from the watermark; batches that were in flight are processed
+    again, which is safe because vector IDs are derived from the content.
+    Failed batches are kept for an explicit retry instead of being skipped.
+    """
+
+    CHECKPOINT_FIELDS = (
+        "status",
+        "retrying",
+        "next_batch",
+        "total_batches",
+        "bytes_read",
+        "examples_processed",
+        "embeddings_generated",
+        "upserted_count",
+        "batches_completed",
+        "processing_seconds",
+        "last_error",
+        "finished_at",
+    )
+
+    def __init__(
+        self,
+        data_insert_usecase: DataInsertUsecase = Depends(DataInsertUsecase),
+        data_insert_usecase_helper: DataInsertUsecaseHelper = Depends(
+            DataInsertUsecaseHelper
+        ),
+        job_repository: IngestionJobRepository = Depends(
+            IngestionJobRepository
+        ),
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+    ):
+        self.data_insert_usecase = data_insert_usecase
+        self.data_insert_usecase_helper = data_insert_usecase_helper
+        self.job_repository = job_repository
+        self.error_repo = error_repo
+        self.run_tasks: Dict[str, asyncio.Task] = {}
+
+    def is_running(self, job_id: str) -> bool:
+        task = self.run_tasks.get(job_id)
+        return task is not None and not task.done()
+
+    async def submit(self, file: UploadFile) -> Dict:
+        """
+        Store an uploaded dataset file and start ingesting it.
+
+        :param file: JSON file with an "examples" array, or NDJSON
+        :return: The created job
+        """
+        ndjson = self.data_insert_usecase.is_ndjson(
+            file.filename, file.content_type
+        )
+        os.makedirs(settings.INGEST_JOB_UPLOAD_DIR, exist_ok=True)
+        path = os.path.join(
+            settings.INGEST_JOB_UPLOAD_DIR,
+            f"{uuid.uuid4().hex}{'.ndjson' if ndjson else '.json'}",
+        )
+        file_bytes = 0
+        with open(path, "wb") as f:
+            while True:
+                chunk = await file.read(
+                    settings.INGEST_STREAM_READ_CHUNK_BYTES
+                )
+                if not chunk:
+                    break
+                f.write(chunk)
+                file_bytes += len(chunk)
+
+        job = await self.job_repository.create_job(
+            {
+                "filename": file.filename,
+                "path": path,
+                "ndjson": ndjson,
+                "file_bytes": file_bytes,
+                "bytes_read": 0,
+                "status": RUNNING,
+                "retrying": False,
+                "batch_size": settings.EMBEDDINGS_BATCH_SIZE,
+                "next_batch": 0,
+                "finished_batches": [],
+                "failed_batches": {},
+                "total_batches": None,
+                "examples_processed": 0,
+                "embeddings_generated": 0,
+                "upserted_count": 0,
+                "batches_completed": 0,
+                "processing_seconds": 0.0,
+                "last_error": None,
+                "finished_at": None,
+            }
+        )
+        self._launch(job)
+        return job
+
+    def _launch(self, job: Dict):
+        self.run_tasks[job["id"]] = asyncio.create_task(self._run(job))
+
+    async def resume_interrupted(self) -> List[Dict]:
+        """
+        Continue jobs that were running when the process stopped
+
+        :return: The resumed jobs
+        """
+        jobs = await self.job_repository.get_jobs_by_status([RUNNING])
+        for job in jobs:
+            if not self.is_running(job["id"]):
+                loggers["data_insert"].info(
+                    f"Resuming ingestion job {job['id']} at batch {job['next_batch']}"
+                )
+                self._launch(job)
+        return jobs
+
+    async def retry(self, job_id: str) -> Dict:
+        """
+        Reprocess the failed batches of a finished job, or continue a
+        failed job from its last checkpoint.
+        """
+        job = await self._get(job_id)
+        if self.is_running(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Ingestion job is already running",
+            )
+        if job["status"] not in (COMPLETED_WITH_ERRORS, FAILED):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Ingestion job is {job['status']}; only failed batches or failed jobs can be retried",
+            )
+        fields = {
+            "status": RUNNING,
+            "retrying": job["status"] == COMPLETED_WITH_ERRORS,
+            "last_error": None,
+        }
+        await self.job_repository.save_checkpoint(job_id, fields)
+        job.update(fields)
+        self._launch(job)
+        return await self.status(job_id)
+
+    async def cancel(self, job_id: str) -> Dict:
+        """Stop the job and discard its stored upload"""
+        job = await self._get(job_id)
+        if job["status"] in (COMPLETED, CANCELLED):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Ingestion job is already {job['status']}",
+            )
+        task = self.run_tasks.get(job_id)
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.job_repository.save_checkpoint(
+            job_id, {"status": CANCELLED, "finished_at": datetime.now()}
+        )
+        self._remove_upload(job)
+        return await self.status(job_id)
+
+    async def shutdown(self):
+        """
+        Cancel running jobs without a final checkpoint; they stay running
+        and resume from their last checkpoint on the next start.
+        """
+        tasks = list(self.run_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def status(self, job_id: str) -> Dict:
+        job = await self._get(job_id)
+        failed = job.get("failed_batches", {})
+        job["failed_batch_count"] = len(failed)
+        job["failed_examples"] = sum(
+            batch["batch_size"] for batch in failed.values()
+        )
+        if job["total_batches"]:
+            job["progress"] = round(
+                (job["batches_completed"] + len(failed)) / job["total_batches"],
+                4,
+            )
+        elif job["file_bytes"]:
+            # Parse position until the number of batches is known
+            job["progress"] = round(job["bytes_read"] / job["file_bytes"], 4)
+        else:
+            job["progress"] = None
+        seconds = job["processing_seconds"]
+        job["throughput"] = {
+            "examples_per_second": (
+                round(job["examples_processed"] / seconds, 2)
+                if seconds
+                else None
+            ),
+            "batches_per_second": (
+                round(job["batches_completed"] / seconds, 4)
+                if seconds
+                else None
+            ),
+        }
+        return job
+
+    async def _get(self, job_id: str) -> Dict:
+        job = await self.job_repository.get_job(job_id)
+        if job is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Ingestion job {job_id} not found",
+            )
+        return job
+
+    @staticmethod
+    def _remove_upload(job: Dict):
+        try:
+            os.remove(job["path"])
+        except FileNotFoundError:
+            pass
+
+    async def _run(self, job: Dict):
+        job_id = job["id"]
+        helper = self.data_insert_usecase_helper
+        integrated = helper.pinecone_service.uses_integrated_inference(
+            settings.PINECONE_INDEX_NAME
+        )
+        finished = set(job["finished_batches"])
+        failed = dict(job["failed_batches"])
+        retry_batches = set(failed) if job["retrying"] else None
+        lock = asyncio.Lock()
+        run_start = time.monotonic()
+        base_seconds = job["processing_seconds"]
+
+        async def checkpoint():
+            job["processing_seconds"] = round(
+                base_seconds + time.monotonic() - run_start, 3
+            )
+            fields = {key: job[key] for key in self.CHECKPOINT_FIELDS}
+            fields["finished_batches"] = sorted(finished)
+            fields["failed_batches"] = failed
+            await self.job_repository.save_checkpoint(job_id, fields)
+
+        def skip_batch(batch_index: int) -> bool:
+            if retry_batches is not None:
+                return str(batch_index) not in retry_batches
+            return batch_index < job["next_batch"] or batch_index in finished
+
+        async def handle_batch(batch_index: int, batch: List[Dict]) -> Dict:
+            try:
+                result = await helper.process_batch(
+                    batch_index, batch, integrated
+                )
+            except Exception as e:
+                error_msg = f"Error upserting ingestion batch: {str(e)}"
+                await self.error_repo.log_error(
+                    error=error_msg,
+                    additional_context={
+                        "file": "ingestion_job_usecase.py",
+                        "method": "handle_batch",
+                        "operation": "ingestion_job_batch",
+                        "job_id": job_id,
+                        "batch_index": batch_index,
+                        "batch_size": len(batch),
+                        "response_text": error_msg,
+                    },
+                )
+                result = {
+                    "timing": {
+                        "batch_index": batch_index,
+                        "batch_size": len(batch),
+                        "status": "upsert_failed",
+                        "error": str(e),
+                    },
+                    "embedded": 0,
+                    "upserted": 0,
+                }
+
+            timing = result["timing"]
+            key = str(batch_index)
+            async with lock:
+                if timing["status"] == "success":
+                    failed.pop(key, None)
+                    job["examples_processed"] += len(batch)
+                    job["embeddings_generated"] += result["embedded"]
+                    job["upserted_count"] += result["upserted"]
+                    job["batches_completed"] += 1
+                else:
+                    failed[key] = {
+                        "batch_size": len(batch),
+                        "status": timing["status"],
+                        "error": timing.get("error"),
+                        "attempts": failed.get(key, {}).get("attempts", 0) + 1,
+                    }
+                if batch_index >= job["next_batch"]:
+                    finished.add(batch_index)
+                    while job["next_batch"] in finished:
+                        finished.discard(job["next_batch"])
+                        job["next_batch"] += 1
+                await checkpoint()
+            return result
+
+        try:
+            fields: Dict = {}
+            with open(job["path"], "rb") as f:
+
+                async def read(size: int) -> bytes:
+                    chunk = await asyncio.to_thread(f.read, size)
+                    job["bytes_read"] = f.tell()
+                    return chunk
+
+                result = await helper.ingest_example_stream(
+                    self.data_insert_usecase.stream_examples(
+                        read, job["ndjson"], fields
+                    ),
+                    skip_batch=skip_batch,
+                    handle_batch=handle_batch,
+                    batch_size=job["batch_size"],
+                )
+            self.data_insert_usecase.save_categories(fields)
+
+            job["total_batches"] = math.ceil(
+                result["examples_processed"] / job["batch_size"]
+            )
+            job["status"] = COMPLETED_WITH_ERRORS if failed else COMPLETED
+            job["retrying"] = False
+            job["finished_at"] = datetime.now()
+            await checkpoint()
+            if not failed:
+                self._remove_upload(job)
+            loggers["data_insert"].info(
+                f"Ingestion job {job_id} {job['status']}: {job['examples_processed']} examples, {len(failed)} failed batches"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error_msg = f"Error in ingestion job: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "ingestion_job_usecase.py",
+                    "method": "_run",
+                    "operation": "ingestion_job",
+                    "job_id": job_id,
+                    "filename": job["filename"],
+                    "response_text": error_msg,
+                },
+            )
+            loggers["data_insert"].error(error_msg)
+            job["status"] = FAILED
+            job["last_error"] = error_msg
+            await checkpoint()
+        finally:
+            if self.run_tasks.get(job_id) is asyncio.current_task():
+                del self.run_tasks[job_id]
@@ -0,0 +1,443 @@
+import asyncio
+from typing import Dict, List, Optional
+
+from fastapi import Depends, HTTPException, status
+
+from system.src.app.config.settings import settings
+from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.repositories.reembed_migration_repository import (
+    ReembedMigrationRepository,
+)
+from system.src.app.services.bm25_encoder import BM25EncoderHolder
+from system.src.app.services.index_migration_monitor import (
+    IndexMigrationMonitor,
+    index_migration_monitor,
+)
+from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.usecases.data_insert_usecases.data_insert_usecase_helper import (
+    DataInsertUsecaseHelper,
+)
+from system.src.app.utils.logging_utils import loggers
+
+RUNNING = "running"
+PAUSED = "paused"
+COMPLETED = "completed"
+FAILED = "failed"
+STOPPED = "stopped"
+
+# Dense model the dataset index is embedded with at ingestion
+DATASET_EMBED_MODEL = "llama-text-embed-v2"
+
+
+class ReembedMigrationUsecase:
+    """
+    Online migration of the dataset index to a new index with a different
+    embedding model, dimension or BM25 vocabulary. When only the BM25
+    vocabulary changes, dense values are copied and only sparse vectors
+    are recomputed with the target encoder.
+
+    Vector IDs are listed page by page from the source index; each page is
+    fetched, re-embedded from its stored text and upserted into the target
+    while production keeps reading the source. Progress (namespace and
+    page token) is checkpointed in MongoDB after every window of pages, so
+    a restarted process resumes where it stopped. While the migration is
+    active, new templates are dual-written and a sample of dataset queries
+    is shadowed against the target.
+    """
+
+    def __init__(
+        self,
+        data_insert_usecase_helper: DataInsertUsecaseHelper = Depends(
+            DataInsertUsecaseHelper
+        ),
+        pinecone_service: PineconeService = Depends(PineconeService),
+        migration_repository: ReembedMigrationRepository = Depends(
+            ReembedMigrationRepository
+        ),
+        migration_monitor: IndexMigrationMonitor = Depends(
+            lambda: index_migration_monitor
+        ),
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+    ):
+        self.data_insert_usecase_helper = data_insert_usecase_helper
+        self.pinecone_service = pinecone_service
+        self.migration_repository = migration_repository
+        self.migration_monitor = migration_monitor
+        self.error_repo = error_repo
+        self.run_task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.run_task is not None and not self.run_task.done()
+
+    async def _ensure_target_index(self, target_index: str, dimension: int):
+        if self.data_insert_usecase_helper.vector_stores.is_local(target_index):
+            return
+        indexes_response = await self.pinecone_service.list_pinecone_indexes()
+        index_names = [
+            index.get("name") for index in indexes_response.get("indexes", [])
+        ]
+        if target_index not in index_names:
+            loggers["main"].info(
+                f"Creating migration target index {target_index} ({dimension})"
+            )
+            await self.pinecone_service.create_index(
+                index_name=target_index,
+                dimension=dimension,
+                metric=settings.INDEXING_SIMILARITY_METRIC,
+            )
+
+    async def start(
+        self,
+        target_index: str,
+        embed_model: str,
+        dimension: int,
+        bm25_encoder_path: Optional[str] = None,
+    ) -> Dict:
+        """
+        Start migrating the dataset index into ``target_index``.
+
+        :param target_index: New index; created if it does not exist
+        :param embed_model: Dense embedding model for the new index
+        :param dimension: Dense embedding dimension for the new index
+        :param bm25_encoder_path: Compact directory or pickle of the BM25
+            encoder for the new index; the current encoder when None
+        :return: The created migration
+        """
+        source_index = settings.PINECONE_INDEX_NAME
+        if target_index == source_index:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Target index must differ from the dataset index",
+            )
+        if self.data_insert_usecase_helper.vector_stores.is_local(source_index):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Only a Pinecone-hosted dataset index can be migrated",
+            )
+        if self.pinecone_service.uses_integrated_inference(source_index):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Integrated-inference indexes embed server-side and cannot be re-embedded here",
+            )
+        if await self.migration_repository.get_active_migration():
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="A migration is already active; resume or stop it first",
+            )
+
+        source_store = self.data_insert_usecase_helper.vector_stores.get(
+            source_index, self.pinecone_service
+        )
+        index_stats = await source_store.describe()
+        reuse_dense = (
+            embed_model == DATASET_EMBED_MODEL
+            and dimension == index_stats.get("dimension")
+        )
+        if reuse_dense and not bm25_encoder_path:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Target uses the same embedding model, dimension and BM25 encoder as the dataset index; nothing to re-embed",
+            )
+        sparse_encoder = None
+        if bm25_encoder_path:
+            sparse_encoder = await self._load_bm25_encoder(bm25_encoder_path)
+
+        await self._ensure_target_index(target_index, dimension)
+        namespaces = sorted(index_stats.get("namespaces", {})) or ["default"]
+
+        migration = await self.migration_repository.create_migration(
+            {
+                "source_index": source_index,
+                "target_index": target_index,
+                "embed_model": embed_model,
+                "dimension": dimension,
+                "bm25_encoder_path": bm25_encoder_path,
+                "reuse_dense": reuse_dense,
+                "status": RUNNING,
+                "active": True,
+                "namespaces": namespaces,
+                "namespace_position": 0,
+                "pagination_token": None,
+                "total_vectors": index_stats.get("totalVectorCount"),
+                "migrated": 0,
+                "pending_ids": {},
+                "last_error": None,
+            }
+        )
+        self.migration_monitor.activate(migration, sparse_encoder)
+        self._launch(migration)
+        return migration
+
+    async def _load_bm25_encoder(self, path: str) -> BM25EncoderHolder:
+        encoder = BM25EncoderHolder.for_path(path)
+        try:
+            await asyncio.to_thread(encoder.warm_up)
+            return encoder
+        except Exception as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Cannot load BM25 encoder from {path}: {str(e)}",
+            )
+
+    def _launch(self, migration: Dict):
+        self.run_task = asyncio.create_task(self._run(migration))
+
+    async def resume_active(self) -> Optional[Dict]:
+        """
+        Re-activate dual-writes and shadow reads for the active migration
+        and continue it if it was interrupted while running.
+
+        :return: The active migration or None
+        """
+        migration = await self.migration_repository.get_active_migration()
+        if migration is None:
+            return None
+        self.migration_monitor.activate(migration)
+        if migration["status"] == RUNNING and not self.is_running:
+            loggers["main"].info(
+                f"Resuming re-embedding migration {migration['id']}"
+            )
+            self._launch(migration)
+        return migration
+
+    async def resume(self, migration_id: str) -> Dict:
+        migration = await self._get(migration_id)
+        if not migration["active"]:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Migration was stopped and cannot be resumed",
+            )
+        if self.is_running:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Migration is already running",
+            )
+        await self.migration_repository.save_checkpoint(
+            migration_id, {"status": RUNNING}
+        )
+        migration["status"] = RUNNING
+        self.migration_monitor.activate(migration)
+        self._launch(migration)
+        return migration
+
+    async def pause(self, migration_id: str) -> Dict:
+        """Stop copying; resume continues from the last checkpoint"""
+        await self._get(migration_id)
+        await self._cancel_run()
+        await self.migration_repository.save_checkpoint(
+            migration_id, {"status": PAUSED}
+        )
+        return await self._get(migration_id)
+
+    async def stop(self, migration_id: str) -> Dict:
+        """End the migration: no more copying, dual-writes or shadow reads"""
+        migration = await self._get(migration_id)
+        await self._cancel_run()
+        fields = {"active": False}
+        if migration["status"] != COMPLETED:
+            fields["status"] = STOPPED
+        await self.migration_repository.save_checkpoint(migration_id, fields)
+        self.migration_monitor.deactivate()
+        return await self._get(migration_id)
+
+    async def status(self, migration_id: str) -> Dict:
+        migration = await self._get(migration_id)
+        total = migration.get("total_vectors")
+        migration["progress"] = (
+            round(min(migration["migrated"] / total, 1.0), 4) if total else None
+        )
+        migration["pending_count"] = sum(
+            len(ids) for ids in migration.get("pending_ids", {}).values()
+        )
+        migration["monitor"] = self.migration_monitor.stats()
+        return migration
+
+    async def _get(self, migration_id: str) -> Dict:
+        migration = await self.migration_repository.get_migration(migration_id)
+        if migration is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Migration {migration_id} not found",
+            )
+        return migration
+
+    async def shutdown(self):
+        """Cancel the copy; a running migration resumes on the next start"""
+        await self._cancel_run()
+
+    async def _cancel_run(self):
+        if self.is_running:
+            self.run_task.cancel()
+            try:
+                await self.run_task
+            except asyncio.CancelledError:
+                pass
+        self.run_task = None
+
+    async def _migrate_ids(
+        self,
+        migration: Dict,
+        namespace: str,
+        vector_ids: List[str],
+        pending: bool = False,
+    ) -> int:
+        """
+        Fetch, re-embed and upsert one page of vectors.
+
+        :param pending: The IDs are retried from ``pending_ids`` and are
+            cleared from it once written
+        :return: Number of vectors written to the target
+        """
+        helper = self.data_insert_usecase_helper
+        try:
+            source_host = await self.pinecone_service.get_index_host(
+                migration["source_index"]
+            )
+            async with self.pinecone_service.semaphore:
+                vectors = await self.pinecone_service.fetch_vectors(
+                    source_host, vector_ids, namespace
+                )
+
+            async def reembed(batch: List[Dict]) -> List[Dict]:
+                async with self.pinecone_service.semaphore:
+                    return await helper.reembed_vectors(
+                        batch,
+                        migration["embed_model"],
+                        migration["dimension"],
+                        sparse_encoder=self.migration_monitor.sparse_encoder,
+                        reuse_dense=migration.get("reuse_dense", False),
+                    )
+
+            batch_size = settings.EMBEDDINGS_BATCH_SIZE
+            batches = await asyncio.gather(
+                *[
+                    reembed(vectors[i : i + batch_size])
+                    for i in range(0, len(vectors), batch_size)
+                ]
+            )
+            target_vectors = [vector for batch in batches for vector in batch]
+            await helper.vector_stores.get(
+                migration["target_index"], self.pinecone_service
+            ).upsert(target_vectors, namespace)
+            if pending:
+                await self.migration_repository.remove_pending_ids(
+                    migration["id"], namespace, vector_ids
+                )
+            return len(target_vectors)
+
+        except Exception as e:
+            error_msg = f"Error migrating vectors: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "reembed_migration_usecase.py",
+                    "method": "_migrate_ids",
+                    "operation": "reembed_migration_batch",
+                    "migration_id": migration["id"],
+                    "namespace": namespace,
+                    "vector_count": len(vector_ids),
+                    "response_text": error_msg,
+                },
+            )
+            await self.migration_repository.add_pending_ids(
+                migration["id"], namespace, vector_ids
+            )
+            return 0
+
+    async def _migrate_namespace(self, migration: Dict, namespace: str):
+        source_host = await self.pinecone_service.get_index_host(
+            migration["source_index"]
+        )
+        token = migration["pagination_token"]
+        while True:
+            # List a window of pages, migrate them concurrently, checkpoint
+            pages = []
+            for _ in range(settings.REEMBED_MIGRATION_PAGES_IN_FLIGHT):
+                vector_ids, token = (
+                    await self.pinecone_service.list_vector_ids_page(
+                        source_host, namespace, token
+                    )
+                )
+                pages.append(vector_ids)
+                if not token:
+                    break
+            migrated = await asyncio.gather(
+                *[
+                    self._migrate_ids(migration, namespace, vector_ids)
+                    for vector_ids in pages
+                    if vector_ids
+                ]
+            )
+            migration["migrated"] += sum(migrated)
+            migration["pagination_token"] = token
+            await self.migration_repository.save_checkpoint(
+                migration["id"],
+                {
+                    "pagination_token": token,
+                    "migrated": migration["migrated"],
+                },
+            )
+            if not token:
+                return
+
+    async def _retry_pending(self, migration: Dict):
+        stored = await self._get(migration["id"])
+        batch_size = settings.PINECONE_FETCH_BATCH_SIZE
+        for namespace, vector_ids in stored.get("pending_ids", {}).items():
+            for i in range(0, len(vector_ids), batch_size):
+                # A batch stays pending until it is written, so a crash or
+                # cancellation here cannot drop it
+                migration["migrated"] += await self._migrate_ids(
+                    migration,
+                    namespace,
+                    vector_ids[i : i + batch_size],
+                    pending=True,
+                )
+                await self.migration_repository.save_checkpoint(
+                    migration["id"], {"migrated": migration["migrated"]}
+                )
+
+    async def _run(self, migration: Dict):
+        try:
+            namespaces = migration["namespaces"]
+            while migration["namespace_position"] < len(namespaces):
+                namespace = namespaces[migration["namespace_position"]]
+                await self._migrate_namespace(migration, namespace)
+                migration["namespace_position"] += 1
+                migration["pagination_token"] = None
+                await self.migration_repository.save_checkpoint(
+                    migration["id"],
+                    {
+                        "namespace_position": migration["namespace_position"],
+                        "pagination_token": None,
+                    },
+                )
+                loggers["main"].info(
+                    f"Migration {migration['id']}: namespace {namespace} done, {migration['migrated']} vectors migrated"
+                )
+            await self._retry_pending(migration)
+            await self.migration_repository.save_checkpoint(
+                migration["id"], {"status": COMPLETED}
+            )
+            loggers["main"].info(
+                f"Migration {migration['id']} completed; dual-writes and shadow reads continue until it is stopped"
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error_msg = f"Error in re-embedding migration: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "reembed_migration_usecase.py",
+                    "method": "_run",
+                    "operation": "reembed_migration",
+                    "migration_id": migration["id"],
+                    "response_text": error_msg,
+                },
+            )
+            loggers["main"].error(error_msg)
+            await self.migration_repository.save_checkpoint(
+                migration["id"], {"status": FAILED, "last_error": error_msg}
+            )
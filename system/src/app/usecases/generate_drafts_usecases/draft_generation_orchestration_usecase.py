@@ -8,6 +8,7 @@ from fastapi import Depends
 from system.src.app.config.settings import settings
 from system.src.app.exceptions.websocket_exceptions import WebSocketTimeoutError
 from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.services.semantic_workflow_cache import DRAFT, RETRIEVAL
 from system.src.app.services.websocket_service import (
     WebSocketManager,
     websocket_manager,
@@ -21,6 +22,12 @@ from system.src.app.usecases.generate_drafts_usecases.generate_drafts_usecase im
 from system.src.app.usecases.query_docs_usecases.query_docs_usecase import (
     QueryDocsUsecase,
 )
+from system.src.app.usecases.query_docs_usecases.retrieval_stage_usecase import (
+    RetrievalStageUsecase,
+)
+from system.src.app.usecases.generate_drafts_usecases.semantic_cache_usecase import (
+    SemanticCacheUsecase,
+)
 from system.src.app.usecases.generate_drafts_usecases.request_logging_usecase import (
     RequestLoggingUsecase,
 )
@@ -49,6 +56,12 @@ class DraftGenerationOrchestrationUsecase:
             lambda: websocket_manager
         ),
         error_repo: ErrorRepo = Depends(ErrorRepo),
+        retrieval_stage_usecase: RetrievalStageUsecase = Depends(
+            RetrievalStageUsecase
+        ),
+        semantic_cache_usecase: SemanticCacheUsecase = Depends(
+            SemanticCacheUsecase
+        ),
     ):
         self.generate_drafts_usecase = generate_drafts_usecase
         self.query_docs_usecase = query_docs_usecase
@@ -57,6 +70,8 @@ class DraftGenerationOrchestrationUsecase:
         self.template_storage_usecase = template_storage_usecase
         self.websocket_manager = websocket_manager
         self.error_repo = error_repo
+        self.retrieval_stage_usecase = retrieval_stage_usecase
+        self.semantic_cache_usecase = semantic_cache_usecase
 
     async def execute_draft_generation_workflow(
         self, query: Dict, user_id: str = "default_user"
@@ -65,44 +80,66 @@ class DraftGenerationOrchestrationUsecase:
         if "id" not in query:
             query["id"] = f"api_email_{int(time.time())}"
 
-        categorization_response = await self.categorization_usecase.execute(
-            query
+        semantic_vector, cache_tier, cached_workflow = (
+            await self.semantic_cache_usecase.lookup(query)
         )
-        rocket_docs_query = categorization_response.get("doc_search_query")
-        dataset_query = f"Subject: {categorization_response.get('subject')}\n{categorization_response.get('body')}"
-        categories = categorization_response.get("categories")
+        index_versions = self.semantic_cache_usecase.index_versions()
 
-        tasks = []
-        if rocket_docs_query and rocket_docs_query.strip():
-            tasks.append(
-                self.query_docs_usecase.query_docs(
-                    rocket_docs_query, settings.ROCKET_DOCS_PINECONE_INDEX_NAME
+        # Search the dataset unfiltered while Gemini categorizes the email
+        speculative_task = None
+        if settings.SPECULATIVE_RETRIEVAL_ENABLED and not cache_tier:
+            speculative_task = asyncio.create_task(
+                self.retrieval_stage_usecase.speculative_dataset_search(
+                    self.semantic_cache_usecase.email_text(query)
                 )
             )
-        else:
-            tasks.append(asyncio.sleep(0, result=[]))
-            logging.debug(
-                "Skipping rocket docs search - empty or missing doc_search_query"
-            )
 
-        if categories and len(categories) > 0:
-            tasks.append(
-                self.query_docs_usecase.query_docs(
-                    dataset_query,
-                    settings.PINECONE_INDEX_NAME,
-                    categories=categories,
+        if cache_tier:
+            self.semantic_cache_usecase.record_hit(cache_tier, cached_workflow)
+            categorization_response = (
+                self.semantic_cache_usecase.reuse_categorization(
+                    query, cached_workflow
                 )
             )
         else:
-            tasks.append(asyncio.sleep(0, result=[]))
+            try:
+                categorization_response = (
+                    await self.categorization_usecase.execute(query)
+                )
+            except Exception:
+                if speculative_task:
+                    speculative_task.cancel()
+                raise
+        rocket_docs_query = categorization_response.get("doc_search_query")
+        dataset_query = f"Subject: {categorization_response.get('subject')}\n{categorization_response.get('body')}"
+        categories = categorization_response.get("categories")
+
+        if not (rocket_docs_query and rocket_docs_query.strip()):
+            logging.debug(
+                "Skipping rocket docs search - empty or missing doc_search_query"
+            )
+        if not categories:
             logging.debug(
                 "Skipping dataset search - empty or missing categories"
             )
 
-        (
-            rocket_docs_response,
-            dataset_response,
-        ) = await asyncio.gather(*tasks)
+        if cache_tier in (DRAFT, RETRIEVAL):
+            rocket_docs_response = cached_workflow["rocket_docs_response"]
+            dataset_response = cached_workflow["dataset_response"]
+        else:
+            speculative_matches = None
+            if speculative_task and categories:
+                speculative_matches = await speculative_task
+            elif speculative_task:
+                speculative_task.cancel()
+            retrieval = await self.retrieval_stage_usecase.retrieve(
+                rocket_docs_query,
+                dataset_query,
+                categories,
+                speculative_dataset_matches=speculative_matches,
+            )
+            rocket_docs_response = retrieval["rocket_docs_response"]
+            dataset_response = retrieval["dataset_response"]
 
         generate_drafts_query = {
             "from": categorization_response.get("from"),
@@ -113,17 +150,28 @@ class DraftGenerationOrchestrationUsecase:
             "categories": categories if categories else [],
             "attachments": query.get("attachments", []),
         }
-        generated_drafts = await self.generate_drafts_usecase.generate_drafts(
-            generate_drafts_query
-        )
+        if cache_tier == DRAFT:
+            generated_drafts = {
+                "from": generate_drafts_query["from"],
+                "subject": generate_drafts_query["subject"],
+                "body": generate_drafts_query["body"],
+                "drafts": [cached_workflow["final_draft_body"]],
+            }
+        else:
+            generated_drafts = (
+                await self.generate_drafts_usecase.generate_drafts(
+                    generate_drafts_query
+                )
+            )
 
         final_draft_body = ""
         user_reviewed = False
         is_skip = False
 
-        if len(generated_drafts.get("drafts", [])) > 1:
+        if len(generated_drafts.get("drafts", [])) > 1 or cache_tier == DRAFT:
+            # A reused draft is only a suggestion and always goes to review
             logging.debug(
-                f"Multiple drafts generated ({len(generated_drafts.get('drafts', []))}), sending to frontend for review..."
+                f"{len(generated_drafts.get('drafts', []))} draft(s) generated or reused, sending to frontend for review..."
             )
             final_response, is_skip = await self._handle_review_process(
                 user_id, generated_drafts
@@ -138,8 +186,13 @@ class DraftGenerationOrchestrationUsecase:
             final_draft_body = final_response.get("drafts", [""])[0]
             is_skip = False  # Single draft is never considered skipped
 
+        # An unedited reused draft is already stored as a template
+        reused_unchanged = (
+            cache_tier == DRAFT
+            and final_draft_body == cached_workflow["final_draft_body"]
+        )
         try:
-            if not is_skip:
+            if not is_skip and not reused_unchanged:
                 await self.template_storage_usecase.store_response_template(
                     categorization_response, final_draft_body
                 )
@@ -159,6 +212,17 @@ class DraftGenerationOrchestrationUsecase:
             )
             logging.warning(f"Failed to store final response template: {e}")
 
+        if not is_skip and final_draft_body and cache_tier != DRAFT:
+            self.semantic_cache_usecase.store(
+                semantic_vector,
+                categorization_response,
+                rocket_docs_response,
+                dataset_response,
+                final_draft_body,
+                draft_calls=len(generated_drafts.get("drafts", [])),
+                index_versions=index_versions,
+            )
+
         processing_time = time.time() - start_time
         await self.request_logging_usecase.log_request(
             query,
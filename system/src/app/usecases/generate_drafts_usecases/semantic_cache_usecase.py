@@ -0,0 +1,161 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastapi import Depends
+
+from system.src.app.config.settings import settings
+from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.services.embedding_service import EmbeddingService
+from system.src.app.services.retrieval_result_cache import (
+    RetrievalResultCache,
+    retrieval_result_cache,
+)
+from system.src.app.services.semantic_workflow_cache import (
+    CATEGORIZATION,
+    DRAFT,
+    RETRIEVAL,
+    SemanticWorkflowCache,
+    semantic_workflow_cache,
+)
+from system.src.app.utils.logging_utils import loggers
+
+
+class SemanticCacheUsecase:
+    def __init__(
+        self,
+        embedding_service: EmbeddingService = Depends(EmbeddingService),
+        semantic_workflow_cache: SemanticWorkflowCache = Depends(
+            lambda: semantic_workflow_cache
+        ),
+        retrieval_result_cache: RetrievalResultCache = Depends(
+            lambda: retrieval_result_cache
+        ),
+        error_repo: ErrorRepo = Depends(ErrorRepo),
+    ):
+        self.embedding_service = embedding_service
+        self.semantic_workflow_cache = semantic_workflow_cache
+        self.retrieval_result_cache = retrieval_result_cache
+        self.error_repo = error_repo
+
+    @staticmethod
+    def email_text(query: Dict) -> str:
+        # Same text as the dataset retrieval query, so the embedding is shared
+        return f"Subject: {query.get('subject')}\n{query.get('body')}"
+
+    def index_versions(self) -> Dict[str, int]:
+        """Write versions of the indexes whose results a workflow reuses"""
+        return {
+            index_name: self.retrieval_result_cache.index_versions.get(
+                index_name, 0
+            )
+            for index_name in (
+                settings.ROCKET_DOCS_PINECONE_INDEX_NAME,
+                settings.PINECONE_INDEX_NAME,
+            )
+        }
+
+    async def lookup(
+        self, query: Dict
+    ) -> Tuple[Optional[List[float]], Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Embed the incoming email and find a reusable completed workflow.
+
+        :param query: Incoming email
+        :return: Email embedding, reuse tier and stored workflow payload.
+            The embedding is None when the cache is disabled, skipped or
+            failed, in which case nothing is stored either.
+        """
+        # Attachments feed both Gemini calls, so their text alone can't key reuse
+        if not settings.SEMANTIC_CACHE_ENABLED or query.get("attachments"):
+            return None, None, None
+        try:
+            vectors = await self.embedding_service.pinecone_query_embeddings(
+                [self.email_text(query)]
+            )
+            vector = vectors[0]
+            tier, score, payload = self.semantic_workflow_cache.lookup(vector)
+            # Stored retrieval results predate a write to either index
+            if tier in (DRAFT, RETRIEVAL) and (
+                payload.get("index_versions") != self.index_versions()
+            ):
+                tier = CATEGORIZATION
+            # Drafts address the customer by name, so a previous final
+            # draft is only reused for the same sender, and only if enabled
+            if tier == DRAFT and not (
+                settings.SEMANTIC_CACHE_DRAFT_REUSE_ENABLED
+                and payload.get("sender") == query.get("sender")
+            ):
+                tier = RETRIEVAL
+            loggers["main"].info(
+                f"Semantic workflow cache lookup: tier={tier} score={score:.4f}"
+            )
+            return vector, tier, payload
+
+        except Exception as e:
+            error_msg = f"Semantic workflow cache lookup failed: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "semantic_cache_usecase.py",
+                    "method": "lookup",
+                    "operation": "semantic_cache_lookup",
+                    "response_text": error_msg,
+                    "subject": query.get("subject", ""),
+                },
+            )
+            return None, None, None
+
+    def reuse_categorization(self, query: Dict, payload: Dict) -> Dict:
+        """Cached categorization with the current email's own fields."""
+        return {
+            **payload["categorization"],
+            "new_categories": [],
+            "from": query.get("sender", ""),
+            "body": query.get("body", ""),
+            "subject": query.get("subject", ""),
+        }
+
+    def record_hit(self, tier: str, payload: Dict):
+        # Categorization is one Gemini call; drafts are one call per draft
+        gemini_calls_saved = 1 + (
+            payload["draft_calls"] if tier == DRAFT else 0
+        )
+        self.semantic_workflow_cache.record_hit(tier, gemini_calls_saved)
+
+    def store(
+        self,
+        vector: Optional[List[float]],
+        categorization_response: Dict,
+        rocket_docs_response: list,
+        dataset_response: list,
+        final_draft_body: str,
+        draft_calls: int,
+        index_versions: Dict[str, int],
+    ):
+        """
+        Keep a completed workflow for reuse by similar emails.
+
+        :param index_versions: ``index_versions()`` from before retrieval
+            ran; a later write to either index makes the stored retrieval
+            results stale
+        """
+        categories = categorization_response.get("categories")
+        if vector is None or self.semantic_workflow_cache.is_excluded(
+            categories
+        ):
+            return
+        self.semantic_workflow_cache.store(
+            vector,
+            {
+                "categorization": {
+                    key: value
+                    for key, value in categorization_response.items()
+                    if key not in ("from", "body", "subject")
+                },
+                "rocket_docs_response": rocket_docs_response,
+                "dataset_response": dataset_response,
+                "final_draft_body": final_draft_body,
+                "sender": categorization_response.get("from", ""),
+                "draft_calls": draft_calls,
+                "index_versions": index_versions,
+            },
+        )
@@ -1,8 +1,30 @@
+import asyncio
+import time
+from typing import Optional
+
 from fastapi import Depends, HTTPException, status
 
+from system.src.app.config.settings import settings
 from system.src.app.repositories.error_repository import ErrorRepo
+from system.src.app.services.category_namespaces import (
+    CategoryNamespaceLayout,
+    category_namespace_layout,
+)
 from system.src.app.services.embedding_service import EmbeddingService
+from system.src.app.services.index_migration_monitor import (
+    IndexMigrationMonitor,
+    index_migration_monitor,
+)
+from system.src.app.services.matryoshka_retrieval import (
+    MatryoshkaRetrieval,
+    matryoshka_retrieval,
+)
 from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.vector_store import VectorStore
+from system.src.app.services.vector_store_registry import (
+    VectorStoreRegistry,
+    vector_store_registry,
+)
 from system.src.app.utils.logging_utils import loggers
 
 
@@ -13,39 +35,75 @@ class PineconeQueryUseCase:
         embedding_service: EmbeddingService = Depends(EmbeddingService),
         pinecone_service: PineconeService = Depends(PineconeService),
         error_repo: ErrorRepo = Depends(ErrorRepo),
+        vector_stores: VectorStoreRegistry = Depends(
+            lambda: vector_store_registry
+        ),
+        category_layout: CategoryNamespaceLayout = Depends(
+            lambda: category_namespace_layout
+        ),
+        matryoshka: MatryoshkaRetrieval = Depends(
+            lambda: matryoshka_retrieval
+        ),
+        migration_monitor: IndexMigrationMonitor = Depends(
+            lambda: index_migration_monitor
+        ),
     ):
         self.embedding_service = embedding_service
         self.pinecone_service = pinecone_service
         self.error_repo = error_repo
+        self.vector_stores = vector_stores
+        self.category_layout = category_layout
+        self.matryoshka = matryoshka
+        self.migration_monitor = migration_monitor
+        self.shadow_tasks = set()
         self.embeddings_provider_mapping = {
             "llama-text-embed-v2": "pinecone",
             "multilingual-e5-large": "pinecone",
         }
+        self.default_embed_model = "llama-text-embed-v2"
+        self.default_dimension = 1024
+        self.text_field = settings.PINECONE_INTEGRATED_TEXT_FIELD
+        # Record fields the draft prompts read from retrieval metadata
+        self.integrated_fields = [
+            self.text_field,
+            "categories",
+            "response",
+            "from",
+            "subject",
+            "url",
+        ]
         self.model_to_dimensions = {
             "llama-text-embed-v2": [1024, 2048, 768, 512, 384],
             "multilingual-e5-large": [1024],
         }
 
     async def _get_query_embeddings(self, query, embed_model, dimension):
+        vectors = await self.get_query_embeddings_batch(
+            [query], embed_model, dimension
+        )
+        return vectors[0]
+
+    async def get_query_embeddings_batch(
+        self, queries: list, embed_model: str, dimension: int
+    ) -> list:
+        """
+        Embed several queries with a single embedding request.
+
+        :param queries: Query texts
+        :param embed_model: Embedding model name
+        :param dimension: Embedding dimension
+        :return: One dense vector per query, in order
+        """
         try:
             embedding_provider = self.embeddings_provider_mapping.get(
                 embed_model
             )
             if embedding_provider == "pinecone":
-
-                query_pinecone_response = (
-                    await self.embedding_service.pinecone_dense_embeddings(
-                        inputs=[query],
-                        embedding_model=embed_model,
-                        input_type="query",
-                        dimension=dimension,
-                    )
+                return await self.embedding_service.pinecone_query_embeddings(
+                    inputs=queries,
+                    embedding_model=embed_model,
+                    dimension=dimension,
                 )
-                # query_dense_embeds = [
-                #     item["values"]
-                #     for item in query_pinecone_response.get("data", [])
-                # ]
-                return query_pinecone_response[0]
 
             else:
                 raise HTTPException(
@@ -59,10 +117,11 @@ class PineconeQueryUseCase:
                 error=error_msg,
                 additional_context={
                     "file": "pinecone_query_usecase.py",
-                    "method": "_get_query_embeddings",
+                    "method": "get_query_embeddings_batch",
                     "operation": "query_embedding_generation",
                     "response_text": error_msg,
-                    "query": query[:100] if query else "",  # Truncate query for logging
+                    "query": queries[0][:100] if queries else "",  # Truncate query for logging
+                    "query_count": len(queries),
                     "embed_model": embed_model,
                     "dimension": dimension,
                 },
@@ -73,6 +132,429 @@ class PineconeQueryUseCase:
                 detail=error_msg,
             )
 
+    async def get_query_sparse_vectors(self, queries: list) -> list:
+        sparse_vectors = await self.embedding_service.pinecone_sparse_embeddings(
+            queries
+        )
+        loggers["main"].info(
+            "sparse embeddings generated in random query use case"
+        )
+        return sparse_vectors
+
+    def vector_store(self, index_name: str) -> VectorStore:
+        return self.vector_stores.for_query(index_name, self.pinecone_service)
+
+    async def query_index(
+        self,
+        index_name: str,
+        query_dense_vector: list,
+        query_sparse_vector: dict = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        categories: list = None,
+        namespace: str = "default",
+        include_metadata: bool = True,
+        query_text: Optional[str] = None,
+    ) -> list:
+        """
+        Run a dense or hybrid query with precomputed vectors.
+
+        :param index_name: Index to query, on whichever backend serves it
+        :param query_dense_vector: Dense query vector
+        :param query_sparse_vector: Sparse query vector; hybrid when given
+        :param categories: Optional category filter; with category
+            namespaces enabled, the category namespaces are queried instead
+        :param query_text: Query text, used to embed shadow reads against a
+            migration target with a different embedding
+        :return: Formatted matches (id, score, content, metadata)
+        """
+        if not self.migration_monitor.should_shadow(index_name):
+            return await self._query_index(
+                index_name,
+                query_dense_vector,
+                query_sparse_vector,
+                top_k,
+                alpha,
+                categories,
+                namespace,
+                include_metadata,
+            )
+
+        start = time.perf_counter()
+        results = await self._query_index(
+            index_name,
+            query_dense_vector,
+            query_sparse_vector,
+            top_k,
+            alpha,
+            categories,
+            namespace,
+            include_metadata,
+        )
+        primary_ms = (time.perf_counter() - start) * 1000
+        # Shadow reads run after the response, off the request path
+        task = asyncio.create_task(
+            self._shadow_query(
+                query_text,
+                query_dense_vector,
+                query_sparse_vector,
+                top_k,
+                alpha,
+                categories,
+                namespace,
+                primary_ms,
+                [result["id"] for result in results],
+            )
+        )
+        self.shadow_tasks.add(task)
+        task.add_done_callback(self.shadow_tasks.discard)
+        return results
+
+    async def shutdown(self):
+        """Cancel shadow queries still in flight"""
+        tasks = list(self.shadow_tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _shadow_query(
+        self,
+        query_text: Optional[str],
+        query_dense_vector: list,
+        query_sparse_vector: Optional[dict],
+        top_k: int,
+        alpha: float,
+        categories: Optional[list],
+        namespace: str,
+        primary_ms: float,
+        primary_ids: list,
+    ):
+        """
+        Repeat a dataset query against the migration target and record
+        latency and overlap with the primary results.
+        """
+        migration = self.migration_monitor.migration
+        if migration is None:
+            return
+        try:
+            start = time.perf_counter()
+            if migration["embed_model"] == self.default_embed_model and migration[
+                "dimension"
+            ] == len(query_dense_vector):
+                target_dense_vector = query_dense_vector
+            elif query_text:
+                target_dense_vector = await self._get_query_embeddings(
+                    query_text, migration["embed_model"], migration["dimension"]
+                )
+            else:
+                return
+            target_sparse_vector = query_sparse_vector
+            sparse_encoder = self.migration_monitor.sparse_encoder
+            if query_sparse_vector is not None and sparse_encoder is not None:
+                # The target index uses a different BM25 vocabulary
+                if not query_text:
+                    return
+                target_sparse_vector = (
+                    await self.embedding_service.pinecone_sparse_embeddings(
+                        [query_text], encoder=sparse_encoder
+                    )
+                )[0]
+            metadata_filter = None
+            if categories:
+                metadata_filter = {"categories": {"$in": categories}}
+            response = await self.vector_store(migration["target_index"]).query(
+                target_dense_vector,
+                target_sparse_vector,
+                top_k=top_k,
+                alpha=alpha,
+                filter_dict=metadata_filter,
+                include_metadata=False,
+                namespace=namespace,
+            )
+            self.migration_monitor.record(
+                primary_ms,
+                (time.perf_counter() - start) * 1000,
+                primary_ids,
+                [match["id"] for match in response.get("matches", [])],
+            )
+        except Exception as e:
+            self.migration_monitor.shadow_errors += 1
+            loggers["main"].warning(f"Shadow query failed: {str(e)}")
+
+    async def _query_index(
+        self,
+        index_name: str,
+        query_dense_vector: list,
+        query_sparse_vector: Optional[dict],
+        top_k: int,
+        alpha: float,
+        categories: Optional[list],
+        namespace: str,
+        include_metadata: bool,
+    ) -> list:
+        if self.matryoshka.applies_to(index_name):
+            return self.format_matches(
+                await self._two_stage_query(
+                    query_dense_vector,
+                    query_sparse_vector,
+                    top_k,
+                    alpha,
+                    categories,
+                    namespace,
+                )
+            )
+
+        vector_store = self.vector_store(index_name)
+
+        if categories and self.category_layout.applies_to(index_name):
+            # Namespace membership replaces the metadata filter
+            category_namespaces = self.category_layout.namespaces_for(
+                categories
+            )
+            responses = await asyncio.gather(
+                *[
+                    self._query_namespace(
+                        vector_store,
+                        query_dense_vector,
+                        query_sparse_vector,
+                        top_k,
+                        alpha,
+                        None,
+                        category_namespace,
+                        include_metadata,
+                    )
+                    for category_namespace in category_namespaces
+                ]
+            )
+            return self.format_matches(
+                self.category_layout.merge(responses, top_k)
+            )
+
+        # Prepare metadata filter if categories are provided
+        metadata_filter = None
+        if categories:
+            metadata_filter = {"categories": {"$in": categories}}
+
+        pinecone_response = await self._query_namespace(
+            vector_store,
+            query_dense_vector,
+            query_sparse_vector,
+            top_k,
+            alpha,
+            metadata_filter,
+            namespace,
+            include_metadata,
+        )
+        return self.format_matches(pinecone_response)
+
+    async def _query_namespace(
+        self,
+        vector_store: VectorStore,
+        query_dense_vector: list,
+        query_sparse_vector: Optional[dict],
+        top_k: int,
+        alpha: float,
+        metadata_filter: Optional[dict],
+        namespace: str,
+        include_metadata: bool,
+    ) -> dict:
+        two_phase = (
+            include_metadata
+            and vector_store.is_remote
+            and settings.TWO_PHASE_RETRIEVAL_ENABLED
+        )
+        pinecone_response = await vector_store.query(
+            query_dense_vector,
+            query_sparse_vector,
+            top_k=top_k,
+            alpha=alpha,
+            filter_dict=metadata_filter,
+            include_metadata=include_metadata and not two_phase,
+            namespace=namespace,
+        )
+        if two_phase:
+            pinecone_response = await self._attach_metadata(
+                vector_store, pinecone_response, namespace
+            )
+        return pinecone_response
+
+    async def _two_stage_query(
+        self,
+        query_dense_vector: list,
+        query_sparse_vector: Optional[dict],
+        top_k: int,
+        alpha: float,
+        categories: Optional[list],
+        namespace: str,
+    ) -> dict:
+        """
+        Scan the low-dimension index for candidate IDs, then rescore them
+        against the full-dimension vectors held locally.
+
+        Candidates without a local full vector, i.e. not yet backfilled,
+        keep their low-dimension score. That score is on another scale,
+        so they rank after every rescored match, in candidate order.
+
+        :return: Query response with the best ``top_k`` rescored matches
+        """
+        metadata_filter = None
+        if categories:
+            metadata_filter = {"categories": {"$in": categories}}
+
+        low_dim_store = self.vector_store(self.matryoshka.low_dim_index_name)
+        candidates = await low_dim_store.query(
+            self.matryoshka.truncate(query_dense_vector),
+            query_sparse_vector,
+            top_k=self.matryoshka.candidate_count(top_k),
+            alpha=alpha,
+            filter_dict=metadata_filter,
+            include_metadata=False,
+            namespace=namespace,
+        )
+        rescored = self.matryoshka.rescore(
+            candidates, query_dense_vector, query_sparse_vector, alpha, namespace
+        )
+        matches = rescored["matches"]
+        if rescored["missing"]:
+            # Not yet backfilled locally: keep the low-dimension score
+            metadata = await low_dim_store.fetch_metadata(
+                [match["id"] for match in rescored["missing"]], namespace
+            )
+            matches = matches + [
+                {**match, "metadata": metadata[match["id"]]}
+                for match in rescored["missing"]
+                if match["id"] in metadata
+            ]
+        return {"matches": matches[:top_k], "namespace": namespace}
+
+    async def _attach_metadata(
+        self, vector_store: VectorStore, id_response: dict, namespace: str
+    ) -> dict:
+        """
+        Second phase of a two-phase query: keep the matches that can survive
+        reranking and attach their metadata by ID.
+
+        :param vector_store: Store the ID-only query ran against
+        :param id_response: Query response without metadata
+        :return: Query response with metadata on the surviving matches
+        """
+        survivors = [
+            match
+            for match in id_response.get("matches", [])
+            if match.get("score", 0) > settings.RERANK_MIN_SCORE
+        ]
+        metadata = await vector_store.fetch_metadata(
+            [match["id"] for match in survivors], namespace
+        )
+        return {
+            **id_response,
+            "matches": [
+                {**match, "metadata": metadata[match["id"]]}
+                for match in survivors
+                if match["id"] in metadata
+            ],
+        }
+
+    def format_matches(self, pinecone_response: dict) -> list:
+        matches = pinecone_response.get("matches", [])
+        final_responses = []
+        for match in matches:
+            score = match.get("score", None)
+            id = match.get("id", None)
+            content = match.get("metadata", None).get("content", None)
+            metadata = {
+                key: value
+                for key, value in match.get("metadata").items()
+                if key != "content"
+            }
+            final_responses.append(
+                {
+                    "id": id,
+                    "score": score,
+                    "content": content,
+                    "metadata": metadata,
+                }
+            )
+        return final_responses
+
+    async def integrated_search(
+        self,
+        query: str,
+        index_name: str,
+        top_k: int = 20,
+        top_n: int = 5,
+        categories: list = None,
+        namespace: str = "default",
+    ) -> list:
+        """
+        Search an integrated-inference index by text with hosted rerank.
+
+        Embedding, retrieval and reranking happen in one Pinecone request,
+        replacing the separate embed, query and rerank round trips.
+
+        :param query: Query text
+        :param index_name: Index created with integrated embedding
+        :param top_k: Candidates retrieved before reranking
+        :param top_n: Number of reranked results to keep
+        :param categories: Optional category filter
+        :return: Reranked results with query, relevance_score and metadata
+        """
+        try:
+            metadata_filter = None
+            if categories:
+                metadata_filter = {"categories": {"$in": categories}}
+
+            host = await self.pinecone_service.get_index_host(
+                index_name=index_name
+            )
+            response = await self.pinecone_service.search_records(
+                host,
+                query,
+                top_k,
+                fields=self.integrated_fields,
+                filter_dict=metadata_filter,
+                rerank_top_n=top_n,
+                namespace=namespace,
+            )
+            return self.format_hits(response)
+
+        except Exception as e:
+            error_msg = f"Error in integrated_search: {str(e)}"
+            await self.error_repo.log_error(
+                error=error_msg,
+                additional_context={
+                    "file": "pinecone_query_usecase.py",
+                    "method": "integrated_search",
+                    "operation": "pinecone_integrated_search",
+                    "response_text": error_msg,
+                    "query": query[:100] if query else "",
+                    "index_name": index_name,
+                    "top_k": top_k,
+                    "categories": categories,
+                },
+            )
+            loggers["main"].error(f"Error in integrated_search: {str(e)}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=error_msg
+            )
+
+    def format_hits(self, search_response: dict) -> list:
+        final_responses = []
+        for hit in search_response.get("result", {}).get("hits", []):
+            fields = hit.get("fields", {})
+            final_responses.append(
+                {
+                    "query": fields.get(self.text_field),
+                    "relevance_score": hit.get("_score", 0),
+                    "metadata": {
+                        key: value
+                        for key, value in fields.items()
+                        if key != self.text_field
+                    },
+                }
+            )
+        return final_responses
+
     async def random_query(
         self,
         query,
@@ -83,8 +565,8 @@ class PineconeQueryUseCase:
         categories=None,
     ):
         try:
-            embed_model = "llama-text-embed-v2"
-            dimension = 1024
+            embed_model = self.default_embed_model
+            dimension = self.default_dimension
             top_k = top_k
             is_hybrid = is_hybrid
             include_metadata = True
@@ -96,68 +578,27 @@ class PineconeQueryUseCase:
             #     index_name = settings.PINECONE_INDEX_NAME
             #     metric = "cosine"
 
-            host = await self.pinecone_service.get_index_host(
-                index_name=index_name
-            )
             query_dense_vector = await self._get_query_embeddings(
                 query, embed_model, dimension
             )
 
-            # Prepare metadata filter if categories are provided
-            metadata_filter = None
-            if categories:
-                metadata_filter = {"categories": {"$in": categories}}
-
+            query_sparse_vector = None
             if is_hybrid:
                 query_sparse_vector = (
-                    self.embedding_service.pinecone_sparse_embeddings([query])
-                )
-                query_sparse_vector = query_sparse_vector[0]
-                alpha = alpha
-                loggers["main"].info(
-                    "sparse embeddings generated in random query use case"
-                )
-                pinecone_response = (
-                    await self.pinecone_service.pinecone_hybrid_query(
-                        host,
-                        namespace,
-                        top_k,
-                        alpha,
-                        query_dense_vector,
-                        query_sparse_vector,
-                        include_metadata,
-                        metadata_filter,
-                    )
-                )
-            else:
-                pinecone_response = await self.pinecone_service.pinecone_query(
-                    index_host=host,
-                    namespace=namespace,
-                    top_k=top_k,
-                    vector=query_dense_vector,
-                    include_metadata=include_metadata,
-                    filter_dict=metadata_filter,
-                )
-            matches = pinecone_response.get("matches", [])
-            final_responses = []
-            for match in matches:
-                score = match.get("score", None)
-                id = match.get("id", None)
-                content = match.get("metadata", None).get("content", None)
-                metadata = {
-                    key: value
-                    for key, value in match.get("metadata").items()
-                    if key != "content"
-                }
-                final_responses.append(
-                    {
-                        "id": id,
-                        "score": score,
-                        "content": content,
-                        "metadata": metadata,
-                    }
-                )
-            return final_responses
+                    await self.get_query_sparse_vectors([query])
+                )[0]
+
+            return await self.query_index(
+                index_name,
+                query_dense_vector,
+                query_sparse_vector,
+                top_k=top_k,
+                alpha=alpha,
+                categories=categories,
+                namespace=namespace,
+                include_metadata=include_metadata,
+                query_text=query,
+            )
 
         except Exception as e:
             error_msg = f"Error in random_query_usecase: {str(e)}"
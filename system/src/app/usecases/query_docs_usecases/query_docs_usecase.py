@@ -1,10 +1,26 @@
+import time
+from typing import List, Tuple
+
 from fastapi import Depends
 
 from system.src.app.config.settings import settings
+from system.src.app.services.adaptive_rerank_policy import (
+    AdaptiveRerankPolicy,
+    adaptive_rerank_policy,
+)
+from system.src.app.services.local_reranker import (
+    LocalReranker,
+    local_reranker,
+)
 from system.src.app.services.re_ranking_service import RerankerService
+from system.src.app.services.retrieval_result_cache import (
+    RetrievalResultCache,
+    retrieval_result_cache,
+)
 from system.src.app.usecases.query_docs_usecases.pinecone_query_usecase import (
     PineconeQueryUseCase,
 )
+from system.src.app.utils.logging_utils import loggers
 
 
 class QueryDocsUsecase:
@@ -14,9 +30,19 @@ class QueryDocsUsecase:
             PineconeQueryUseCase
         ),
         reranker_service: RerankerService = Depends(RerankerService),
+        retrieval_result_cache: RetrievalResultCache = Depends(
+            lambda: retrieval_result_cache
+        ),
+        rerank_policy: AdaptiveRerankPolicy = Depends(
+            lambda: adaptive_rerank_policy
+        ),
+        local_reranker: LocalReranker = Depends(lambda: local_reranker),
     ):
         self.pinecone_query_usecase = pinecone_query_usecase
         self.reranker_service = reranker_service
+        self.retrieval_result_cache = retrieval_result_cache
+        self.rerank_policy = rerank_policy
+        self.local_reranker = local_reranker
 
     async def query_docs(
         self,
@@ -28,35 +54,102 @@ class QueryDocsUsecase:
         top_n: int = 5,
         categories: list = None,
     ):
-        pinecone_response = await self.pinecone_query_usecase.random_query(
-            query, index_name, top_k, is_hybrid, alpha, categories
+        cache_key = self.retrieval_result_cache.make_key(
+            query, index_name, categories, top_k, alpha, top_n, is_hybrid
         )
-        filtered_docs = [
-            chunk.get("content")
+        if settings.RETRIEVAL_CACHE_ENABLED:
+            cached = self.retrieval_result_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if self.pinecone_query_usecase.pinecone_service.uses_integrated_inference(
+            index_name
+        ):
+            results = await self.pinecone_query_usecase.integrated_search(
+                query, index_name, top_k, top_n, categories
+            )
+        else:
+            pinecone_response = await self.pinecone_query_usecase.random_query(
+                query, index_name, top_k, is_hybrid, alpha, categories
+            )
+            results = await self.rerank_matches(
+                query, pinecone_response, top_n
+            )
+        if settings.RETRIEVAL_CACHE_ENABLED:
+            self.retrieval_result_cache.put(cache_key, results)
+        return results
+
+    async def rerank_matches(
+        self, query: str, pinecone_response: list, top_n: int = 5
+    ):
+        """
+        Rerank formatted Pinecone matches for ``query``.
+
+        :param query: Query text
+        :param pinecone_response: Matches from the vector query
+        :param top_n: Number of reranked results to keep
+        :return: Reranked results with query, relevance_score and metadata
+        """
+        candidates = [
+            chunk
             for chunk in pinecone_response
-            if chunk["score"] > 0.2
+            if chunk["score"] > settings.RERANK_MIN_SCORE
         ]
-        if not filtered_docs:
+        if not candidates:
             return []
+        filtered_docs = [chunk.get("content") for chunk in candidates]
 
-        reranked_results = await self.reranker_service.voyage_rerank(
-            model_name=settings.VOYAGEAI_RERANKING_MODEL,
-            query=query,
-            documents=filtered_docs,
-            top_n=top_n,
+        skip_reason = self.rerank_policy.skip_reason(
+            [chunk["score"] for chunk in candidates], top_n
         )
+        if skip_reason:
+            start = time.perf_counter()
+            ranked = self._rerank_locally(query, candidates, top_n)
+            self.rerank_policy.record_skip(
+                skip_reason, time.perf_counter() - start
+            )
+            loggers["voyageai"].info(
+                f"Remote rerank skipped ({skip_reason}) for {len(candidates)} candidates"
+            )
+        else:
+            start = time.perf_counter()
+            reranked_results = await self.reranker_service.voyage_rerank(
+                model_name=settings.VOYAGEAI_RERANKING_MODEL,
+                query=query,
+                documents=filtered_docs,
+                top_n=top_n,
+            )
+            self.rerank_policy.record_remote(time.perf_counter() - start)
+            ranked = [
+                (result.get("index"), result.get("relevance_score", 0))
+                for result in reranked_results.get("data", [])
+            ]
+
         final_results = []
-        for result in reranked_results.get("data", []):
-            index = result.get("index")
+        for index, relevance_score in ranked:
             if index is not None and 0 <= index < len(filtered_docs):
                 final_results.append(
                     {
                         "query": filtered_docs[index],
-                        "relevance_score": result.get("relevance_score", 0),
-                        "metadata": pinecone_response[index].get(
-                            "metadata", {}
-                        ),
+                        "relevance_score": relevance_score,
+                        "metadata": candidates[index].get("metadata", {}),
                     }
                 )
 
         return final_results
+
+    def _rerank_locally(
+        self, query: str, candidates: list, top_n: int
+    ) -> List[Tuple[int, float]]:
+        if settings.LOCAL_RERANK_ENABLED:
+            return self.local_reranker.rerank(
+                query,
+                [chunk.get("content") or "" for chunk in candidates],
+                [chunk["score"] for chunk in candidates],
+                top_n,
+            )
+        # Pinecone already returns matches best first
+        return [
+            (index, chunk["score"])
+            for index, chunk in enumerate(candidates[:top_n])
+        ]
@@ -0,0 +1,373 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, List, Optional
+
+from fastapi import Depends
+
+from system.src.app.config.settings import settings
+from system.src.app.services.pinecone_service import PineconeService
+from system.src.app.services.retrieval_result_cache import (
+    RetrievalResultCache,
+    retrieval_result_cache,
+)
+from system.src.app.usecases.query_docs_usecases.pinecone_query_usecase import (
+    PineconeQueryUseCase,
+)
+from system.src.app.usecases.query_docs_usecases.query_docs_usecase import (
+    QueryDocsUsecase,
+)
+from system.src.app.utils.logging_utils import loggers
+
+
+class RetrievalStageUsecase:
+    """
+    Retrieval for the draft workflow in one pass over both indexes.
+
+    The rocket-docs query and the dataset query share a single dense
+    embedding request and a single sparse encoding call; host resolution
+    and both encodings run concurrently, then both index queries and their
+    reranks run concurrently. Searches answered by the retrieval result
+    cache skip all of it.
+
+    The dataset search can also be started speculatively, unfiltered, while
+    the email is still being categorized; once categories are known the
+    speculative candidates are post-filtered and only reranked, and the
+    filtered query runs only if too few candidates survive.
+
+    Indexes listed in ``PINECONE_INTEGRATED_INFERENCE_INDEXES`` bypass the
+    shared encodings and are searched by text with hosted rerank instead.
+    """
+
+    def __init__(
+        self,
+        pinecone_query_usecase: PineconeQueryUseCase = Depends(
+            PineconeQueryUseCase
+        ),
+        query_docs_usecase: QueryDocsUsecase = Depends(QueryDocsUsecase),
+        pinecone_service: PineconeService = Depends(PineconeService),
+        retrieval_result_cache: RetrievalResultCache = Depends(
+            lambda: retrieval_result_cache
+        ),
+    ):
+        self.pinecone_query_usecase = pinecone_query_usecase
+        self.query_docs_usecase = query_docs_usecase
+        self.pinecone_service = pinecone_service
+        self.retrieval_result_cache = retrieval_result_cache
+        self.speculative_used = 0
+        self.speculative_fallbacks = 0
+
+    async def _timed(
+        self, timings: Dict[str, float], step: str, awaitable: Awaitable
+    ) -> Any:
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            timings[step] = round(time.perf_counter() - start, 4)
+
+    async def _resolve_hosts(self, index_names: List[str]) -> List[str]:
+        # Warms the host cache for the Pinecone-backed indexes while the
+        # query encodings run; local indexes have no host
+        return await asyncio.gather(
+            *[
+                self.pinecone_service.get_index_host(index_name=index_name)
+                for index_name in index_names
+                if not self.pinecone_query_usecase.vector_stores.is_local(
+                    index_name
+                )
+            ]
+        )
+
+    async def _search(
+        self,
+        timings: Dict[str, float],
+        label: str,
+        query: str,
+        index_name: str,
+        dense_vector: list,
+        sparse_vector: dict,
+        categories: Optional[list],
+        top_k: int,
+        alpha: float,
+        top_n: int,
+    ) -> list:
+        matches = await self._timed(
+            timings,
+            f"{label}_query",
+            self.pinecone_query_usecase.query_index(
+                index_name,
+                dense_vector,
+                sparse_vector,
+                top_k=top_k,
+                alpha=alpha,
+                categories=categories,
+                query_text=query,
+            ),
+        )
+        return await self._timed(
+            timings,
+            f"{label}_rerank",
+            self.query_docs_usecase.rerank_matches(query, matches, top_n),
+        )
+
+    async def speculative_dataset_search(
+        self, dataset_query: str, alpha: float = 0.8
+    ) -> Optional[list]:
+        """
+        Unfiltered dataset search started before categories are known.
+
+        :param dataset_query: Subject and body of the incoming email
+        :return: Formatted matches, or None if the search failed
+        """
+        # Integrated search reranks server-side, so there is nothing to
+        # post-filter; the filtered search is already a single request
+        if self.pinecone_service.uses_integrated_inference(
+            settings.PINECONE_INDEX_NAME
+        ):
+            return None
+        try:
+            _, dense_vectors, sparse_vectors = await asyncio.gather(
+                self._resolve_hosts([settings.PINECONE_INDEX_NAME]),
+                self.pinecone_query_usecase.get_query_embeddings_batch(
+                    [dataset_query],
+                    self.pinecone_query_usecase.default_embed_model,
+                    self.pinecone_query_usecase.default_dimension,
+                ),
+                self.pinecone_query_usecase.get_query_sparse_vectors(
+                    [dataset_query]
+                ),
+            )
+            return await self.pinecone_query_usecase.query_index(
+                settings.PINECONE_INDEX_NAME,
+                dense_vectors[0],
+                sparse_vectors[0],
+                top_k=settings.SPECULATIVE_RETRIEVAL_TOP_K,
+                alpha=alpha,
+                query_text=dataset_query,
+            )
+
+        except Exception as e:
+            loggers["main"].warning(
+                f"Speculative dataset search failed, falling back to filtered query: {str(e)}"
+            )
+            return None
+
+    @staticmethod
+    def _post_filter(matches: list, categories: list, top_k: int) -> list:
+        wanted = set(categories)
+        return [
+            match
+            for match in matches
+            if wanted.intersection(
+                match.get("metadata", {}).get("categories") or []
+            )
+        ][:top_k]
+
+    async def retrieve(
+        self,
+        rocket_docs_query: Optional[str],
+        dataset_query: Optional[str],
+        categories: Optional[list] = None,
+        top_k: int = 20,
+        alpha: float = 0.8,
+        top_n: int = 5,
+        speculative_dataset_matches: Optional[list] = None,
+    ) -> Dict[str, Any]:
+        """
+        Retrieve and rerank context from the rocket-docs and dataset indexes.
+
+        :param rocket_docs_query: Documentation search query; skipped if empty
+        :param dataset_query: Dataset search query; skipped without categories
+        :param categories: Categories used to filter the dataset index
+        :param speculative_dataset_matches: Unfiltered dataset matches from
+            ``speculative_dataset_search`` to post-filter instead of querying
+        :return: rocket_docs_response, dataset_response and per-step timings
+        """
+        timings: Dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        searches = []
+        if rocket_docs_query and rocket_docs_query.strip():
+            searches.append(
+                (
+                    "rocket_docs",
+                    rocket_docs_query,
+                    settings.ROCKET_DOCS_PINECONE_INDEX_NAME,
+                    None,
+                )
+            )
+        if categories and dataset_query:
+            searches.append(
+                (
+                    "dataset",
+                    dataset_query,
+                    settings.PINECONE_INDEX_NAME,
+                    categories,
+                )
+            )
+
+        results: Dict[str, list] = {"rocket_docs": [], "dataset": []}
+        cache_keys = {}
+        if settings.RETRIEVAL_CACHE_ENABLED:
+            pending = []
+            for search in searches:
+                label, query, index_name, search_categories = search
+                cache_keys[label] = self.retrieval_result_cache.make_key(
+                    query, index_name, search_categories, top_k, alpha, top_n
+                )
+                cached = self.retrieval_result_cache.get(cache_keys[label])
+                if cached is not None:
+                    results[label] = cached
+                    timings[f"{label}_cache_hit"] = 0.0
+                else:
+                    pending.append(search)
+            searches = pending
+
+        speculative_rerank = None
+        if speculative_dataset_matches is not None and any(
+            label == "dataset" for label, _, _, _ in searches
+        ):
+            survivors = self._post_filter(
+                speculative_dataset_matches, categories, top_k
+            )
+            if len(survivors) >= settings.SPECULATIVE_RETRIEVAL_MIN_SURVIVORS:
+                self.speculative_used += 1
+                searches = [s for s in searches if s[0] != "dataset"]
+                speculative_rerank = self._timed(
+                    timings,
+                    "dataset_speculative_rerank",
+                    self.query_docs_usecase.rerank_matches(
+                        dataset_query, survivors, top_n
+                    ),
+                )
+            else:
+                self.speculative_fallbacks += 1
+
+        if speculative_rerank is not None:
+            results["dataset"], searched = await asyncio.gather(
+                speculative_rerank,
+                self._run_searches(
+                    timings, searches, top_k, alpha, top_n, cache_keys
+                ),
+            )
+            if "dataset" in cache_keys:
+                self.retrieval_result_cache.put(
+                    cache_keys["dataset"], results["dataset"]
+                )
+        else:
+            searched = await self._run_searches(
+                timings, searches, top_k, alpha, top_n, cache_keys
+            )
+        results.update(searched)
+
+        timings["total"] = round(time.perf_counter() - stage_start, 4)
+        loggers["main"].info(f"Retrieval stage timings: {timings}")
+        return {
+            "rocket_docs_response": results["rocket_docs"],
+            "dataset_response": results["dataset"],
+            "timings": timings,
+        }
+
+    async def _run_searches(
+        self,
+        timings: Dict[str, float],
+        searches: list,
+        top_k: int,
+        alpha: float,
+        top_n: int,
+        cache_keys: Dict[str, Any],
+    ) -> Dict[str, list]:
+        integrated = [
+            search
+            for search in searches
+            if self.pinecone_service.uses_integrated_inference(search[2])
+        ]
+        hybrid = [search for search in searches if search not in integrated]
+
+        responses = await asyncio.gather(
+            self._hybrid_searches(timings, hybrid, top_k, alpha, top_n),
+            *[
+                self._timed(
+                    timings,
+                    f"{label}_integrated_search",
+                    self.pinecone_query_usecase.integrated_search(
+                        query, index_name, top_k, top_n, search_categories
+                    ),
+                )
+                for label, query, index_name, search_categories in integrated
+            ],
+        )
+
+        results: Dict[str, list] = {}
+        ordered = hybrid + integrated
+        for (label, _, _, _), response in zip(
+            ordered, responses[0] + list(responses[1:])
+        ):
+            results[label] = response
+            if label in cache_keys:
+                self.retrieval_result_cache.put(cache_keys[label], response)
+        return results
+
+    async def _hybrid_searches(
+        self,
+        timings: Dict[str, float],
+        searches: list,
+        top_k: int,
+        alpha: float,
+        top_n: int,
+    ) -> list:
+        if not searches:
+            return []
+        queries = [query for _, query, _, _ in searches]
+        _, dense_vectors, sparse_vectors = await asyncio.gather(
+            self._timed(
+                timings,
+                "host_resolution",
+                self._resolve_hosts([index for _, _, index, _ in searches]),
+            ),
+            self._timed(
+                timings,
+                "dense_embedding",
+                self.pinecone_query_usecase.get_query_embeddings_batch(
+                    queries,
+                    self.pinecone_query_usecase.default_embed_model,
+                    self.pinecone_query_usecase.default_dimension,
+                ),
+            ),
+            self._timed(
+                timings,
+                "sparse_encoding",
+                self.pinecone_query_usecase.get_query_sparse_vectors(queries),
+            ),
+        )
+
+        return list(
+            await asyncio.gather(
+                *[
+                    self._search(
+                        timings,
+                        label,
+                        query,
+                        index_name,
+                        dense_vectors[i],
+                        sparse_vectors[i],
+                        search_categories,
+                        top_k,
+                        alpha,
+                        top_n,
+                    )
+                    for i, (
+                        label,
+                        query,
+                        index_name,
+                        search_categories,
+                    ) in enumerate(searches)
+                ]
+            )
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "speculative_used": self.speculative_used,
+            "speculative_fallbacks": self.speculative_fallbacks,
+        }
@@ -0,0 +1,174 @@
+import codecs
+import json
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict
+
+ReadFn = Callable[[int], Awaitable[bytes]]
+FieldFn = Callable[[str, Any], None]
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789+-.eE"
+
+
+class _JSONStreamReader:
+    """
+    Incremental JSON values over an async byte source.
+
+    Keeps only the unparsed tail of the input in memory. A value that does
+    not parse yet is retried after reading more, with the read size
+    doubling so a large value is not re-parsed once per chunk.
+    """
+
+    def __init__(self, read: ReadFn, chunk_size: int, max_value_bytes: int):
+        self.read = read
+        self.chunk_size = chunk_size
+        self.max_value_bytes = max_value_bytes
+        self.text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self.buffer, self.pos)
+
+    async def fill(self, size: int = 0) -> bool:
+        if self.eof:
+            return False
+        chunk = await self.read(max(size, self.chunk_size))
+        self.buffer = self.buffer[self.pos :]
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+            self.buffer += self.text_decoder.decode(b"", final=True)
+            return False
+        self.buffer += self.text_decoder.decode(chunk)
+        return True
+
+    async def peek(self) -> str:
+        """Next non-whitespace character, or "" at the end of input"""
+        while True:
+            while (
+                self.pos < len(self.buffer)
+                and self.buffer[self.pos] in _WHITESPACE
+            ):
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not await self.fill():
+                return ""
+
+    async def expect(self, char: str):
+        if await self.peek() != char:
+            raise self.error(f"Expecting '{char}'")
+        self.pos += 1
+
+    async def value(self) -> Any:
+        await self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # A number or literal reaching the end of the buffer may
+                # continue in the next chunk, also after a parsed prefix
+                # such as "12" of "12.5" or "1" of "1e5"
+                tail = end
+                while (
+                    tail < len(self.buffer)
+                    and self.buffer[tail] in _NUMBER_CHARS
+                ):
+                    tail += 1
+                if (
+                    tail < len(self.buffer)
+                    or self.eof
+                    or self.buffer[end - 1] in '"]}'
+                ):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            pending = len(self.buffer) - self.pos
+            if pending > self.max_value_bytes:
+                raise self.error(
+                    f"JSON value exceeds {self.max_value_bytes} bytes"
+                )
+            await self.fill(pending)
+
+
+async def iter_json_array_items(
+    read: ReadFn,
+    array_key: str,
+    on_field: FieldFn,
+    chunk_size: int = 65536,
+    max_value_bytes: int = 16_000_000,
+) -> AsyncIterator[Any]:
+    """
+    Yield the items of one array field of a top-level JSON object as they
+    are parsed, without loading the whole document.
+
+    :param read: Async read(size) returning bytes, b"" at the end
+    :param array_key: Key of the array to stream
+    :param on_field: Called with every other top-level key and its value
+    :param chunk_size: Bytes to read at a time
+    :param max_value_bytes: Largest single value accepted
+    """
+    reader = _JSONStreamReader(read, chunk_size, max_value_bytes)
+    await reader.expect("{")
+    if await reader.peek() == "}":
+        reader.pos += 1
+    else:
+        while True:
+            key = await reader.value()
+            if not isinstance(key, str):
+                raise reader.error("Expecting property name")
+            await reader.expect(":")
+            if key == array_key and await reader.peek() == "[":
+                reader.pos += 1
+                if await reader.peek() == "]":
+                    reader.pos += 1
+                else:
+                    while True:
+                        yield await reader.value()
+                        separator = await reader.peek()
+                        reader.pos += 1
+                        if separator == "]":
+                            break
+                        if separator != ",":
+                            raise reader.error("Expecting ',' delimiter")
+            else:
+                on_field(key, await reader.value())
+            separator = await reader.peek()
+            reader.pos += 1
+            if separator == "}":
+                break
+            if separator != ",":
+                raise reader.error("Expecting ',' delimiter")
+    if await reader.peek():
+        raise reader.error("Extra data")
+
+
+async def iter_ndjson_lines(
+    read: ReadFn, chunk_size: int = 65536
+) -> AsyncIterator[Dict]:
+    """
+    Yield one decoded JSON value per non-empty line.
+
+    :param read: Async read(size) returning bytes, b"" at the end
+    :param chunk_size: Bytes to read at a time
+    """
+    pending = b""
+    line_number = 0
+    while True:
+        chunk = await read(chunk_size)
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop() if chunk else b""
+        for line in lines:
+            line_number += 1
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(
+                        f"line {line_number}: {e.msg}", e.doc, e.pos
+                    )
+        if not chunk:
+            return
@@ -5,9 +5,26 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from system.src.app.config.database import mongodb_database
+from system.src.app.config.http_client import http_client_registry
+from system.src.app.config.providers import app_providers
+from system.src.app.services.dataset_index_replica import (
+    dataset_index_replica,
+)
+from system.src.app.services.matryoshka_retrieval import (
+    matryoshka_retrieval,
+)
+from system.src.app.services.sparse_encoding_executor import (
+    sparse_encoding_executor,
+)
+from system.src.app.services.vector_store_registry import (
+    vector_store_registry,
+)
 from system.src.app.routes import (
     generate_drafts_route,
+    ingestion_job_route,
     insert_data_route,
+    metrics_route,
+    reembed_migration_route,
     request_logs_route,
     websocket_route,
 )
@@ -16,9 +33,24 @@ from system.src.app.routes import (
 @asynccontextmanager
 async def db_lifespan(app: FastAPI):
     mongodb_database.connect()
+    http_client_registry.connect()
+    app_providers.build()
+    await app_providers.warm_up()
+    dataset_index_replica.start(app_providers.pinecone_service)
+    await app_providers.reembed_migration_usecase.resume_active()
+    await app_providers.ingestion_job_usecase.resume_interrupted()
 
     yield
 
+    # Background tasks still use the HTTP clients and MongoDB
+    await app_providers.ingestion_job_usecase.shutdown()
+    await app_providers.reembed_migration_usecase.shutdown()
+    await app_providers.pinecone_query_usecase.shutdown()
+    await dataset_index_replica.stop()
+    await vector_store_registry.flush()
+    await matryoshka_retrieval.flush()
+    sparse_encoding_executor.shutdown()
+    await http_client_registry.disconnect()
     mongodb_database.disconnect()
 
 
@@ -35,6 +67,9 @@ app.add_middleware(
 app.include_router(
     insert_data_route.router, prefix="/api/v1", tags=["Insert Data"]
 )
+app.include_router(
+    ingestion_job_route.router, prefix="/api/v1", tags=["Insert Data"]
+)
 app.include_router(
     generate_drafts_route.router, prefix="/api/v1", tags=["Generate Drafts"]
 )
@@ -42,6 +77,12 @@ app.include_router(
     request_logs_route.router, prefix="/api/v1", tags=["Request Logs"]
 )
 app.include_router(websocket_route.router, prefix="/api/v1", tags=["WebSocket"])
+app.include_router(metrics_route.router, prefix="/api/v1", tags=["Metrics"])
+app.include_router(
+    reembed_migration_route.router,
+    prefix="/api/v1",
+    tags=["Re-embedding Migration"],
+)
 
 
 @app.get("/")